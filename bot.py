@@ -1,48 +1,93 @@
 from discord.ext import commands, tasks
 import asyncio
-import json
+import orjson
 import os
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 import sqlite3
+import threading
+import time
+import weakref
 import yt_dlp
 import spotipy
 from spotipy.oauth2 import SpotifyClientCredentials
 import concurrent.futures
 import discord
 
-from config import get_intents
+from config import (
+    get_intents,
+    YTDLP_CONCURRENT_FRAGS,
+    MAX_CACHE_SIZE,
+    CACHE_TTL,
+    SEARCH_CACHE_SIZE,
+    SEARCH_CACHE_TTL,
+    MAX_HISTORY_SIZE,
+    INACTIVE_TIMEOUT_MINUTES,
+    DATABASE_PATH,
+    SAVE_DEBOUNCE_SECONDS,
+    COLOR,
+)
 from models.song import Song
+from models.guild_state import GuildState
+from services.music_service import MusicService
+from services.playback_service import PlaybackService
+from utils.cache import TTLCache
+from utils.helpers import create_embed
 
 logger = logging.getLogger(__name__)
 
+SAVE_QUEUE_QUERY = """
+    INSERT INTO guild_settings (guild_id, queue_data, music_channel_id)
+    VALUES (?, ?, ?)
+    ON CONFLICT(guild_id) DO UPDATE SET
+        queue_data = excluded.queue_data,
+        music_channel_id = excluded.music_channel_id
+"""
+
 
 class MusicBot(commands.Bot):
     def __init__(self):
         super().__init__(command_prefix="!", intents=get_intents(), help_command=None)
 
-        self.message_update_locks = {}
-        self.message_validation_cache = {}
+        self.message_update_locks = weakref.WeakValueDictionary()
+        self.message_validation_cache = TTLCache(maxsize=MAX_CACHE_SIZE, ttl=60.0)
         self.last_update_times = {}
         self.loop = None
 
+        self._db_conn = None
+        self._db_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlite-writer"
+        )
+        self._db_read_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="sqlite-reader"
+        )
+        self._db_read_tls = threading.local()
+        self._db_read_conns = []
+        self._db_read_conns_lock = threading.Lock()
         self.init_database()
         self.guilds_data = {}
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
 
-        self.song_cache = {}
-        self.max_cache_size = 500
-        self.cache_ttl = 3600
+        self.max_cache_size = MAX_CACHE_SIZE
+        self.cache_ttl = CACHE_TTL
+        self.song_cache = TTLCache(maxsize=self.max_cache_size, ttl=self.cache_ttl)
+        self.search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
 
-        self.db_save_tasks = {}
+        self._dirty_guilds = set()
+        self._dirty_event = asyncio.Event()
+        self._writer_task = None
+        self._background_tasks = set()
+        self._maintenance_tick = 0
+
+        self.music_service = MusicService(self)
+        self.playback_service = PlaybackService(self)
 
         self.ytdl_format_options = {
             "format": "bestaudio[ext=m4a]/bestaudio[abr<=128]/bestaudio/best",
             "outtmpl": "%(extractor)s-%(id)s-%(title)s.%(ext)s",
             "restrictfilenames": True,
             "noplaylist": False,
-            "extract_flat": True,
+            "extract_flat": "in_playlist",
             "nocheckcertificate": True,
             "ignoreerrors": True,
             "logtostderr": False,
@@ -55,7 +100,7 @@ class MusicBot(commands.Bot):
             "fragment_retries": 15,
             "skip_unavailable_fragments": True,
             "keep_fragments": False,
-            "concurrent_fragment_downloads": 1,
+            "concurrent_fragment_downloads": YTDLP_CONCURRENT_FRAGS,
             "extractor_retries": 10,
             "file_access_retries": 10,
             "socket_timeout": 60,
@@ -87,14 +132,14 @@ class MusicBot(commands.Bot):
                 "-reconnect_delay_max 5 "
                 "-reconnect_on_network_error 1 "
                 "-reconnect_on_http_error 5xx "
+                "-probesize 64k "
+                "-analyzeduration 500000 "
                 "-nostdin "
                 "-user_agent 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:133.0) Gecko/20100101 Firefox/133.0'"
             ),
             "options": (
                 "-vn "
                 "-bufsize 512k "
-                "-probesize 10M "
-                "-analyzeduration 10M "
                 "-fflags +discardcorrupt "
                 "-flags +low_delay"
             ),
@@ -103,7 +148,7 @@ class MusicBot(commands.Bot):
         self.voice_reconnect_enabled = True
         self.voice_reconnect_delay = 2
 
-        self.ytdl = yt_dlp.YoutubeDL(self.ytdl_format_options)
+        self._ytdl_tls = threading.local()
 
         try:
             spotify_client_id = os.getenv("SPOTIFY_CLIENT_ID")
@@ -123,12 +168,26 @@ class MusicBot(commands.Bot):
             self.spotify = None
             logger.warning(f"Spotify setup failed: {e}")
 
-    @staticmethod
-    def init_database():
+    @property
+    def ytdl(self) -> yt_dlp.YoutubeDL:
+        # YoutubeDL is not safe to share between executor threads, so each keeps its own
+        ytdl = getattr(self._ytdl_tls, "ytdl", None)
+        if ytdl is None:
+            ytdl = yt_dlp.YoutubeDL(self.ytdl_format_options)
+            self._ytdl_tls.ytdl = ytdl
+        return ytdl
+
+    def init_database(self):
         try:
-            conn = sqlite3.connect("music_bot.db", check_same_thread=False)
+            conn = sqlite3.connect(
+                DATABASE_PATH, check_same_thread=False, isolation_level=None
+            )
             cursor = conn.cursor()
 
+            # journal_mode is stored in the database file; the rest is per connection
+            cursor.execute("PRAGMA journal_mode=WAL")
+            self._configure_db_connection(conn)
+
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS playlists (
@@ -142,6 +201,13 @@ class MusicBot(commands.Bot):
             """
             )
 
+            # Every playlist command looks rows up by (user_id, guild_id, name) through this index
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_playlists_owner_name'"
+            )
+            if not cursor.fetchone():
+                self._migrate_playlist_owner_name_index(cursor)
+
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS guild_settings (
@@ -154,8 +220,18 @@ class MusicBot(commands.Bot):
             """
             )
 
-            conn.commit()
-            conn.close()
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS history (
+                    guild_id INTEGER NOT NULL,
+                    pos INTEGER NOT NULL,
+                    song_json TEXT NOT NULL,
+                    PRIMARY KEY (guild_id, pos)
+                )
+            """
+            )
+
+            self._db_conn = conn
             logger.info("Database initialized successfully")
 
         except Exception as e:
@@ -163,78 +239,153 @@ class MusicBot(commands.Bot):
             raise
 
     @staticmethod
-    def get_db_connection():
-        return sqlite3.connect("music_bot.db", check_same_thread=False)
+    def _migrate_playlist_owner_name_index(cursor):
+        # Older databases could hold same-named playlists; rename the newer copies so no songs are lost
+        cursor.execute("BEGIN")
+        try:
+            cursor.execute(
+                """
+                SELECT id, user_id, guild_id, name
+                FROM playlists
+                WHERE (user_id, guild_id, name) IN (
+                    SELECT user_id, guild_id, name
+                    FROM playlists
+                    GROUP BY user_id, guild_id, name
+                    HAVING COUNT(*) > 1
+                )
+                ORDER BY user_id, guild_id, name, id
+            """
+            )
+            duplicates = cursor.fetchall()
+
+            renamed = 0
+            seen_groups = set()
+            for playlist_id, user_id, guild_id, name in duplicates:
+                group = (user_id, guild_id, name)
+                if group not in seen_groups:
+                    # The oldest playlist keeps its name
+                    seen_groups.add(group)
+                    continue
+
+                suffix = 2
+                while True:
+                    new_name = f"{name} ({suffix})"
+                    cursor.execute(
+                        "SELECT 1 FROM playlists WHERE user_id = ? AND guild_id = ? AND name = ?",
+                        (user_id, guild_id, new_name),
+                    )
+                    if not cursor.fetchone():
+                        break
+                    suffix += 1
+
+                cursor.execute(
+                    "UPDATE playlists SET name = ? WHERE id = ?", (new_name, playlist_id)
+                )
+                renamed += 1
+
+            cursor.execute(
+                """
+                CREATE UNIQUE INDEX idx_playlists_owner_name
+                ON playlists (user_id, guild_id, name)
+            """
+            )
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+        if renamed:
+            logger.warning(f"Renamed {renamed} duplicate playlist(s) while adding the playlist name index")
+        logger.info("Created playlist name index")
+
+    @staticmethod
+    def _configure_db_connection(conn):
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+
+    def _get_read_connection(self):
+        # WAL lets readers run alongside the writer, so each reader thread keeps its own connection
+        conn = getattr(self._db_read_tls, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False, isolation_level=None)
+            self._configure_db_connection(conn)
+            self._db_read_tls.conn = conn
+            with self._db_read_conns_lock:
+                self._db_read_conns.append(conn)
+        return conn
 
     async def execute_db_query(self, query: str, params: tuple = None):
         def _execute():
-            with self.get_db_connection() as conn:
-                cursor = conn.cursor()
-                if params:
-                    cursor.execute(query, params)
-                else:
-                    cursor.execute(query)
-                conn.commit()
-                return cursor.fetchall()
+            cursor = self._db_conn.cursor()
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            return cursor.fetchall()
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _execute)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, _execute)
 
     async def fetch_db_query(self, query: str, params: tuple = None):
         def _fetch():
-            with self.get_db_connection() as conn:
-                cursor = conn.cursor()
-                if params:
-                    cursor.execute(query, params)
-                else:
-                    cursor.execute(query)
-                return cursor.fetchall()
+            cursor = self._get_read_connection().cursor()
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            return cursor.fetchall()
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _fetch)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_read_executor, _fetch)
 
-    def get_guild_data(self, guild_id: int) -> Dict:
+    async def execute_db_batch(self, batches: list):
+        def _execute_batch():
+            cursor = self._db_conn.cursor()
+            cursor.execute("BEGIN")
+            try:
+                for query, rows in batches:
+                    if rows:
+                        cursor.executemany(query, rows)
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, _execute_batch)
+
+    def get_guild_data(self, guild_id: int) -> GuildState:
         if guild_id not in self.guilds_data:
-            self.guilds_data[guild_id] = {
-                "guild_id": guild_id,
-                "queue": [],
-                "loop_backup": [],
-                "history": [],
-                "history_position": 0,
-                "current": None,
-                "position": 0,
-                "seek_offset": 0,
-                "loop_mode": "off",
-                "shuffle": False,
-                "volume": 100,
-                "voice_client": None,
-                "intentional_disconnect": False,
-                "last_activity": datetime.now(),
-                "now_playing_message": None,
-                "music_channel_id": None,
-                "start_time": None,
-                "message_ready_for_timestamps": False,
-                "message_last_validated": 0,
-                "seeking": False,
-                "pause_position": None,
-                "play_lock": asyncio.Lock(),
-            }
+            self.guilds_data[guild_id] = GuildState(guild_id=guild_id)
         return self.guilds_data[guild_id]
 
     async def save_guild_music_channel(self, guild_id: int, channel_id: int):
         try:
             await self.execute_db_query(
                 """
-                INSERT OR REPLACE INTO guild_settings (guild_id, music_channel_id)
+                INSERT INTO guild_settings (guild_id, music_channel_id)
                 VALUES (?, ?)
+                ON CONFLICT(guild_id) DO UPDATE SET music_channel_id = excluded.music_channel_id
             """,
                 (guild_id, channel_id),
             )
         except Exception as e:
             logger.error(f"Failed to save music channel: {e}")
 
+    def create_background_task(self, coro) -> asyncio.Task:
+        # The loop only keeps weak references to tasks, so hold one until it finishes
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def schedule_save_guild_music_channel(self, guild_id: int, channel_id: int):
+        self.create_background_task(self.save_guild_music_channel(guild_id, channel_id))
+
     async def setup_hook(self):
-        pass
+        self._writer_task = asyncio.create_task(self._db_writer_loop())
 
     async def on_ready(self):
         logger.info(f"{self.user} has connected to Discord!")
@@ -248,12 +399,8 @@ class MusicBot(commands.Bot):
         except Exception as e:
             logger.error(f"Failed to sync commands: {e}")
 
-        self.cleanup_inactive.start()
-        self.cleanup_cache.start()
-        self.cleanup_inactive_guilds.start()
-        self.update_now_playing_timestamps.start()
-        self.cleanup_validation_cache.start()
-        self.check_voice_health.start()
+        if not self.maintenance.is_running():
+            self.maintenance.start()
         await self.load_persistent_queues()
 
     async def on_voice_state_update(self, member, before, after):
@@ -267,7 +414,7 @@ class MusicBot(commands.Bot):
             logger.info(f"Bot reconnected to voice in guild {guild_id} (auto-reconnect)")
             guild = self.get_guild(guild_id)
             if guild and guild.voice_client:
-                guild_data["voice_client"] = guild.voice_client
+                guild_data.voice_client = guild.voice_client
 
                 await asyncio.sleep(1)
                 await self._resume_playback_after_reconnect(guild_id)
@@ -275,22 +422,23 @@ class MusicBot(commands.Bot):
 
         if before.channel and not after.channel:
             logger.warning(f"Bot disconnected from voice in guild {guild_id}")
+            self.playback_service.stop_timestamp_updates(guild_id)
 
-            had_current_song = guild_data.get("current") is not None
-            had_queue = len(guild_data.get("queue", [])) > 0
+            had_current_song = guild_data.current is not None
+            had_queue = len(guild_data.queue) > 0
             voice_channel = before.channel
 
-            if guild_data["voice_client"]:
-                guild_data["voice_client"] = None
+            if guild_data.voice_client:
+                guild_data.voice_client = None
 
-            if guild_data.get("intentional_disconnect", False):
+            if guild_data.intentional_disconnect:
                 logger.info(f"Intentional disconnect for guild {guild_id}, skipping reconnect")
-                guild_data["intentional_disconnect"] = False
-                guild_data["current"] = None
-                guild_data["start_time"] = None
-                guild_data["history_position"] = len(guild_data["history"])
-                guild_data["queue"].clear()
-                guild_data["loop_backup"].clear()
+                guild_data.intentional_disconnect = False
+                guild_data.current = None
+                guild_data.start_time = None
+                guild_data.history_position = len(guild_data.history)
+                guild_data.queue.clear()
+                guild_data.loop_backup.clear()
                 await self.clear_guild_queue_from_db(guild_id)
                 return
 
@@ -298,11 +446,11 @@ class MusicBot(commands.Bot):
                 logger.info(f"Attempting voice reconnection for guild {guild_id}...")
                 asyncio.create_task(self._attempt_voice_reconnect(guild_id, voice_channel))
             else:
-                guild_data["current"] = None
-                guild_data["start_time"] = None
-                guild_data["history_position"] = len(guild_data["history"])
-                guild_data["queue"].clear()
-                guild_data["loop_backup"].clear()
+                guild_data.current = None
+                guild_data.start_time = None
+                guild_data.history_position = len(guild_data.history)
+                guild_data.queue.clear()
+                guild_data.loop_backup.clear()
                 await self.clear_guild_queue_from_db(guild_id)
 
     async def _attempt_voice_reconnect(self, guild_id: int, voice_channel):
@@ -314,19 +462,19 @@ class MusicBot(commands.Bot):
             guild = self.get_guild(guild_id)
             if guild and guild.voice_client and guild.voice_client.is_connected():
                 logger.info(f"Discord auto-reconnected to guild {guild_id}")
-                guild_data["voice_client"] = guild.voice_client
+                guild_data.voice_client = guild.voice_client
 
                 await self._resume_playback_after_reconnect(guild_id)
                 return
 
-            if guild_data["voice_client"] and guild_data["voice_client"].is_connected():
+            if guild_data.voice_client and guild_data.voice_client.is_connected():
                 logger.info(f"Already reconnected to guild {guild_id}")
                 await self._resume_playback_after_reconnect(guild_id)
                 return
 
             logger.info(f"Reconnecting to voice channel in guild {guild_id}...")
             voice_client = await voice_channel.connect(timeout=10.0, reconnect=True)
-            guild_data["voice_client"] = voice_client
+            guild_data.voice_client = voice_client
 
             logger.info(f"Successfully reconnected to voice in guild {guild_id}")
 
@@ -338,7 +486,7 @@ class MusicBot(commands.Bot):
 
                 guild = self.get_guild(guild_id)
                 if guild and guild.voice_client:
-                    guild_data["voice_client"] = guild.voice_client
+                    guild_data.voice_client = guild.voice_client
                     await self._resume_playback_after_reconnect(guild_id)
             else:
                 logger.error(f"Client exception during reconnect for guild {guild_id}: {e}")
@@ -354,21 +502,18 @@ class MusicBot(commands.Bot):
         guild_data = self.get_guild_data(guild_id)
 
         try:
-            from services.playback_service import PlaybackService
-            playback_service = PlaybackService(self)
-
-            if guild_data.get("current"):
-                current_song = guild_data["current"]
+            if guild_data.current:
+                current_song = guild_data.current
                 logger.info(f"Resuming playback of: {current_song.title}")
 
-                guild_data["current"] = None
+                guild_data.current = None
 
-                guild_data["queue"].insert(0, current_song)
+                guild_data.queue.insert(0, current_song)
 
-                await playback_service.play_next(guild_id)
-            elif guild_data.get("queue"):
+                await self.playback_service.play_next(guild_id)
+            elif guild_data.queue:
                 logger.info(f"Starting queue playback after reconnect")
-                await playback_service.play_next(guild_id)
+                await self.playback_service.play_next(guild_id)
         except Exception as e:
             logger.error(f"Error resuming playback after reconnect: {e}")
 
@@ -377,16 +522,14 @@ class MusicBot(commands.Bot):
 
         logger.info(f"Cleaning up after failed reconnect for guild {guild_id}")
 
-        guild_data["current"] = None
-        guild_data["start_time"] = None
-        guild_data["voice_client"] = None
+        guild_data.current = None
+        guild_data.start_time = None
+        guild_data.voice_client = None
 
         try:
-            from config import COLOR
-            from utils.helpers import create_embed
             music_cog = self.get_cog("MusicCommands")
-            if music_cog and guild_data.get("music_channel_id"):
-                channel = self.get_channel(guild_data["music_channel_id"])
+            if music_cog and guild_data.music_channel_id:
+                channel = self.get_channel(guild_data.music_channel_id)
                 if channel:
                     embed = create_embed(
                         "Voice Connection Lost",
@@ -398,46 +541,51 @@ class MusicBot(commands.Bot):
         except Exception as e:
             logger.error(f"Error sending disconnect notification: {e}")
 
-    @tasks.loop(minutes=5)
-    async def cleanup_inactive(self):
-        try:
-            for guild_id, data in list(self.guilds_data.items()):
-                if data["voice_client"] and data["voice_client"].is_connected():
-                    inactive_time = datetime.now() - data["last_activity"]
-
-                    is_truly_inactive = (
-                            not data["voice_client"].is_playing()
-                            and not data["voice_client"].is_paused()
-                            and not data.get("current")
-                    )
+    @tasks.loop(seconds=30)
+    async def maintenance(self):
+        tick = self._maintenance_tick
+        self._maintenance_tick += 1
 
-                    if inactive_time > timedelta(minutes=5) and is_truly_inactive:
-                        await data["voice_client"].disconnect()
-                        data["voice_client"] = None
-                        logger.info(f"Disconnected from inactive guild: {guild_id}")
-        except Exception as e:
-            logger.error(f"Cleanup task error: {e}")
+        # 30s cadence drives voice health; inactivity every 5 min, guilds hourly
+        await self._check_guild_voice(check_inactive=tick % 10 == 0)
 
-    @tasks.loop(minutes=10)
-    async def cleanup_cache(self):
-        try:
-            current_time = asyncio.get_event_loop().time()
-            expired_keys = [
-                key
-                for key, value in self.song_cache.items()
-                if current_time - value["cached_at"] > self.cache_ttl
-            ]
-
-            for key in expired_keys:
-                del self.song_cache[key]
-
-            if expired_keys:
-                logger.info(f"Cleaned {len(expired_keys)} expired cache entries")
-        except Exception as e:
-            logger.error(f"Cache cleanup error: {e}")
+        if tick % 120 == 0:
+            await self._cleanup_inactive_guilds()
+
+    async def _check_guild_voice(self, check_inactive: bool):
+        for guild_id, guild_data in list(self.guilds_data.items()):
+            try:
+                voice_client = guild_data.voice_client
+
+                if not voice_client:
+                    continue
+
+                if voice_client.is_connected():
+                    has_current = guild_data.current is not None
+                    is_playing = voice_client.is_playing()
+                    is_paused = voice_client.is_paused()
 
-    @tasks.loop(hours=1)
-    async def cleanup_inactive_guilds(self):
+                    if has_current and not is_playing and not is_paused:
+                        logger.warning(f"Detected stalled playback in guild {guild_id}")
+
+                        guild_data.current = None
+                        await self.playback_service.play_next(guild_id)
+                    elif check_inactive and not has_current and not is_playing and not is_paused:
+                        inactive_time = time.monotonic() - guild_data.last_activity
+
+                        if inactive_time > INACTIVE_TIMEOUT_MINUTES * 60:
+                            await voice_client.disconnect()
+                            guild_data.voice_client = None
+                            logger.info(f"Disconnected from inactive guild: {guild_id}")
+                else:
+                    if guild_data.current or guild_data.queue:
+                        logger.warning(f"Voice client disconnected but has active state in guild {guild_id}")
+                        guild_data.voice_client = None
+
+            except Exception as e:
+                logger.error(f"Voice health check error for guild {guild_id}: {e}")
+
+    async def _cleanup_inactive_guilds(self):
         try:
             current_guild_ids = {guild.id for guild in self.guilds}
             inactive_guilds = []
@@ -446,235 +594,291 @@ class MusicBot(commands.Bot):
                 if guild_id not in current_guild_ids:
                     inactive_guilds.append(guild_id)
                     del self.guilds_data[guild_id]
+                    self._dirty_guilds.discard(guild_id)
 
             if inactive_guilds:
+                # A recreated state counts history positions from 0 again, so its stored
+                # rows must go with it or they would shadow the new ones
+                await self.execute_db_batch(
+                    [
+                        (
+                            "DELETE FROM history WHERE guild_id = ?",
+                            [(guild_id,) for guild_id in inactive_guilds],
+                        ),
+                    ]
+                )
                 logger.info(
                     f"Cleaned up data for {len(inactive_guilds)} inactive guilds"
                 )
         except Exception as e:
             logger.error(f"Guild cleanup error: {e}")
 
-    @tasks.loop(seconds=1)
-    async def update_now_playing_timestamps(self):
-        from services.playback_service import PlaybackService
-        playback_service = PlaybackService(self)
-        await playback_service.update_timestamps_task()
-
-    @tasks.loop(minutes=5)
-    async def cleanup_validation_cache(self):
-        try:
-            current_time = asyncio.get_event_loop().time()
-            expired_keys = [
-                key
-                for key, value in self.message_validation_cache.items()
-                if current_time - value["time"] > 60.0
-            ]
-
-            for key in expired_keys:
-                del self.message_validation_cache[key]
-
-            if expired_keys:
-                logger.debug(f"Cleaned {len(expired_keys)} validation cache entries")
-        except Exception as e:
-            logger.error(f"Validation cache cleanup error: {e}")
-
-    @tasks.loop(seconds=30)
-    async def check_voice_health(self):
+    async def load_persistent_queues(self):
         try:
-            for guild_id, guild_data in list(self.guilds_data.items()):
-                voice_client = guild_data.get("voice_client")
+            guild_ids = tuple(guild.id for guild in self.guilds)
+            if not guild_ids:
+                return
 
-                if not voice_client:
-                    continue
+            placeholders = ",".join("?" * len(guild_ids))
+            history_rows = await self.fetch_db_query(
+                f"SELECT guild_id, pos, song_json FROM history WHERE guild_id IN ({placeholders}) ORDER BY guild_id, pos",
+                guild_ids,
+            )
+            results = await self.fetch_db_query(
+                f"SELECT guild_id, queue_data, music_channel_id FROM guild_settings WHERE guild_id IN ({placeholders}) "
+                f"AND (queue_data IS NOT NULL OR music_channel_id IS NOT NULL)",
+                guild_ids,
+            )
 
-                if voice_client.is_connected():
+            loop = asyncio.get_running_loop()
+            stored_history, stored_queues = await loop.run_in_executor(
+                self._db_read_executor, self._decode_persistent_rows, history_rows, results
+            )
 
-                    has_current = guild_data.get("current") is not None
-                    is_playing = voice_client.is_playing()
-                    is_paused = voice_client.is_paused()
+            for guild_id, entries in stored_history.items():
+                guild_data = self.get_guild_data(guild_id)
+                guild_data.history = [song for _, song in entries]
+                guild_data.history_seq = entries[-1][0] + 1
+                guild_data.history_saved_seq = guild_data.history_seq
+                guild_data.history_position = len(guild_data.history)
 
-                    if has_current and not is_playing and not is_paused:
-                        logger.warning(f"Detected stalled playback in guild {guild_id}")
+            for guild_id, music_channel_id, data in stored_queues:
+                guild_data = self.get_guild_data(guild_id)
 
-                        from services.playback_service import PlaybackService
-                        playback_service = PlaybackService(self)
+                if music_channel_id:
+                    guild_data.music_channel_id = music_channel_id
 
-                        guild_data["current"] = None
-                        await playback_service.play_next(guild_id)
-                else:
-                    if guild_data.get("current") or guild_data.get("queue"):
-                        logger.warning(f"Voice client disconnected but has active state in guild {guild_id}")
-                        guild_data["voice_client"] = None
+                if not data:
+                    continue
 
-        except Exception as e:
-            logger.error(f"Voice health check error: {e}")
+                guild_data.queue = data["queue"]
+                guild_data.loop_backup = data["loop_backup"]
 
-    async def load_persistent_queues(self):
-        try:
-            results = await self.fetch_db_query(
-                "SELECT guild_id, queue_data, music_channel_id FROM guild_settings WHERE queue_data IS NOT NULL OR music_channel_id IS NOT NULL"
-            )
+                if guild_id not in stored_history and data["history"]:
+                    # Queue blobs written before the history table existed
+                    guild_data.history = data["history"]
+                    guild_data.history_seq = len(guild_data.history)
 
-            for guild_id, queue_data, music_channel_id in results:
-                guild_data = self.get_guild_data(guild_id)
+                guild_data.history_position = min(
+                    data.get("history_position", len(guild_data.history)),
+                    len(guild_data.history),
+                )
 
-                if music_channel_id:
-                    guild_data["music_channel_id"] = music_channel_id
-
-                if queue_data:
-                    try:
-                        data = json.loads(queue_data)
-                        guild_data["queue"] = [
-                            Song.from_dict(song_data)
-                            for song_data in data.get("queue", [])
-                        ]
-                        guild_data["loop_backup"] = [
-                            Song.from_dict(song_data)
-                            for song_data in data.get("loop_backup", [])
-                        ]
-
-                        history_data = data.get("history", [])
-
-                        guild_data["history"] = [
-                            Song.from_dict(song_data) for song_data in history_data
-                        ]
-                        guild_data["history_position"] = data.get(
-                            "history_position", len(guild_data["history"])
-                        )
-
-                        guild_data["loop_mode"] = data.get("loop_mode", "off")
-                        guild_data["shuffle"] = data.get("shuffle", False)
-                        guild_data["volume"] = data.get("volume", 100)
-                    except json.JSONDecodeError:
-                        continue
+                guild_data.loop_mode = data.get("loop_mode", "off")
+                guild_data.shuffle = data.get("shuffle", False)
+                guild_data.volume = data.get("volume", 100)
 
             logger.info("Persistent data loaded")
         except Exception as e:
             logger.error(f"Failed to load persistent data: {e}")
 
-    async def save_guild_queue(self, guild_id: int):
-        if guild_id in self.db_save_tasks:
-            self.db_save_tasks[guild_id].cancel()
+    @staticmethod
+    def _decode_persistent_rows(history_rows: list, queue_rows: list) -> tuple:
+        stored_history = {}
+        for guild_id, pos, song_json in history_rows:
+            try:
+                stored_history.setdefault(guild_id, []).append(
+                    (pos, Song.from_dict(orjson.loads(song_json)))
+                )
+            except orjson.JSONDecodeError:
+                continue
 
-        self.db_save_tasks[guild_id] = asyncio.create_task(
-            self._delayed_save_guild_queue(guild_id)
-        )
+        for guild_id, entries in stored_history.items():
+            stored_history[guild_id] = entries[-MAX_HISTORY_SIZE:]
+
+        stored_queues = []
+        for guild_id, queue_data, music_channel_id in queue_rows:
+            data = None
+            if queue_data:
+                try:
+                    data = orjson.loads(queue_data)
+                    for key in ("queue", "loop_backup", "history"):
+                        data[key] = [Song.from_dict(song_data) for song_data in data.get(key, [])]
+                except orjson.JSONDecodeError:
+                    data = None
+
+            stored_queues.append((guild_id, music_channel_id, data))
+
+        return stored_history, stored_queues
+
+    def schedule_save_guild_queue(self, guild_id: int):
+        self._dirty_guilds.add(guild_id)
+        self._dirty_event.set()
 
-    async def _delayed_save_guild_queue(self, guild_id: int):
-        await asyncio.sleep(1)
+    async def _db_writer_loop(self):
+        while True:
+            await self._dirty_event.wait()
+            await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+            self._dirty_event.clear()
+
+            try:
+                await self.flush_dirty_guilds()
+            except Exception as e:
+                logger.error(f"Failed to save guild queues: {e}")
+
+    async def flush_dirty_guilds(self):
+        if not self._dirty_guilds:
+            return
+
+        guild_ids = self._dirty_guilds
+        self._dirty_guilds = set()
 
         try:
+            await self._save_guild_queues(guild_ids)
+        except BaseException:
+            # Keep the failed guilds dirty and wake the writer so the next flush retries them;
+            # this also covers close() cancelling the writer mid-flush before its final save
+            self._dirty_guilds |= guild_ids
+            self._dirty_event.set()
+            raise
+
+    async def _save_guild_queues(self, guild_ids):
+        batches = [
+            (
+                SAVE_QUEUE_QUERY,
+                [self._build_queue_row(guild_id) for guild_id in guild_ids],
+            )
+        ]
+        saved_seqs = {}
+        for guild_id in guild_ids:
+            history_batches, saved_seqs[guild_id] = self._build_history_batches(guild_id)
+            batches.extend(history_batches)
+
+        await self.execute_db_batch(batches)
+        self._mark_history_saved(saved_seqs)
+
+    def _mark_history_saved(self, saved_seqs: dict):
+        # Only advance once the rows are committed, so a rolled-back batch is retried next flush
+        for guild_id, saved_seq in saved_seqs.items():
             guild_data = self.get_guild_data(guild_id)
+            guild_data.history_saved_seq = max(guild_data.history_saved_seq, saved_seq)
 
-            queue_data = {
-                "queue": [song.to_dict() for song in guild_data["queue"]],
-                "loop_backup": [song.to_dict() for song in guild_data["loop_backup"]],
-                "history": [song.to_dict() for song in guild_data["history"]],
-                "history_position": guild_data.get(
-                    "history_position", len(guild_data["history"])
-                ),
-                "loop_mode": guild_data["loop_mode"],
-                "shuffle": guild_data["shuffle"],
-                "volume": guild_data["volume"],
-            }
+    def _build_queue_row(self, guild_id: int) -> tuple:
+        guild_data = self.get_guild_data(guild_id)
 
-            await self.execute_db_query(
-                """
-                INSERT OR REPLACE INTO guild_settings (guild_id, queue_data, music_channel_id)
-                VALUES (?, ?, ?)
-            """,
-                (guild_id, json.dumps(queue_data), guild_data.get("music_channel_id")),
+        settings = {
+            "history_position": guild_data.history_position,
+            "loop_mode": guild_data.loop_mode,
+            "shuffle": guild_data.shuffle,
+            "volume": guild_data.volume,
+        }
+
+        # Songs memoize their own JSON, so only the settings tail is encoded here
+        queue_data = b"".join(
+            (
+                b'{"queue":[',
+                b",".join(song.to_json() for song in guild_data.queue),
+                b'],"loop_backup":[',
+                b",".join(song.to_json() for song in guild_data.loop_backup),
+                b"],",
+                orjson.dumps(settings)[1:],
             )
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to save guild queue: {e}")
-        finally:
-            if guild_id in self.db_save_tasks:
-                del self.db_save_tasks[guild_id]
+        return guild_id, queue_data, guild_data.music_channel_id
+
+    def _build_history_batches(self, guild_id: int) -> Tuple[list, int]:
+        guild_data = self.get_guild_data(guild_id)
+        history = guild_data.history
+
+        # history only keeps the newest songs, so its first entry sits at
+        # absolute position history_seq - len(history)
+        first_pos = guild_data.history_seq - len(history)
+        saved_pos = max(guild_data.history_saved_seq, first_pos)
+
+        new_rows = [
+            (guild_id, pos, song.to_json())
+            for pos, song in enumerate(history[saved_pos - first_pos:], start=saved_pos)
+        ]
+
+        return [
+            (
+                "INSERT OR IGNORE INTO history (guild_id, pos, song_json) VALUES (?, ?, ?)",
+                new_rows,
+            ),
+            (
+                "DELETE FROM history WHERE guild_id = ? AND pos < ?",
+                [(guild_id, first_pos)],
+            ),
+        ], guild_data.history_seq
 
     async def clear_guild_queue_from_db(self, guild_id: int):
         try:
-            guild_data = self.get_guild_data(guild_id)
-            
-            queue_data = {
-                "queue": [],
-                "loop_backup": [],
-                "history": [song.to_dict() for song in guild_data.get("history", [])],
-                "history_position": guild_data.get(
-                    "history_position", len(guild_data.get("history", []))
-                ),
-                "loop_mode": "off",
-                "shuffle": False,
-                "volume": guild_data.get("volume", 100),
-            }
-            
-            await self.execute_db_query(
-                """
-                INSERT OR REPLACE INTO guild_settings (guild_id, queue_data, music_channel_id)
-                VALUES (?, ?, ?)
-            """,
-                (guild_id, json.dumps(queue_data), guild_data.get("music_channel_id")),
+            history_batches, saved_seq = self._build_history_batches(guild_id)
+            await self.execute_db_batch(
+                [
+                    (
+                        "UPDATE guild_settings SET queue_data = NULL WHERE guild_id = ?",
+                        [(guild_id,)],
+                    ),
+                    *history_batches,
+                ]
             )
+            self._mark_history_saved({guild_id: saved_seq})
             logger.info(f"Cleared queue data from database for guild {guild_id} (history preserved)")
         except Exception as e:
             logger.error(f"Failed to clear guild queue from database: {e}")
 
     async def get_song_info_cached(self, url_or_query: str) -> Optional[Dict]:
-        from services.music_service import MusicService
-        music_service = MusicService(self)
-        return await music_service.get_song_info_cached(url_or_query)
+        return await self.music_service.get_song_info_cached(url_or_query)
 
     async def get_song_info(self, url_or_query: str) -> Optional[Dict]:
-        from services.music_service import MusicService
-        music_service = MusicService(self)
-        return await music_service.get_song_info(url_or_query)
+        return await self.music_service.get_song_info(url_or_query)
+
+    async def refresh_song_info(self, url_or_query: str) -> Optional[Dict]:
+        return await self.music_service.refresh_song_info(url_or_query)
+
+    async def create_audio_source(self, url: str, volume: float, ffmpeg_options: Dict = None):
+        options = ffmpeg_options or self.ffmpeg_options
+        loop = asyncio.get_running_loop()
+        # Spawning ffmpeg blocks for the fork/exec, so keep it off the event loop
+        audio = await loop.run_in_executor(None, lambda: discord.FFmpegPCMAudio(url, **options))
+        return discord.PCMVolumeTransformer(audio, volume=volume)
 
     async def close(self):
         logger.info("Shutting down bot...")
 
         logger.info("Saving all queues before shutdown...")
-        for guild_id in list(self.guilds_data.keys()):
-            try:
-                guild_data = self.get_guild_data(guild_id)
-                
-                if guild_data.get("queue") or guild_data.get("current") or guild_data.get("loop_backup"):
-                    queue_data = {
-                        "queue": [song.to_dict() for song in guild_data["queue"]],
-                        "loop_backup": [song.to_dict() for song in guild_data["loop_backup"]],
-                        "history": [song.to_dict() for song in guild_data["history"]],
-                        "history_position": guild_data.get(
-                            "history_position", len(guild_data["history"])
-                        ),
-                        "loop_mode": guild_data["loop_mode"],
-                        "shuffle": guild_data["shuffle"],
-                        "volume": guild_data["volume"],
-                    }
-                    await self.execute_db_query(
-                        """
-                        INSERT OR REPLACE INTO guild_settings (guild_id, queue_data, music_channel_id)
-                        VALUES (?, ?, ?)
-                    """,
-                        (guild_id, json.dumps(queue_data), guild_data.get("music_channel_id")),
-                    )
-            except Exception as e:
-                logger.error(f"Failed to save queue for guild {guild_id} on shutdown: {e}")
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+        if self._writer_task:
+            self._writer_task.cancel()
+            await asyncio.gather(self._writer_task, return_exceptions=True)
+
+        guild_ids = [
+            guild_id
+            for guild_id, guild_data in self.guilds_data.items()
+            if guild_id in self._dirty_guilds
+               or guild_data.queue
+               or guild_data.current
+               or guild_data.loop_backup
+        ]
 
-        for task in self.db_save_tasks.values():
-            task.cancel()
+        try:
+            if guild_ids:
+                await self._save_guild_queues(guild_ids)
+        except Exception as e:
+            logger.error(f"Failed to save queues on shutdown: {e}")
 
-        if self.db_save_tasks:
-            await asyncio.gather(*self.db_save_tasks.values(), return_exceptions=True)
-            logger.info("All database save tasks completed")
+        self._dirty_guilds.clear()
 
         for guild_data in self.guilds_data.values():
-            if guild_data["voice_client"]:
+            if guild_data.voice_client:
                 try:
-                    await guild_data["voice_client"].disconnect()
+                    await guild_data.voice_client.disconnect()
                 except Exception as e:
                     logger.debug(f"Error disconnecting voice client: {e}")
 
         self.executor.shutdown(wait=True)
 
+        self._db_read_executor.shutdown(wait=True)
+        for conn in self._db_read_conns:
+            conn.close()
+
+        self._db_executor.shutdown(wait=True)
+        self._db_conn.close()
+
         await super().close()
 
     def load_guild_music_channel(self, guild_id: int):
@@ -686,7 +890,7 @@ class MusicBot(commands.Bot):
                 )
                 if result and result[0][0]:
                     guild_data = self.get_guild_data(guild_id)
-                    guild_data["music_channel_id"] = result[0][0]
+                    guild_data.music_channel_id = result[0][0]
             except Exception as e:
                 logger.error(f"Failed to load music channel for guild {guild_id}: {e}")
 
@@ -1,9 +1,11 @@
 import discord
 from discord.ext import commands
 import asyncio
+import io
 import logging
+import re
+import time
 from typing import Optional
-from datetime import datetime
 
 from models.song import Song
 
@@ -16,21 +18,88 @@ from services.queue_service import QueueService
 from utils.helpers import (
     format_duration,
     build_progress_bar,
-    get_existing_urls,
+    is_url_in_guild,
+    is_voice_active,
     parse_time_to_seconds,
     interaction_check,
     create_embed,
 )
 
-from utils.ban_system import is_banned, ban_user_id, unban_user_id
+from utils.ban_system import is_banned, ban_user_id, unban_user_id, get_banned_ids
 
 from views.song_select import SongSelectView
-from views.pagination import PaginationView
+from views.pagination import LazyPaginationView
 
 from config import COLOR, SONGS_PER_PAGE
 
 logger = logging.getLogger(__name__)
 
+LOOP_MODES = ("off", "song", "queue")
+LOOP_MODE_EMOJIS = {"off": "🔄", "song": "🔂", "queue": "🔁"}
+STATUS_EMOJIS = {"Playing": "🎵", "Paused": "⏸️", "Stopped": "⏹️"}
+SEEK_BEFORE_OPTIONS = "-ss {} -fflags +fastseek+nobuffer "
+SEEK_OPTIONS = "-vn -bufsize 1024k"
+PLAYLIST_URL_RE = re.compile(
+    r"(?:youtube\.com|youtu\.be)/.*[?&]list=[A-Za-z0-9_-]+", re.IGNORECASE
+)
+
+HELP_DESCRIPTION = """**Music Bot Commands Guide**
+
+**Basic Commands:**
+`/join` - Join your voice channel
+`/play <query>` - Play a song or add it to queue (supports YouTube URLs, Spotify links, or search terms)
+`/pause` - Pause the current song
+`/resume` - Resume the paused song
+`/skip` - Skip the current song
+`/previous` - Play the previous song from history
+`/autoplay` - Auto play related songs after queue
+`/stop` - Stop playback and clear queue
+`/leave` - Disconnect from voice channel
+
+**Queue Management:**
+`/queue [page]` - Show the current queue (paginated)
+`/clear` - Clear the queue without stopping current song
+`/remove <position>` - Remove a song from queue by position
+`/move <from_pos> <to_pos>` - Move a song to different position
+`/skipto <position>` - Skip to a specific song in queue
+
+**Playback Controls:**
+`/volume [level]` - Set or show volume (0-100)
+`/loop <mode>` - Set loop mode: off, song, or queue
+`/shuffle` - Toggle shuffle mode
+`/seek <position>` - Seek to specific time (e.g., '1:30', '90', etc)
+`/nowplaying` - Show currently playing song info
+
+**Search & Discovery:**
+`/search <query>` - Search for songs and choose which to play
+`/history show [page]` - Show recently played songs
+`/history play <number>` - Play a song from history by number
+`/history add_all` - Add all songs from history to queue
+`/history clear` - Clear all history songs
+
+**Playlist Commands: (your playlist(s) are guild specific)**
+`/playlist create <name>` - Create a new empty playlist
+`/playlist add <name> <song>` - Add a song to playlist by searching
+`/playlist add-from-queue <name> <from_queue>` - Add song from current queue to playlist
+`/playlist add-all-queue <name>` - Add entire current queue to playlist
+`/playlist remove <name> <position>` - Remove a song from playlist
+`/playlist move <name> <from_pos> <to_pos>` - Move song in playlist
+`/playlist load <name>` - Load a playlist into the queue
+`/playlist show <name> [page]` - Show songs in a playlist
+`/playlist list` - List all your playlists
+`/playlist delete <name>` - Delete a playlist
+
+**Settings:**
+`/setmusicchannel` - Set the channel for music messages
+
+**Tips:**
+• Use reaction controls on the 'Now Playing' message: 
+⏯️ Pause/Resume, ⏭️ Skip, ⏮️ Previous, 🔀 Shuffle, 🔁 Loop, ⏹️ Stop, 🔊/🔉 Volume
+• Supports YouTube URLs, YouTube playlists, Spotify links, and search queries
+• Queue persists across bot restarts
+• You must be in the same voice channel as the bot to control playback
+• Duplicates are not allowed"""
+
 
 class MusicCommands(commands.Cog):
     def __init__(self, bot):
@@ -38,39 +107,68 @@ class MusicCommands(commands.Cog):
         self.music_service = MusicService(bot)
         self.playback_service = PlaybackService(bot)
         self.queue_service = QueueService(bot)
+        self._np_embed_cache = {}
+        self._queue_page_cache = {}
+        self._help_embed = None
+        self._reaction_handlers = {
+            "⏯️": self._react_play_pause,
+            "⏭️": self._react_skip,
+            "⏮️": self._react_previous,
+            "🔀": self._react_shuffle,
+            "🔁": self._react_loop,
+            "⏹️": self._react_stop,
+            "🔊": self._react_volume_up,
+            "🔉": self._react_volume_down,
+        }
         super().__init__()
 
+    def _seek_superseded_embed(self) -> discord.Embed:
+        return create_embed(
+            "Seek Cancelled", "A newer seek request replaced this one.", COLOR, self.bot.user
+        )
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         return await interaction_check(self, interaction)
 
+    async def cog_unload(self):
+        # Don't leave debounced queue saves behind when the cog is reloaded
+        try:
+            await self.bot.flush_dirty_guilds()
+        except Exception as e:
+            logger.error(f"Failed to flush guild queues on unload: {e}")
+
+    @staticmethod
+    def _voice_snapshot(interaction: discord.Interaction) -> tuple:
+        user_voice = interaction.user.voice
+        voice_client = interaction.guild.voice_client
+        return (
+            user_voice.channel.id if user_voice and user_voice.channel else None,
+            voice_client.channel.id if voice_client else None,
+            voice_client,
+        )
+
     async def check_voice_channel(
             self, interaction: discord.Interaction, allow_auto_join: bool = False
     ) -> bool:
-        if not interaction.user.voice:
+        user_channel_id, bot_channel_id, voice_client = self._voice_snapshot(interaction)
+
+        if user_channel_id is None:
             embed = create_embed(
-                "Error",
-                "You must be in a voice channel to use this command!",
-                COLOR,
-                self.bot.user,
+                "Error", "You must be in a voice channel to use this command!", COLOR, self.bot.user
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return False
 
-        voice_client = interaction.guild.voice_client
-
         if not voice_client:
             if allow_auto_join:
                 return True
             embed = create_embed(
-                "Error",
-                "The bot is not connected to any voice channel!",
-                COLOR,
-                self.bot.user,
+                "Error", "The bot is not connected to any voice channel!", COLOR, self.bot.user
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return False
 
-        if interaction.user.voice.channel != voice_client.channel:
+        if user_channel_id != bot_channel_id:
             embed = create_embed(
                 "Error",
                 f"You must be in the same voice channel as the bot! Bot is in: {voice_client.channel.name}",
@@ -86,14 +184,14 @@ class MusicCommands(commands.Cog):
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
         if (
-                not guild_data["voice_client"]
-                or not guild_data["voice_client"].is_connected()
+                not guild_data.voice_client
+                or not guild_data.voice_client.is_connected()
         ):
             if not interaction.user.voice:
                 return False
 
             try:
-                guild_data["voice_client"] = (
+                guild_data.voice_client = (
                     await interaction.user.voice.channel.connect()
                 )
             except Exception as e:
@@ -109,66 +207,130 @@ class MusicCommands(commands.Cog):
         if not guild:
             return None
 
-        if guild_data.get("music_channel_id"):
-            channel = guild.get_channel(guild_data["music_channel_id"])
-            if channel and channel.permissions_for(guild.me).send_messages:
-                return channel
+        if (
+                guild_data.music_channel_obj
+                and guild_data.music_channel_obj_id == guild_data.music_channel_id
+        ):
+            return guild_data.music_channel_obj
+
+        channel = None
+
+        if guild_data.music_channel_id:
+            configured = guild.get_channel(guild_data.music_channel_id)
+            if configured and configured.permissions_for(guild.me).send_messages:
+                channel = configured
             else:
-                guild_data["music_channel_id"] = None
+                guild_data.music_channel_id = None
+
+        if not channel:
+            channel = next(
+                (
+                    text_channel
+                    for text_channel in guild.text_channels
+                    if text_channel.permissions_for(guild.me).send_messages
+                ),
+                None,
+            )
+
+            # Remember the fallback so the channel scan only ever runs once per guild
+            if channel:
+                guild_data.music_channel_id = channel.id
+                await self.bot.save_guild_music_channel(guild_id, channel.id)
 
-        for channel in guild.text_channels:
-            if channel.permissions_for(guild.me).send_messages:
-                return channel
+        guild_data.music_channel_obj = channel
+        guild_data.music_channel_obj_id = guild_data.music_channel_id
+        return channel
 
-        return None
+    def _invalidate_music_channel(self, guild_id: int):
+        guild_data = self.bot.get_guild_data(guild_id)
+        guild_data.music_channel_obj = None
+        guild_data.music_channel_obj_id = None
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        if channel.guild.id in self.bot.guilds_data:
+            self._invalidate_music_channel(channel.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+            self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ):
+        if after.guild.id in self.bot.guilds_data:
+            self._invalidate_music_channel(after.guild.id)
 
     async def create_now_playing_message(
             self, guild_id: int, embed: discord.Embed
+    ) -> Optional[discord.Message]:
+        guild_data = self.bot.get_guild_data(guild_id)
+
+        # Serialise creation so back-to-back track changes can't both send a message
+        async with guild_data.np_lock:
+            return await self._send_now_playing_message(guild_id, guild_data, embed)
+
+    async def _send_now_playing_message(
+            self, guild_id: int, guild_data, embed: discord.Embed
     ) -> Optional[discord.Message]:
         try:
             channel = await self.get_music_channel(guild_id)
             if not channel:
                 return None
 
-            guild_data = self.bot.get_guild_data(guild_id)
-            guild_data["message_ready_for_timestamps"] = False
+            song_url = guild_data.current.webpage_url if guild_data.current else None
+            old_message = guild_data.now_playing_message
 
-            if guild_data.get("now_playing_message"):
-                try:
-                    await guild_data["now_playing_message"].delete()
-                    await asyncio.sleep(0.5)
-                except (discord.NotFound, discord.HTTPException):
-                    pass
-                guild_data["now_playing_message"] = None
+            # Another caller created the message for this song while we waited on the lock
+            if old_message and guild_data.now_playing_song_url == song_url:
+                await old_message.edit(embed=embed)
+                guild_data.now_playing_body = embed.description
+                return old_message
+
+            guild_data.message_ready_for_timestamps = False
+            guild_data.now_playing_message = None
 
-            msg = await channel.send(embed=embed)
-            guild_data["now_playing_message"] = msg
+            # Deleting the old message doesn't have to finish before the new one is sent
+            if old_message:
+                _, msg = await asyncio.gather(
+                    self.delete_message_quietly(old_message),
+                    channel.send(embed=embed),
+                )
+            else:
+                msg = await channel.send(embed=embed)
+            guild_data.now_playing_message = msg
+            guild_data.now_playing_song_url = song_url
+            guild_data.now_playing_body = embed.description
 
             await self.add_reaction_controls(msg)
-            await asyncio.sleep(0.2)
-            guild_data["message_ready_for_timestamps"] = True
+            guild_data.message_ready_for_timestamps = True
+            self.playback_service.start_timestamp_updates(guild_id)
 
             return msg
 
         except Exception as e:
             logger.error(f"Failed to create now playing message: {e}")
-            guild_data["now_playing_message"] = None
-            guild_data["message_ready_for_timestamps"] = False
+            guild_data.now_playing_message = None
+            guild_data.message_ready_for_timestamps = False
             return None
 
     @staticmethod
     async def add_reaction_controls(message: discord.Message):
         reactions = ["⏯️", "⏭️", "⏮️", "🔀", "🔁", "⏹️", "🔊", "🔉"]
-        for reaction in reactions:
-            try:
-                await message.add_reaction(reaction)
-                await asyncio.sleep(0.1)
-            except discord.HTTPException as e:
-                logger.warning(f"Failed to add reaction {reaction}: {e}")
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error adding reaction {reaction}: {e}")
-                break
+        results = await asyncio.gather(
+            *(message.add_reaction(reaction) for reaction in reactions),
+            return_exceptions=True,
+        )
+
+        for reaction, result in zip(reactions, results):
+            if isinstance(result, discord.HTTPException):
+                logger.warning(f"Failed to add reaction {reaction}: {result}")
+            elif isinstance(result, Exception):
+                logger.error(f"Unexpected error adding reaction {reaction}: {result}")
+
+    @staticmethod
+    async def delete_message_quietly(message: discord.Message):
+        try:
+            await message.delete()
+        except (discord.NotFound, discord.HTTPException):
+            pass
 
     @staticmethod
     async def remove_reaction(reaction, user, emoji):
@@ -186,40 +348,39 @@ class MusicCommands(commands.Cog):
 
     async def update_now_playing(self, guild_id: int):
         guild_data = self.bot.get_guild_data(guild_id)
-        current = guild_data["current"]
+        current = guild_data.current
 
         if not current:
-            if guild_data.get("now_playing_message"):
+            if guild_data.now_playing_message:
                 try:
-                    await guild_data["now_playing_message"].delete()
+                    await guild_data.now_playing_message.delete()
                 except (discord.NotFound, discord.HTTPException):
                     pass
-                guild_data["now_playing_message"] = None
-                guild_data["message_ready_for_timestamps"] = False
+                guild_data.now_playing_message = None
+                guild_data.message_ready_for_timestamps = False
             return
 
+        vc = guild_data.voice_client
+        duration = current.duration
         current_position = self.playback_service.get_current_position(guild_id)
-        progress = build_progress_bar(current_position, current.duration)
+        progress = build_progress_bar(current_position, duration)
 
         status = "Playing"
-        if self.playback_service.is_paused(guild_id):
+        if vc and vc.is_paused():
             status = "Paused"
-        elif (
-                not guild_data["voice_client"]
-                or not guild_data["voice_client"].is_playing()
-        ):
+        elif not vc or not vc.is_playing():
             status = "Stopped"
 
         embed = create_embed(
             f"🎵 Now {status}",
             f"**{current.title}**\n"
             f"*by {current.uploader}*\n\n"
-            f"`{format_duration(current_position)} {progress} {format_duration(current.duration)}`\n\n"
-            f"🔊 Volume: {guild_data['volume']}%\n"
-            f"🔁 Loop: {guild_data['loop_mode'].title()}\n"
-            f"🔀 Shuffle: {'On' if guild_data['shuffle'] else 'Off'}\n"
+            f"`{format_duration(current_position)} {progress} {format_duration(duration)}`\n\n"
+            f"🔊 Volume: {guild_data.volume}%\n"
+            f"🔁 Loop: {guild_data.loop_mode.title()}\n"
+            f"🔀 Shuffle: {'On' if guild_data.shuffle else 'Off'}\n"
             f"📝 Requested by: {current.requested_by}\n"
-            f"📋 Queue length: {len(guild_data['queue'])} ",
+            f"📋 Queue length: {len(guild_data.queue)} ",
             COLOR,
             self.bot.user,
         )
@@ -227,6 +388,21 @@ class MusicCommands(commands.Cog):
         if current.thumbnail:
             embed.set_thumbnail(url=current.thumbnail)
 
+        message = guild_data.now_playing_message
+        if message and guild_data.now_playing_song_url == current.webpage_url:
+            if guild_data.now_playing_body == embed.description:
+                return
+
+            try:
+                await message.edit(embed=embed)
+                guild_data.now_playing_body = embed.description
+                return
+            except discord.NotFound:
+                guild_data.now_playing_message = None
+            except discord.HTTPException as e:
+                logger.debug(f"Failed to edit now playing message: {e}")
+                return
+
         await self.create_now_playing_message(guild_id, embed)
 
     @commands.Cog.listener()
@@ -239,10 +415,7 @@ class MusicCommands(commands.Cog):
 
             try:
                 embed = create_embed(
-                    "Access Denied",
-                    "You are banned from using this bot.",
-                    COLOR,
-                    self.bot.user,
+                    "Access Denied", "You are banned from using this bot.", COLOR, self.bot.user
                 )
                 msg = await reaction.message.channel.send(
                     content=user.mention, embed=embed, delete_after=5
@@ -252,116 +425,118 @@ class MusicCommands(commands.Cog):
             return
 
         emoji = str(reaction.emoji)
-        guild_data = self.bot.get_guild_data(reaction.message.guild.id)
+        guild_id = reaction.message.guild.id
+        guild_data = self.bot.get_guild_data(guild_id)
 
         if (
-                not guild_data.get("now_playing_message")
-                or guild_data["now_playing_message"].id != reaction.message.id
+                not guild_data.now_playing_message
+                or guild_data.now_playing_message.id != reaction.message.id
         ):
             return
 
-        if not user.voice or not guild_data.get("voice_client"):
+        vc = guild_data.voice_client
+        user_voice = user.voice
+        if (
+                not user_voice
+                or not vc
+                or not user_voice.channel
+                or vc.channel.id != user_voice.channel.id
+        ):
             await self.remove_reaction(reaction, user, emoji)
             return
 
-        if guild_data["voice_client"].channel != user.voice.channel:
-            await self.remove_reaction(reaction, user, emoji)
-            return
+        handler = self._reaction_handlers.get(emoji)
+        if handler:
+            try:
+                await handler(guild_data, vc, guild_id)
+                self.bot.schedule_save_guild_queue(guild_id)
+            except Exception as e:
+                logger.error(f"Reaction control error: {e}")
 
-        try:
-            match emoji:
-                case "⏯️":
-                    if guild_data["voice_client"].is_playing():
-                        self.playback_service.handle_pause(reaction.message.guild.id)
-                    elif guild_data["voice_client"].is_paused():
-                        self.playback_service.handle_resume(reaction.message.guild.id)
-
-                case "⏭️":
-                    if (
-                            guild_data["voice_client"].is_playing()
-                            or guild_data["voice_client"].is_paused()
-                    ):
-                        guild_data["voice_client"].stop()
+        await self.remove_reaction(reaction, user, emoji)
 
-                case "⏮️":
-                    await self.play_previous(reaction.message.guild.id)
+    @staticmethod
+    def _build_new_songs(entries: list, guild_data, requested_by: str) -> list:
+        new_entries = []
+        added_urls = set()
+        for data in entries:
+            url = data.get("webpage_url")
+            if url in added_urls or is_url_in_guild(guild_data, url):
+                continue
+            added_urls.add(url)
+            new_entries.append(data)
 
-                case "🔀":
-                    self.queue_service.toggle_shuffle(reaction.message.guild.id)
+        return list(Song.fast_many(new_entries, requested_by))
 
-                case "🔁":
-                    modes = ["off", "song", "queue"]
-                    current_index = modes.index(guild_data["loop_mode"])
-                    self.queue_service.set_loop_mode(
-                        reaction.message.guild.id,
-                        modes[(current_index + 1) % len(modes)],
-                    )
+    async def _react_play_pause(self, guild_data, vc, guild_id: int):
+        if vc.is_playing():
+            self.playback_service.handle_pause(guild_id)
+        elif vc.is_paused():
+            self.playback_service.handle_resume(guild_id)
 
-                case "⏹️":
-                    self.queue_service.clear_queue(reaction.message.guild.id)
-                    guild_data["current"] = None
-                    guild_data["start_time"] = None
-                    if (
-                            guild_data["voice_client"].is_playing()
-                            or guild_data["voice_client"].is_paused()
-                    ):
-                        guild_data["voice_client"].stop()
-
-                case "🔊":
-                    new_volume = min(100, guild_data["volume"] + 10)
-                    guild_data["volume"] = new_volume
-                    if guild_data["voice_client"] and guild_data["voice_client"].source:
-                        try:
-                            guild_data["voice_client"].source.volume = new_volume / 100
-                        except AttributeError:
-                            pass
-
-                case "🔉":
-                    new_volume = max(0, guild_data["volume"] - 10)
-                    guild_data["volume"] = new_volume
-                    if guild_data["voice_client"] and guild_data["voice_client"].source:
-                        try:
-                            guild_data["voice_client"].source.volume = new_volume / 100
-                        except AttributeError:
-                            pass
-
-            await self.bot.save_guild_queue(reaction.message.guild.id)
+    async def _react_skip(self, guild_data, vc, guild_id: int):
+        if is_voice_active(vc):
+            vc.stop()
 
-        except Exception as e:
-            logger.error(f"Reaction control error: {e}")
+    async def _react_previous(self, guild_data, vc, guild_id: int):
+        await self.play_previous(guild_id)
 
-        await self.remove_reaction(reaction, user, emoji)
+    async def _react_shuffle(self, guild_data, vc, guild_id: int):
+        self.queue_service.toggle_shuffle(guild_id)
+
+    async def _react_loop(self, guild_data, vc, guild_id: int):
+        current_index = LOOP_MODES.index(guild_data.loop_mode)
+        self.queue_service.set_loop_mode(
+            guild_id, LOOP_MODES[(current_index + 1) % len(LOOP_MODES)]
+        )
+
+    async def _react_stop(self, guild_data, vc, guild_id: int):
+        self.queue_service.clear_queue(guild_id)
+        guild_data.current = None
+        guild_data.start_time = None
+        if is_voice_active(vc):
+            vc.stop()
+
+    async def _react_volume_up(self, guild_data, vc, guild_id: int):
+        self._set_reaction_volume(guild_data, vc, min(100, guild_data.volume + 10))
+
+    async def _react_volume_down(self, guild_data, vc, guild_id: int):
+        self._set_reaction_volume(guild_data, vc, max(0, guild_data.volume - 10))
+
+    @staticmethod
+    def _set_reaction_volume(guild_data, vc, new_volume: int):
+        guild_data.volume = new_volume
+        if vc.source:
+            try:
+                vc.source.volume = new_volume / 100
+            except AttributeError:
+                pass
 
     async def play_previous(self, guild_id: int):
         guild_data = self.bot.get_guild_data(guild_id)
 
-        if not guild_data["history"]:
+        if not guild_data.history:
             return False
 
-        if "history_position" not in guild_data:
-            guild_data["history_position"] = len(guild_data["history"])
-
-        guild_data["history_position"] -= 1
+        guild_data.history_position -= 1
 
-        if guild_data["history_position"] < 0:
-            guild_data["history_position"] = 0
+        if guild_data.history_position < 0:
+            guild_data.history_position = 0
             return False
 
-        previous_song = guild_data["history"][guild_data["history_position"]]
+        previous_song = guild_data.history[guild_data.history_position]
 
-        if guild_data["current"]:
-            guild_data["queue"].insert(0, guild_data["current"])
+        if guild_data.current:
+            guild_data.queue.insert(0, guild_data.current)
 
-        guild_data["current"] = Song.from_dict(previous_song.to_dict())
-        guild_data["seek_offset"] = 0
-        guild_data["position"] = 0
-        guild_data["start_time"] = None
+        guild_data.current = previous_song.clone()
+        guild_data.seek_offset = 0
+        guild_data.position = 0
+        guild_data.start_time = None
 
-        if guild_data["voice_client"] and (
-                guild_data["voice_client"].is_playing()
-                or guild_data["voice_client"].is_paused()
-        ):
-            guild_data["voice_client"].stop()
+        vc = guild_data.voice_client
+        if is_voice_active(vc):
+            vc.stop()
 
         await self.play_previous_song_directly(guild_id)
         return True
@@ -369,21 +544,21 @@ class MusicCommands(commands.Cog):
     async def play_previous_song_directly(self, guild_id: int):
         guild_data = self.bot.get_guild_data(guild_id)
 
-        async with guild_data["play_lock"]:
-            current_song = guild_data["current"]
+        async with guild_data.play_lock:
+            current_song = guild_data.current
 
             if not current_song:
                 return
 
             if (
-                    not guild_data["voice_client"]
-                    or not guild_data["voice_client"].is_connected()
+                    not guild_data.voice_client
+                    or not guild_data.voice_client.is_connected()
             ):
                 logger.info(
                     f"Voice client disconnected for guild {guild_id}, stopping playback"
                 )
-                guild_data["current"] = None
-                guild_data["start_time"] = None
+                guild_data.current = None
+                guild_data.start_time = None
                 return
 
             max_retries = 2
@@ -429,29 +604,24 @@ class MusicCommands(commands.Cog):
                         await asyncio.sleep(0.5)
 
             try:
-                source = discord.PCMVolumeTransformer(
-                    discord.FFmpegPCMAudio(current_song.url, **self.bot.ffmpeg_options),
-                    volume=guild_data["volume"] / 100,
-                )
+                source = await self.bot.create_audio_source(current_song.url, guild_data.volume / 100)
 
                 def after_playing(error):
                     if error:
                         logger.error(f"Player error: {error}")
 
-                    coro = self.playback_service.play_next(guild_id)
-                    fut = asyncio.run_coroutine_threadsafe(coro, self.bot.loop)
-                    fut.add_done_callback(lambda f: f.exception())
+                    self.playback_service.schedule_play_next(guild_id)
 
-                guild_data["seek_offset"] = 0
-                guild_data["position"] = 0
-                guild_data["start_time"] = datetime.now()
-                guild_data["last_activity"] = datetime.now()
+                guild_data.seek_offset = 0
+                guild_data.position = 0
+                guild_data.start_time = time.monotonic()
+                guild_data.last_activity = time.monotonic()
 
-                guild_data["voice_client"].play(source, after=after_playing)
+                guild_data.voice_client.play(source, after=after_playing)
 
-                await asyncio.sleep(0.2)
                 await self.update_now_playing(guild_id)
-                await self.bot.save_guild_queue(guild_id)
+                self.bot.schedule_save_guild_queue(guild_id)
+                self.playback_service.prefetch_adjacent(guild_id)
 
                 logger.info(
                     f"Now playing previous song: {current_song.title} in guild {guild_id}"
@@ -459,26 +629,24 @@ class MusicCommands(commands.Cog):
 
             except Exception as e:
                 logger.error(f"Error playing previous song: {e}")
-                guild_data["current"] = None
-                guild_data["start_time"] = None
-                await self.bot.save_guild_queue(guild_id)
+                guild_data.current = None
+                guild_data.start_time = None
+                self.bot.schedule_save_guild_queue(guild_id)
 
     # Slash Commands Start Here
 
     @discord.app_commands.command(name="join", description="Join your voice channel")
     async def join_slash(self, interaction: discord.Interaction):
         if not interaction.user.voice:
-            embed = create_embed(
-                "Error", "You must be in a voice channel!", COLOR, self.bot.user
-            )
+            embed = create_embed("Error", "You must be in a voice channel!", COLOR, self.bot.user)
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
         voice_channel = interaction.user.voice.channel
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        if guild_data["voice_client"] and guild_data["voice_client"].is_connected():
-            if guild_data["voice_client"].channel == voice_channel:
+        if guild_data.voice_client and guild_data.voice_client.is_connected():
+            if guild_data.voice_client.channel == voice_channel:
                 embed = create_embed(
                     "Already Connected",
                     f"I'm already in {voice_channel.name}!",
@@ -489,7 +657,7 @@ class MusicCommands(commands.Cog):
                 return
             else:
                 try:
-                    await guild_data["voice_client"].move_to(voice_channel)
+                    await guild_data.voice_client.move_to(voice_channel)
                     embed = create_embed(
                         "Moved", f"Moved to {voice_channel.name}!", COLOR, self.bot.user
                     )
@@ -498,17 +666,14 @@ class MusicCommands(commands.Cog):
                 except Exception as e:
                     logger.error(f"Failed to move to voice channel: {e}")
                     embed = create_embed(
-                        "Error",
-                        "Failed to move to your voice channel!",
-                        COLOR,
-                        self.bot.user,
+                        "Error", "Failed to move to your voice channel!", COLOR, self.bot.user
                     )
                     await interaction.response.send_message(embed=embed, ephemeral=True)
                     return
 
         try:
-            guild_data["voice_client"] = await voice_channel.connect()
-            guild_data["last_activity"] = datetime.now()
+            guild_data.voice_client = await voice_channel.connect()
+            guild_data.last_activity = time.monotonic()
 
             embed = create_embed(
                 "Connected", f"Joined {voice_channel.name}!", COLOR, self.bot.user
@@ -535,8 +700,8 @@ class MusicCommands(commands.Cog):
 
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        if not guild_data.get("music_channel_id"):
-            guild_data["music_channel_id"] = interaction.channel.id
+        if not guild_data.music_channel_id:
+            guild_data.music_channel_id = interaction.channel.id
             await self.bot.save_guild_music_channel(
                 interaction.guild.id, interaction.channel.id
             )
@@ -548,9 +713,9 @@ class MusicCommands(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        if guild_data["voice_client"].channel != interaction.user.voice.channel:
+        if guild_data.voice_client.channel != interaction.user.voice.channel:
             try:
-                await guild_data["voice_client"].move_to(interaction.user.voice.channel)
+                await guild_data.voice_client.move_to(interaction.user.voice.channel)
             except Exception as e:
                 logger.error(f"Failed to move to voice channel: {e}")
 
@@ -560,7 +725,7 @@ class MusicCommands(commands.Cog):
         await interaction.response.send_message(embed=searching_embed)
 
         try:
-            is_playlist = "playlist" in query.lower() and "youtube.com" in query.lower()
+            is_playlist = bool(PLAYLIST_URL_RE.search(query))
 
             if is_playlist:
                 playlist_songs = (
@@ -574,19 +739,14 @@ class MusicCommands(commands.Cog):
                     await interaction.edit_original_response(embed=embed)
                     return
 
-                existing_urls = get_existing_urls(guild_data)
-                added_count = 0
-                skipped_count = 0
-
-                for data in playlist_songs:
-                    if data.get("webpage_url") not in existing_urls:
-                        song = Song(data)
-                        song.requested_by = interaction.user.mention
-                        self.queue_service.add_song_to_queue(interaction.guild.id, song)
-                        existing_urls.add(data.get("webpage_url"))
-                        added_count += 1
-                    else:
-                        skipped_count += 1
+                songs = self._build_new_songs(
+                    playlist_songs,
+                    guild_data,
+                    interaction.user.mention,
+                )
+                self.queue_service.add_songs_to_queue(interaction.guild.id, songs)
+                added_count = len(songs)
+                skipped_count = len(playlist_songs) - added_count
 
                 if added_count > 0:
                     embed = create_embed(
@@ -603,10 +763,7 @@ class MusicCommands(commands.Cog):
                     self.queue_service.sync_loop_backup(interaction.guild.id)
                 else:
                     embed = create_embed(
-                        "No Songs Added",
-                        "All songs were duplicates!",
-                        COLOR,
-                        self.bot.user,
+                        "No Songs Added", "All songs were duplicates!", COLOR, self.bot.user
                     )
 
                 await interaction.edit_original_response(embed=embed)
@@ -615,29 +772,24 @@ class MusicCommands(commands.Cog):
                 song_data = await self.bot.get_song_info_cached(query)
 
                 if not song_data:
-                    embed = create_embed(
-                        "Error", "Could not find the song!", COLOR, self.bot.user
-                    )
+                    embed = create_embed("Error", "Could not find the song!", COLOR, self.bot.user)
                     await interaction.edit_original_response(embed=embed)
                     return
 
                 if isinstance(song_data, list):
-                    existing_urls = get_existing_urls(guild_data)
-                    added_count = 0
-                    skipped_count = 0
-
-                    for data in song_data:
-                        if data.get("webpage_url") and data.get("title"):
-                            if data["webpage_url"] not in existing_urls:
-                                song = Song(data)
-                                song.requested_by = interaction.user.mention
-                                self.queue_service.add_song_to_queue(
-                                    interaction.guild.id, song
-                                )
-                                existing_urls.add(data["webpage_url"])
-                                added_count += 1
-                            else:
-                                skipped_count += 1
+                    valid_data = [
+                        data
+                        for data in song_data
+                        if data.get("webpage_url") and data.get("title")
+                    ]
+                    songs = self._build_new_songs(
+                        valid_data,
+                        guild_data,
+                        interaction.user.mention,
+                    )
+                    self.queue_service.add_songs_to_queue(interaction.guild.id, songs)
+                    added_count = len(songs)
+                    skipped_count = len(valid_data) - added_count
 
                     if added_count > 0:
                         embed = create_embed(
@@ -654,26 +806,21 @@ class MusicCommands(commands.Cog):
                         self.queue_service.sync_loop_backup(interaction.guild.id)
                     else:
                         embed = create_embed(
-                            "No Songs Added",
-                            "All songs were duplicates!",
-                            COLOR,
-                            self.bot.user,
+                            "No Songs Added", "All songs were duplicates!", COLOR, self.bot.user
                         )
 
                     await interaction.edit_original_response(embed=embed)
                 else:
                     if not song_data.get("webpage_url") or not song_data.get("title"):
-                        embed = create_embed(
-                            "Error", "Invalid song data!", COLOR, self.bot.user
-                        )
+                        embed = create_embed("Error", "Invalid song data!", COLOR, self.bot.user)
                         await interaction.edit_original_response(embed=embed)
                         return
 
                     song_url = song_data["webpage_url"]
 
                     if (
-                            guild_data["current"]
-                            and guild_data["current"].webpage_url == song_url
+                            guild_data.current
+                            and guild_data.current.webpage_url == song_url
                     ):
                         embed = create_embed(
                             "Duplicate Song",
@@ -684,23 +831,23 @@ class MusicCommands(commands.Cog):
                         await interaction.edit_original_response(embed=embed)
                         return
 
-                    for i, existing_song in enumerate(guild_data["queue"], 1):
-                        if existing_song.webpage_url == song_url:
-                            embed = create_embed(
-                                "Duplicate Song",
-                                f"This song is already in queue at position {i}!",
-                                COLOR,
-                                self.bot.user,
-                            )
-                            await interaction.edit_original_response(embed=embed)
-                            return
+                    if guild_data.queue.has_url(song_url):
+                        position = guild_data.queue.index_of_url(song_url) + 1
+                        embed = create_embed(
+                            "Duplicate Song",
+                            f"This song is already in queue at position {position}!",
+                            COLOR,
+                            self.bot.user,
+                        )
+                        await interaction.edit_original_response(embed=embed)
+                        return
 
                     song = Song(song_data)
                     song.requested_by = interaction.user.mention
                     self.queue_service.add_song_to_queue(interaction.guild.id, song)
 
-                    position = len(guild_data["queue"])
-                    if position == 1 and not guild_data["current"]:
+                    position = len(guild_data.queue)
+                    if position == 1 and not guild_data.current:
                         embed = create_embed("Added to Queue", "", COLOR, self.bot.user)
                     else:
                         embed = create_embed(
@@ -715,12 +862,12 @@ class MusicCommands(commands.Cog):
 
                     await interaction.edit_original_response(embed=embed)
 
-            if guild_data["queue"]:
+            if guild_data.queue:
                 asyncio.create_task(
                     self.playback_service.play_next(interaction.guild.id)
                 )
 
-            guild_data["last_activity"] = datetime.now()
+            guild_data.last_activity = time.monotonic()
 
         except Exception as e:
             logger.error(f"Error in play command: {e}")
@@ -735,13 +882,9 @@ class MusicCommands(commands.Cog):
             return
 
         if self.playback_service.handle_pause(interaction.guild.id):
-            embed = create_embed(
-                "⏸️ Paused", "Music has been paused.", COLOR, self.bot.user
-            )
+            embed = create_embed("⏸️ Paused", "Music has been paused.", COLOR, self.bot.user)
         else:
-            embed = create_embed(
-                "❌ Error", "Nothing is playing!", COLOR, self.bot.user
-            )
+            embed = create_embed("❌ Error", "Nothing is playing!", COLOR, self.bot.user)
 
         await interaction.response.send_message(embed=embed)
 
@@ -751,13 +894,9 @@ class MusicCommands(commands.Cog):
             return
 
         if self.playback_service.handle_resume(interaction.guild.id):
-            embed = create_embed(
-                "▶️ Resumed", "Music has been resumed.", COLOR, self.bot.user
-            )
+            embed = create_embed("▶️ Resumed", "Music has been resumed.", COLOR, self.bot.user)
         else:
-            embed = create_embed(
-                "❌ Error", "Music is not paused!", COLOR, self.bot.user
-            )
+            embed = create_embed("❌ Error", "Music is not paused!", COLOR, self.bot.user)
 
         await interaction.response.send_message(embed=embed)
 
@@ -767,21 +906,16 @@ class MusicCommands(commands.Cog):
             return
 
         guild_data = self.bot.get_guild_data(interaction.guild.id)
+        vc = guild_data.voice_client
+        current = guild_data.current
 
-        if guild_data["voice_client"] and (
-                guild_data["voice_client"].is_playing()
-                or guild_data["voice_client"].is_paused()
-        ):
-            skipped_song = (
-                guild_data["current"].title if guild_data["current"] else "Unknown"
-            )
+        if is_voice_active(vc):
+            skipped_song = current.title if current else "Unknown"
 
-            if guild_data["current"]:
-                self.queue_service.add_to_history(
-                    interaction.guild.id, guild_data["current"]
-                )
+            if current:
+                self.queue_service.add_to_history(interaction.guild.id, current)
 
-            guild_data["voice_client"].stop()
+            vc.stop()
             embed = create_embed(
                 "Skipped", f"Skipped: **{skipped_song}**", COLOR, self.bot.user
             )
@@ -797,32 +931,23 @@ class MusicCommands(commands.Cog):
 
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        if not guild_data["history"]:
+        if not guild_data.history:
             embed = create_embed(
-                "❌ No Previous Songs",
-                "No previous songs in history",
-                COLOR,
-                self.bot.user,
+                "❌ No Previous Songs", "No previous songs in history", COLOR, self.bot.user
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        if "history_position" not in guild_data:
-            guild_data["history_position"] = len(guild_data["history"])
-
-        target_position = guild_data["history_position"] - 1
+        target_position = guild_data.history_position - 1
 
         if target_position < 0:
             embed = create_embed(
-                "❌ No Previous Songs",
-                "Already at the beginning of history",
-                COLOR,
-                self.bot.user,
+                "❌ No Previous Songs", "Already at the beginning of history", COLOR, self.bot.user
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        previous_song_title = guild_data["history"][target_position].title
+        previous_song_title = guild_data.history[target_position].title
 
         success = await self.play_previous(interaction.guild.id)
 
@@ -833,11 +958,9 @@ class MusicCommands(commands.Cog):
                 COLOR,
                 self.bot.user,
             )
-            await self.bot.save_guild_queue(interaction.guild.id)
+            self.bot.schedule_save_guild_queue(interaction.guild.id)
         else:
-            embed = create_embed(
-                "❌ Error", "Could not play previous song!", COLOR, self.bot.user
-            )
+            embed = create_embed("❌ Error", "Could not play previous song!", COLOR, self.bot.user)
 
         await interaction.response.send_message(embed=embed)
 
@@ -868,16 +991,13 @@ class MusicCommands(commands.Cog):
             return
 
         if position == 1:
-            if guild_data["voice_client"] and (
-                    guild_data["voice_client"].is_playing()
-                    or guild_data["voice_client"].is_paused()
-            ):
-                if guild_data["current"]:
+            if is_voice_active(guild_data.voice_client):
+                if guild_data.current:
                     self.queue_service.add_to_history(
-                        interaction.guild.id, guild_data["current"]
+                        interaction.guild.id, guild_data.current
                     )
 
-                guild_data["voice_client"].stop()
+                guild_data.voice_client.stop()
                 embed = create_embed(
                     "Skipped to Song",
                     f"Skipped to: **{visible_queue[0].title}**",
@@ -885,46 +1005,40 @@ class MusicCommands(commands.Cog):
                     self.bot.user,
                 )
             else:
-                embed = create_embed(
-                    "Error", "Nothing is playing!", COLOR, self.bot.user
-                )
+                embed = create_embed("Error", "Nothing is playing!", COLOR, self.bot.user)
 
             await interaction.response.send_message(embed=embed)
             return
 
-        async with guild_data["play_lock"]:
+        async with guild_data.play_lock:
             target_song = visible_queue[position - 1]
-            primary_queue_size = len(guild_data["queue"])
+            primary_queue_size = len(guild_data.queue)
 
-            if guild_data["current"]:
+            if guild_data.current:
                 self.queue_service.add_to_history(
-                    interaction.guild.id, guild_data["current"]
+                    interaction.guild.id, guild_data.current
                 )
 
             if position <= primary_queue_size:
                 songs_to_skip = position - 1
 
-                for _ in range(songs_to_skip):
-                    if guild_data["queue"]:
-                        skipped_song = guild_data["queue"].pop(0)
-                        self.queue_service.add_to_history(
-                            interaction.guild.id, skipped_song
-                        )
+                skipped_songs = guild_data.queue[:songs_to_skip]
+                del guild_data.queue[:songs_to_skip]
+                self.queue_service.add_many_to_history(
+                    interaction.guild.id, skipped_songs
+                )
 
             else:
-                for song in guild_data["queue"]:
-                    self.queue_service.add_to_history(interaction.guild.id, song)
-                guild_data["queue"].clear()
+                self.queue_service.add_many_to_history(
+                    interaction.guild.id, guild_data.queue
+                )
+                guild_data.queue.clear()
 
-                target_song_copy = Song.from_dict(target_song.to_dict())
-                target_song_copy.requested_by = interaction.user.mention
-                guild_data["queue"].insert(0, target_song_copy)
+                target_song_copy = target_song.clone(requested_by=interaction.user.mention)
+                guild_data.queue.append(target_song_copy)
 
-            if guild_data["voice_client"] and (
-                    guild_data["voice_client"].is_playing()
-                    or guild_data["voice_client"].is_paused()
-            ):
-                guild_data["voice_client"].stop()
+            if is_voice_active(guild_data.voice_client):
+                guild_data.voice_client.stop()
 
             embed = create_embed(
                 "Skipped to Song",
@@ -934,14 +1048,14 @@ class MusicCommands(commands.Cog):
             )
             await interaction.response.send_message(embed=embed)
 
-            await self.bot.save_guild_queue(interaction.guild.id)
+            self.bot.schedule_save_guild_queue(interaction.guild.id)
 
     @discord.app_commands.command(name="queue", description="Show the current queue")
     @discord.app_commands.describe(page="Page number to view (optional)")
     async def queue_slash(self, interaction: discord.Interaction, page: int = 1):
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        if not guild_data["current"] and not guild_data["queue"]:
+        if not guild_data.current and not guild_data.queue:
             embed = create_embed("📋 Queue", "Queue is empty!", COLOR, self.bot.user)
             await interaction.response.send_message(embed=embed)
             return
@@ -954,22 +1068,29 @@ class MusicCommands(commands.Cog):
 
         page = max(1, min(page, total_pages))
 
-        pages = []
-        for page_num in range(total_pages):
+        current = guild_data.current
+        loop_mode = guild_data.loop_mode
+        shuffle = guild_data.shuffle
+
+        def build_page(page_num: int) -> discord.Embed:
             start_idx = page_num * SONGS_PER_PAGE
             end_idx = start_idx + SONGS_PER_PAGE
 
-            description = ""
+            parts = []
 
-            if guild_data["current"]:
-                description += f"**🎵 Now Playing:**\n{guild_data['current']}\n\n"
+            if current:
+                parts.append(f"**🎵 Now Playing:**\n{current}\n\n")
 
             if all_visible_songs:
-                description += f"**📋 Up Next:**\n"
-                for i, song in enumerate(
+                parts.append("**📋 Up Next:**\n")
+                parts.extend(
+                    f"`{i}.` {song}\n"
+                    for i, song in enumerate(
                         all_visible_songs[start_idx:end_idx], start_idx + 1
-                ):
-                    description += f"`{i}.` {song}\n"
+                    )
+                )
+
+            description = "".join(parts)
 
             if not description.strip():
                 description = "Queue is empty!"
@@ -985,23 +1106,45 @@ class MusicCommands(commands.Cog):
                 name="Queue", value=str(len(all_visible_songs)), inline=True
             )
             embed.add_field(
-                name="Loop Mode", value=guild_data["loop_mode"].title(), inline=True
+                name="Loop Mode", value=loop_mode.title(), inline=True
             )
             embed.add_field(
                 name="Shuffle",
-                value="On" if guild_data["shuffle"] else "Off",
+                value="On" if shuffle else "Off",
                 inline=True,
             )
 
-            pages.append(embed)
+            return embed
 
-        view = PaginationView(pages, interaction.user)
+        state_key = (
+            guild_data.queue.version,
+            guild_data.loop_backup.version,
+            loop_mode,
+            shuffle,
+            str(current) if current else None,
+        )
+        cached = self._queue_page_cache.get(interaction.guild.id)
+        if not cached or cached[0] != state_key:
+            cached = (state_key, {})
+            self._queue_page_cache[interaction.guild.id] = cached
+        rendered_pages = cached[1]
+
+        def get_cached_page(page_num: int) -> discord.Embed:
+            embed = rendered_pages.get(page_num)
+            if embed is None:
+                embed = build_page(page_num)
+                rendered_pages[page_num] = embed
+            embed = embed.copy()
+            embed.timestamp = discord.utils.utcnow()
+            return embed
+
+        view = LazyPaginationView(get_cached_page, total_pages, interaction.user)
         view.current_page = page - 1
 
         view.previous_button.disabled = view.current_page == 0
-        view.next_button.disabled = view.current_page == len(pages) - 1
+        view.next_button.disabled = view.current_page == total_pages - 1
 
-        await interaction.response.send_message(embed=pages[page - 1], view=view)
+        await interaction.response.send_message(embed=view.get_page(page - 1), view=view)
 
     @discord.app_commands.command(
         name="volume", description="Set or show the volume (0-100)"
@@ -1016,21 +1159,24 @@ class MusicCommands(commands.Cog):
         if level is None:
             embed = create_embed(
                 "🔊 Volume",
-                f"Current volume: {guild_data['volume']}%",
+                f"Current volume: {guild_data.volume}%",
                 COLOR,
                 self.bot.user,
             )
         else:
             level = max(0, min(100, level))
-            guild_data["volume"] = level
 
-            if guild_data["voice_client"] and guild_data["voice_client"].source:
-                guild_data["voice_client"].source.volume = level / 100
+            if level != guild_data.volume:
+                guild_data.volume = level
+
+                if guild_data.voice_client and guild_data.voice_client.source:
+                    guild_data.voice_client.source.volume = level / 100
+
+                self.bot.schedule_save_guild_queue(interaction.guild.id)
 
             embed = create_embed(
                 "🔊 Volume", f"Volume set to {level}%", COLOR, self.bot.user
             )
-            await self.bot.save_guild_queue(interaction.guild.id)
 
         await interaction.response.send_message(embed=embed)
 
@@ -1049,17 +1195,17 @@ class MusicCommands(commands.Cog):
         if not await self.check_voice_channel(interaction):
             return
 
-        self.queue_service.set_loop_mode(interaction.guild.id, mode)
+        changed = self.queue_service.set_loop_mode(interaction.guild.id, mode)
 
-        mode_emojis = {"off": "🔄", "song": "🔂", "queue": "🔁"}
         embed = create_embed(
-            f"{mode_emojis.get(mode, '🔄')} Loop Mode",
+            f"{LOOP_MODE_EMOJIS.get(mode, '🔄')} Loop Mode",
             f"Loop mode set to: **{mode.title()}**",
             COLOR,
             self.bot.user,
         )
 
-        await self.bot.save_guild_queue(interaction.guild.id)
+        if changed:
+            self.bot.schedule_save_guild_queue(interaction.guild.id)
         await interaction.response.send_message(embed=embed)
 
     @discord.app_commands.command(name="shuffle", description="Toggle shuffle mode")
@@ -1076,7 +1222,7 @@ class MusicCommands(commands.Cog):
             self.bot.user,
         )
 
-        await self.bot.save_guild_queue(interaction.guild.id)
+        self.bot.schedule_save_guild_queue(interaction.guild.id)
         await interaction.response.send_message(embed=embed)
 
     @discord.app_commands.command(
@@ -1089,42 +1235,36 @@ class MusicCommands(commands.Cog):
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
         self.queue_service.clear_queue(interaction.guild.id)
-        guild_data["current"] = None
-        guild_data["start_time"] = None
+        guild_data.current = None
+        guild_data.start_time = None
 
-        if guild_data["voice_client"] and (
-                guild_data["voice_client"].is_playing()
-                or guild_data["voice_client"].is_paused()
-        ):
-            guild_data["voice_client"].stop()
+        if is_voice_active(guild_data.voice_client):
+            guild_data.voice_client.stop()
 
-        await self.bot.clear_guild_queue_from_db(interaction.guild.id)
-
-        embed = create_embed(
-            "Stopped", "Playback stopped and queue cleared.", COLOR, self.bot.user
+        embed = create_embed("Stopped", "Playback stopped and queue cleared.", COLOR, self.bot.user)
+        await asyncio.gather(
+            self.bot.clear_guild_queue_from_db(interaction.guild.id),
+            interaction.response.send_message(embed=embed),
         )
-        await interaction.response.send_message(embed=embed)
 
     @discord.app_commands.command(
         name="clear", description="Clear the queue without stopping current song"
     )
     async def clear_slash(self, interaction: discord.Interaction):
-        if not await self.check_voice_channel(interaction):
+        guild_data = self.bot.get_guild_data(interaction.guild.id)
+
+        if not guild_data.queue and not guild_data.loop_backup:
+            embed = create_embed("Error", "Queue is already empty!", COLOR, self.bot.user)
+            await interaction.response.send_message(embed=embed)
             return
 
-        guild_data = self.bot.get_guild_data(interaction.guild.id)
+        if not await self.check_voice_channel(interaction):
+            return
 
-        if not guild_data["queue"] and not guild_data["loop_backup"]:
-            embed = create_embed(
-                "Error", "Queue is already empty!", COLOR, self.bot.user
-            )
-        else:
-            self.queue_service.clear_queue(interaction.guild.id)
-            embed = create_embed(
-                "Queue Cleared", f"Removed all songs from queue.", COLOR, self.bot.user
-            )
+        self.queue_service.clear_queue(interaction.guild.id)
+        embed = create_embed("Queue Cleared", "Removed all songs from queue.", COLOR, self.bot.user)
 
-        await self.bot.save_guild_queue(interaction.guild.id)
+        self.bot.schedule_save_guild_queue(interaction.guild.id)
         await interaction.response.send_message(embed=embed)
 
     @discord.app_commands.command(
@@ -1136,26 +1276,24 @@ class MusicCommands(commands.Cog):
 
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        if guild_data["voice_client"]:
-            guild_data["intentional_disconnect"] = True
+        if guild_data.voice_client:
+            guild_data.intentional_disconnect = True
 
-            await guild_data["voice_client"].disconnect()
-            guild_data["voice_client"] = None
+            voice_client = guild_data.voice_client
+            guild_data.voice_client = None
             self.queue_service.clear_queue(interaction.guild.id)
-            guild_data["current"] = None
-            guild_data["start_time"] = None
-
-            await self.bot.clear_guild_queue_from_db(interaction.guild.id)
-
-            embed = create_embed(
-                "Disconnected", "Left the voice channel.", COLOR, self.bot.user
+            guild_data.current = None
+            guild_data.start_time = None
+
+            embed = create_embed("Disconnected", "Left the voice channel.", COLOR, self.bot.user)
+            await asyncio.gather(
+                voice_client.disconnect(),
+                self.bot.clear_guild_queue_from_db(interaction.guild.id),
+                interaction.response.send_message(embed=embed),
             )
         else:
-            embed = create_embed(
-                "Error", "Not connected to a voice channel!", COLOR, self.bot.user
-            )
-
-        await interaction.response.send_message(embed=embed)
+            embed = create_embed("Error", "Not connected to a voice channel!", COLOR, self.bot.user)
+            await interaction.response.send_message(embed=embed)
 
     @discord.app_commands.command(
         name="nowplaying", description="Show the currently playing song"
@@ -1163,43 +1301,54 @@ class MusicCommands(commands.Cog):
     async def nowplaying_slash(self, interaction: discord.Interaction):
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        if not guild_data["current"]:
+        if not guild_data.current:
             embed = create_embed(
-                "❌ Nothing Playing",
-                "No song is currently playing!",
-                COLOR,
-                self.bot.user,
+                "❌ Nothing Playing", "No song is currently playing!", COLOR, self.bot.user
             )
             await interaction.response.send_message(embed=embed)
             return
 
-        current = guild_data["current"]
+        current = guild_data.current
+        vc = guild_data.voice_client
         current_position = self.playback_service.get_current_position(
             interaction.guild.id
         )
 
-        progress = build_progress_bar(current_position, current.duration)
-
-        if self.playback_service.is_paused(interaction.guild.id):
+        if vc and vc.is_paused():
             status = "Paused"
-            status_emoji = "⏸️"
-        elif guild_data["voice_client"] and guild_data["voice_client"].is_playing():
+        elif vc and vc.is_playing():
             status = "Playing"
-            status_emoji = "🎵"
         else:
             status = "Stopped"
-            status_emoji = "⏹️"
+        status_emoji = STATUS_EMOJIS[status]
+
+        key = (
+            current.webpage_url,
+            current_position,
+            status,
+            guild_data.volume,
+            guild_data.loop_mode,
+            guild_data.shuffle,
+            guild_data.queue.version,
+        )
+        now = time.monotonic()
+        cached = self._np_embed_cache.get(interaction.guild.id)
+        if cached and cached[1] == key and now - cached[0] < 1.0:
+            await interaction.response.send_message(embed=cached[2])
+            return
+
+        progress = build_progress_bar(current_position, current.duration)
 
         embed = create_embed(
             f"{status_emoji} Now {status}",
             f"**{current.title}**\n"
             f"*by {current.uploader}*\n\n"
             f"`{format_duration(current_position)} {progress} {format_duration(current.duration)}`\n\n"
-            f"🔊 Volume: {guild_data['volume']}%\n"
-            f"🔁 Loop: {guild_data['loop_mode'].title()}\n"
-            f"🔀 Shuffle: {'On' if guild_data['shuffle'] else 'Off'}\n"
+            f"🔊 Volume: {guild_data.volume}%\n"
+            f"🔁 Loop: {guild_data.loop_mode.title()}\n"
+            f"🔀 Shuffle: {'On' if guild_data.shuffle else 'Off'}\n"
             f"📝 Requested by: {current.requested_by}\n"
-            f"📋 Queue length: {len(guild_data['queue'])}",
+            f"📋 Queue length: {len(guild_data.queue)}",
             COLOR,
             self.bot.user,
         )
@@ -1207,6 +1356,7 @@ class MusicCommands(commands.Cog):
         if current.thumbnail:
             embed.set_thumbnail(url=current.thumbnail)
 
+        self._np_embed_cache[interaction.guild.id] = (now, key, embed)
         await interaction.response.send_message(embed=embed)
 
     @discord.app_commands.command(
@@ -1214,45 +1364,33 @@ class MusicCommands(commands.Cog):
     )
     @discord.app_commands.describe(position="Position of the song to remove (1-based)")
     async def remove_slash(self, interaction: discord.Interaction, position: int):
-        if not await self.check_voice_channel(interaction):
-            return
-
-        guild_data = self.bot.get_guild_data(interaction.guild.id)
-
-        visible_songs = self.queue_service.get_visible_queue(interaction.guild.id)
-
-        if not visible_songs:
+        if not self.queue_service.get_visible_queue(interaction.guild.id):
             embed = create_embed("Error", "Queue is empty!", COLOR, self.bot.user)
             await interaction.response.send_message(embed=embed)
             return
 
-        if position < 1 or position > len(visible_songs):
-            embed = create_embed(
-                "Error",
-                f"Invalid position! Visible queue has {len(visible_songs)} songs.",
-                COLOR,
-                self.bot.user,
-            )
-            await interaction.response.send_message(embed=embed)
+        if not await self.check_voice_channel(interaction):
             return
 
-        song_to_remove = visible_songs[position - 1]
-        actual_queue_size = len(guild_data["queue"])
-        removed_song = None
-
-        if position <= actual_queue_size:
-            removed_song = self.queue_service.remove_song_from_queue(
-                interaction.guild.id, position - 1
-            )
-
-        guild_data["loop_backup"] = [
-            song
-            for song in guild_data["loop_backup"]
-            if song.webpage_url != song_to_remove.webpage_url
-        ]
+        removed_song = self.queue_service.remove_visible(
+            interaction.guild.id, position - 1
+        )
 
         if not removed_song:
-            removed_song = song_to_remove
+            visible_count = len(
+                self.queue_service.get_visible_queue(interaction.guild.id)
+            )
+            if not visible_count:
+                embed = create_embed("Error", "Queue is empty!", COLOR, self.bot.user)
+            else:
+                embed = create_embed(
+                    "Error",
+                    f"Invalid position! Visible queue has {visible_count} songs.",
+                    COLOR,
+                    self.bot.user,
+                )
+            await interaction.response.send_message(embed=embed)
+            return
 
         embed = create_embed(
             "Song Removed",
@@ -1261,7 +1399,7 @@ class MusicCommands(commands.Cog):
             self.bot.user,
         )
 
-        await self.bot.save_guild_queue(interaction.guild.id)
+        self.bot.schedule_save_guild_queue(interaction.guild.id)
         await interaction.response.send_message(embed=embed)
 
     @discord.app_commands.command(
@@ -1273,17 +1411,17 @@ class MusicCommands(commands.Cog):
     async def move_slash(
             self, interaction: discord.Interaction, from_pos: int, to_pos: int
     ):
-        if not await self.check_voice_channel(interaction):
-            return
-
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        if not guild_data["queue"]:
+        if not guild_data.queue:
             embed = create_embed("❌ Error", "Queue is empty!", COLOR, self.bot.user)
             await interaction.response.send_message(embed=embed)
             return
 
-        queue_length = len(guild_data["queue"])
+        if not await self.check_voice_channel(interaction):
+            return
+
+        queue_length = len(guild_data.queue)
         if (
                 from_pos < 1
                 or from_pos > queue_length
@@ -1302,7 +1440,7 @@ class MusicCommands(commands.Cog):
         from_pos -= 1
         to_pos -= 1
 
-        song = guild_data["queue"][from_pos]
+        song = guild_data.queue[from_pos]
         self.queue_service.move_song_in_queue(interaction.guild.id, from_pos, to_pos)
 
         embed = create_embed(
@@ -1312,7 +1450,7 @@ class MusicCommands(commands.Cog):
             self.bot.user,
         )
 
-        await self.bot.save_guild_queue(interaction.guild.id)
+        self.bot.schedule_save_guild_queue(interaction.guild.id)
         await interaction.response.send_message(embed=embed)
 
     @discord.app_commands.command(
@@ -1329,75 +1467,20 @@ class MusicCommands(commands.Cog):
         await interaction.response.send_message(embed=searching_embed)
 
         try:
-            loop = asyncio.get_event_loop()
-            data = await loop.run_in_executor(
-                self.bot.executor,
-                lambda: self.bot.ytdl.extract_info(
-                    f"ytsearch5:{query}", download=False
-                ),
-            )
-
-            if not data or "entries" not in data or not data["entries"]:
-                embed = create_embed(
-                    "❌ Error", "No results found!", COLOR, self.bot.user
-                )
-                await interaction.edit_original_response(embed=embed)
-                return
-
-            valid_entries = []
-            for entry in data["entries"]:
-                if not entry:
-                    continue
-
-                title = entry.get("title") or entry.get("alt_title")
-                if not title:
-                    continue
-                entry["title"] = title
-
-                webpage_url = entry.get("webpage_url")
-                url = entry.get("url")
-                video_id = entry.get("id")
-
-                if not webpage_url:
-                    if isinstance(url, str) and url.startswith("http"):
-                        webpage_url = url
-                    elif video_id:
-                        webpage_url = f"https://www.youtube.com/watch?v={video_id}"
-
-                if not webpage_url:
-                    continue
-
-                entry["webpage_url"] = webpage_url
-
-                if "url" not in entry or not entry["url"]:
-                    entry["url"] = webpage_url
-
-                valid_entries.append(entry)
+            valid_entries = await self.music_service.search_youtube_entries(query)
 
             if not valid_entries:
-                embed = create_embed(
-                    "❌ Error", "No valid results found!", COLOR, self.bot.user
-                )
+                embed = create_embed("❌ Error", "No results found!", COLOR, self.bot.user)
                 await interaction.edit_original_response(embed=embed)
                 return
 
-            description = ""
-            for i, entry in enumerate(valid_entries[:5], 1):
-                duration = entry.get("duration", 0)
-                if duration:
-                    minutes, seconds = divmod(int(duration), 60)
-                    duration_str = f"{minutes}:{seconds:02d}"
-                else:
-                    duration_str = "0:00"
-
-                title = entry["title"]
-                if len(title) > 50:
-                    title = title[:47] + "..."
-
-                description += f"`{i}.` **{title}**\n"
-                description += (
-                    f"    by {entry.get('uploader', 'Unknown')} • {duration_str}\n\n"
-                )
+            description = "".join(
+                f"`{i}.` **{title if len(title) <= 50 else title[:47] + '...'}**\n"
+                f"    by {entry.get('uploader', 'Unknown')} • "
+                f"{format_duration(int(entry.get('duration') or 0))}\n\n"
+                for i, entry in enumerate(valid_entries[:5], 1)
+                for title in (entry["title"],)
+            )
 
             embed = create_embed("🔍 Search Results", description, COLOR, self.bot.user)
 
@@ -1418,15 +1501,15 @@ class MusicCommands(commands.Cog):
         try:
             guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-            if not guild_data.get("music_channel_id"):
-                guild_data["music_channel_id"] = interaction.channel.id
-                await self.bot.save_guild_music_channel(
+            if not guild_data.music_channel_id:
+                guild_data.music_channel_id = interaction.channel.id
+                self.bot.schedule_save_guild_music_channel(
                     interaction.guild.id, interaction.channel.id
                 )
 
             if (
-                    not guild_data["voice_client"]
-                    or not guild_data["voice_client"].is_connected()
+                    not guild_data.voice_client
+                    or not guild_data.voice_client.is_connected()
             ):
                 if not interaction.user.voice:
                     embed = create_embed(
@@ -1436,22 +1519,19 @@ class MusicCommands(commands.Cog):
                     return
 
                 try:
-                    guild_data["voice_client"] = (
+                    guild_data.voice_client = (
                         await interaction.user.voice.channel.connect()
                     )
                 except Exception as e:
                     logger.error(f"Failed to connect to voice: {e}")
                     embed = create_embed(
-                        "Error",
-                        "Failed to connect to voice channel!",
-                        COLOR,
-                        self.bot.user,
+                        "Error", "Failed to connect to voice channel!", COLOR, self.bot.user
                     )
                     await interaction.edit_original_response(embed=embed, view=None)
                     return
-            elif guild_data["voice_client"].channel != interaction.user.voice.channel:
+            elif guild_data.voice_client.channel != interaction.user.voice.channel:
                 try:
-                    await guild_data["voice_client"].move_to(
+                    await guild_data.voice_client.move_to(
                         interaction.user.voice.channel
                     )
                 except Exception as e:
@@ -1460,8 +1540,7 @@ class MusicCommands(commands.Cog):
             song = Song(selected_song)
             song.requested_by = interaction.user.mention
 
-            existing_urls = get_existing_urls(guild_data)
-            if song.webpage_url in existing_urls:
+            if is_url_in_guild(guild_data, song.webpage_url):
                 embed = create_embed(
                     "Duplicate Song",
                     "This song is already in queue or playing!",
@@ -1474,13 +1553,13 @@ class MusicCommands(commands.Cog):
             self.queue_service.add_song_to_queue(interaction.guild.id, song)
 
             if (
-                    not guild_data["voice_client"].is_playing()
-                    and not guild_data["current"]
+                    not guild_data.voice_client.is_playing()
+                    and not guild_data.current
             ):
                 await self.playback_service.play_next(interaction.guild.id)
                 embed = create_embed("🎵 Now Playing", str(song), COLOR, self.bot.user)
             else:
-                position = len(guild_data["queue"])
+                position = len(guild_data.queue)
                 embed = create_embed(
                     "📋 Added to Queue",
                     f"{song}\n\nPosition in queue: {position}",
@@ -1492,14 +1571,12 @@ class MusicCommands(commands.Cog):
                 embed.set_thumbnail(url=song.thumbnail)
 
             await interaction.edit_original_response(embed=embed, view=None)
-            guild_data["last_activity"] = datetime.now()
-            await self.bot.save_guild_queue(interaction.guild.id)
+            guild_data.last_activity = time.monotonic()
+            self.bot.schedule_save_guild_queue(interaction.guild.id)
 
         except Exception as e:
             logger.error(f"Error processing selected song: {e}")
-            embed = create_embed(
-                "❌ Error", "Failed to add song to queue.", COLOR, self.bot.user
-            )
+            embed = create_embed("❌ Error", "Failed to add song to queue.", COLOR, self.bot.user)
             try:
                 await interaction.edit_original_response(embed=embed, view=None)
             except discord.HTTPException:
@@ -1511,8 +1588,8 @@ class MusicCommands(commands.Cog):
     async def set_music_channel_slash(self, interaction: discord.Interaction):
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        old_channel_id = guild_data.get("music_channel_id")
-        guild_data["music_channel_id"] = interaction.channel.id
+        old_channel_id = guild_data.music_channel_id
+        guild_data.music_channel_id = interaction.channel.id
         await self.bot.save_guild_music_channel(
             interaction.guild.id, interaction.channel.id
         )
@@ -1553,43 +1630,28 @@ class MusicCommands(commands.Cog):
         if not await self.check_voice_channel(interaction):
             return
 
-        guild_data = self.bot.get_guild_data(interaction.guild.id)
+        guild_id = interaction.guild.id
+        guild_data = self.bot.get_guild_data(guild_id)
+        voice_client = guild_data.voice_client
 
-        if not guild_data["current"]:
-            embed = create_embed(
-                "Error", "No song is currently playing!", COLOR, self.bot.user
-            )
+        if not guild_data.current:
+            embed = create_embed("Error", "No song is currently playing!", COLOR, self.bot.user)
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        if (
-                not guild_data["voice_client"]
-                or not guild_data["voice_client"].is_connected()
-        ):
-            embed = create_embed(
-                "Error", "Bot is not connected to voice!", COLOR, self.bot.user
-            )
+        if not voice_client or not voice_client.is_connected():
+            embed = create_embed("Error", "Bot is not connected to voice!", COLOR, self.bot.user)
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        if not (
-                guild_data["voice_client"].is_playing()
-                or guild_data["voice_client"].is_paused()
-        ):
-            if guild_data["current"]:
-                try:
-                    await self.playback_service.play_next(interaction.guild.id)
-                    await asyncio.sleep(0.5)
-                except:
-                    pass
+        if not is_voice_active(voice_client):
+            try:
+                await self.playback_service.play_next(guild_id)
+            except:
+                pass
 
-            if not (
-                    guild_data["voice_client"].is_playing()
-                    or guild_data["voice_client"].is_paused()
-            ):
-                embed = create_embed(
-                    "Error", "No song is currently playing!", COLOR, self.bot.user
-                )
+            if not is_voice_active(voice_client):
+                embed = create_embed("Error", "No song is currently playing!", COLOR, self.bot.user)
                 await interaction.response.send_message(embed=embed, ephemeral=True)
                 return
 
@@ -1600,237 +1662,176 @@ class MusicCommands(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        current_song = guild_data["current"]
+        current_song = guild_data.current
         if seek_seconds < 0:
             seek_seconds = 0
         elif current_song.duration > 0 and seek_seconds >= current_song.duration - 5:
             seek_seconds = max(0, current_song.duration - 5)
 
-        if guild_data.get("seeking", False):
-            embed = create_embed(
-                "Error", "Already seeking, please wait...", COLOR, self.bot.user
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
+        # Latest seek wins: older seeks still waiting on the lock or an extraction bail out
+        guild_data.seek_generation += 1
+        generation = guild_data.seek_generation
 
-        was_paused = guild_data["voice_client"].is_paused()
+        was_paused = voice_client.is_paused()
         await interaction.response.defer()
-        async with guild_data["play_lock"]:
-            try:
-                guild_data["seeking"] = True
-                guild_data["seeking_start_time"] = asyncio.get_event_loop().time()
 
-                seek_embed = create_embed(
-                    "Seeking...",
-                    f"Seeking to {format_duration(seek_seconds)} in **{current_song.title}**",
-                    COLOR,
-                    self.bot.user,
+        guild_data.seeking = True
+        guild_data.seeking_start_time = time.monotonic()
+        advance_queue = False
+        try:
+            seek_embed = create_embed(
+                "Seeking...",
+                f"Seeking to {format_duration(seek_seconds)} in **{current_song.title}**",
+                COLOR,
+                self.bot.user,
+            )
+            await interaction.followup.send(embed=seek_embed)
+
+            # Extraction and the ffmpeg warm-up run outside play_lock; only the
+            # swap itself is serialised, and newer seeks make older ones bail out
+            fresh_data = None
+            for attempt in range(3):
+                if attempt:
+                    await asyncio.sleep(0.1 * 2 ** (attempt - 1))
+                try:
+                    fresh_data = await self.bot.get_song_info_cached(
+                        current_song.webpage_url
+                    )
+                    if fresh_data and fresh_data.get("url"):
+                        break
+                except Exception as e:
+                    logger.warning(
+                        f"Stream extraction attempt {attempt + 1} failed: {e}"
+                    )
+
+            if guild_data.seek_generation != generation:
+                await interaction.edit_original_response(embed=self._seek_superseded_embed())
+                return
+
+            if not fresh_data or not fresh_data.get("url"):
+                embed = create_embed(
+                    "Error", "Failed to seek - could not get fresh stream URL", COLOR, self.bot.user
+                )
+                await interaction.edit_original_response(embed=embed)
+                return
+
+            ffmpeg_options = {
+                "before_options": SEEK_BEFORE_OPTIONS.format(seek_seconds)
+                + self.bot.ffmpeg_options["before_options"],
+                "options": SEEK_OPTIONS,
+            }
+
+            try:
+                source = await self.playback_service.open_warm_source(
+                    fresh_data["url"], guild_data.volume / 100, ffmpeg_options
                 )
-                await interaction.followup.send(embed=seek_embed)
+            except Exception as e:
+                # A cached stream URL may have expired; re-extract once and retry
+                logger.warning(f"Seek failed, retrying with a fresh stream URL: {e}")
+                fresh_data = await self.bot.refresh_song_info(current_song.webpage_url)
+                if not fresh_data or not fresh_data.get("url"):
+                    raise
+                source = await self.playback_service.open_warm_source(
+                    fresh_data["url"], guild_data.volume / 100, ffmpeg_options
+                )
+
+            def after_seeking(error):
+                if error:
+                    logger.error(f"Seek player error: {error}")
+
+                # A newer seek is replacing this source; it decides what plays next
+                if guild_data.seeking:
+                    return
 
+                if not error and guild_data.current:
+                    self.queue_service.add_to_history(guild_id, guild_data.current)
+                self.playback_service.schedule_play_next(guild_id)
+
+            async with guild_data.play_lock:
                 if (
-                        guild_data["voice_client"].is_playing()
-                        or guild_data["voice_client"].is_paused()
+                        guild_data.seek_generation != generation
+                        or guild_data.current is not current_song
                 ):
-                    guild_data["voice_client"].stop()
+                    self.playback_service.discard_source(source)
+                    superseded = True
+                else:
+                    superseded = False
+                    guild_data.seek_offset = seek_seconds
+                    guild_data.start_time = time.monotonic()
 
-                await asyncio.sleep(0.2)
+                    # Swap into the running player so the old ffmpeg is only torn
+                    # down once the new one is already producing audio
+                    if not self.playback_service.swap_source(guild_id, source):
+                        guild_data.voice_client.play(source, after=after_seeking)
 
-                fresh_data = None
-                for attempt in range(3):
-                    try:
-                        fresh_data = await self.bot.get_song_info_cached(
-                            current_song.webpage_url
-                        )
-                        if fresh_data and fresh_data.get("url"):
-                            break
-                        await asyncio.sleep(0.5)
-                    except Exception as e:
-                        logger.warning(
-                            f"Stream extraction attempt {attempt + 1} failed: {e}"
-                        )
-                        if attempt < 2:
-                            await asyncio.sleep(1)
+                    if was_paused:
+                        guild_data.voice_client.pause()
+                        guild_data.pause_position = seek_seconds
 
-                if not fresh_data or not fresh_data.get("url"):
-                    embed = create_embed(
-                        "Error",
-                        "Failed to seek - could not get fresh stream URL",
-                        COLOR,
-                        self.bot.user,
-                    )
-                    await interaction.edit_original_response(embed=embed)
-                    return
+            if superseded:
+                await interaction.edit_original_response(embed=self._seek_superseded_embed())
+                return
 
-                seek_strategies = [
-                    {
-                        "before_options": f"-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5 -ss {seek_seconds} -nostdin -user_agent 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:133.0) Gecko/20100101 Firefox/133.0'",
-                        "options": "-vn -bufsize 1024k",
-                    },
-                    {
-                        "before_options": "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5 -nostdin -user_agent 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:133.0) Gecko/20100101 Firefox/133.0'",
-                        "options": f"-vn -ss {seek_seconds} -bufsize 1024k",
-                    },
-                    {
-                        "before_options": "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5 -nostdin",
-                        "options": "-vn",
-                    },
-                ]
-
-                source = None
-                strategy_used = 0
-
-                for i, ffmpeg_options in enumerate(seek_strategies):
-                    try:
-                        source = discord.PCMVolumeTransformer(
-                            discord.FFmpegPCMAudio(fresh_data["url"], **ffmpeg_options),
-                            volume=guild_data["volume"] / 100,
-                        )
-                        strategy_used = i
-                        break
-                    except Exception as e:
-                        logger.warning(f"Seek strategy {i + 1} failed: {e}")
-                        if i < len(seek_strategies) - 1:
-                            continue
-                        else:
-                            raise e
-
-                if not source:
-                    embed = create_embed(
-                        "Error",
-                        "Failed to seek - stream format not supported",
-                        COLOR,
-                        self.bot.user,
-                    )
-                    await interaction.edit_original_response(embed=embed)
-                    return
+            success_embed = create_embed(
+                "Seeked",
+                f"Moved to {format_duration(seek_seconds)} in **{current_song.title}**",
+                COLOR,
+                self.bot.user,
+            )
+            await interaction.edit_original_response(embed=success_embed)
 
-                guild_data["seek_offset"] = seek_seconds if strategy_used == 0 else 0
-                guild_data["start_time"] = datetime.now()
+            guild_data.message_ready_for_timestamps = True
+            self.playback_service.start_timestamp_updates(guild_id)
 
-                def after_seeking(error):
-                    if error:
-                        logger.error(f"Seek player error: {error}")
-                    else:
-                        if guild_data["current"] and not guild_data.get(
-                                "seeking", False
-                        ):
-                            self.queue_service.add_to_history(
-                                interaction.guild.id, guild_data["current"]
-                            )
-
-                    if not guild_data.get("seeking", False):
-                        coro = self.playback_service.play_next(interaction.guild.id)
-                        fut = asyncio.run_coroutine_threadsafe(coro, self.bot.loop)
-                        fut.add_done_callback(lambda f: f.exception())
-
-                guild_data["voice_client"].play(source, after=after_seeking)
-
-                if was_paused:
-                    await asyncio.sleep(0.2)
-                    guild_data["voice_client"].pause()
-                    guild_data["pause_position"] = seek_seconds
-
-                success_embed = create_embed(
-                    "Seeked",
-                    f"Moved to {format_duration(seek_seconds)} in **{current_song.title}**"
-                    + (f" (strategy {strategy_used + 1})" if strategy_used > 0 else ""),
+        except Exception as e:
+            logger.error(f"Seek error: {e}")
+            if guild_data.seek_generation != generation:
+                await interaction.edit_original_response(embed=self._seek_superseded_embed())
+                return
+
+            try:
+                async with guild_data.play_lock:
+                    if is_voice_active(guild_data.voice_client):
+                        guild_data.voice_client.stop()
+                    # play_lock is held here, so restart directly rather than through
+                    # play_next; the now-playing message already shows this song
+                    if not await self.playback_service.restart_song(
+                            guild_id, current_song, notify=False
+                    ):
+                        raise RuntimeError("restart failed")
+                embed = create_embed(
+                    "Seek Failed",
+                    "Could not seek, restarted song from beginning",
                     COLOR,
                     self.bot.user,
                 )
-                await interaction.edit_original_response(embed=success_embed)
-
-                guild_data["message_ready_for_timestamps"] = True
-
-            except Exception as e:
-                logger.error(f"Seek error: {e}")
-                try:
-                    guild_data["seek_offset"] = 0
-                    guild_data["start_time"] = datetime.now()
-                    await self.playback_service.play_next(interaction.guild.id)
-                    embed = create_embed(
-                        "Seek Failed",
-                        "Could not seek, restarted song from beginning",
-                        COLOR,
-                        self.bot.user,
-                    )
-                except:
-                    embed = create_embed(
-                        "Error",
-                        "Failed to seek and could not recover playback",
-                        COLOR,
-                        self.bot.user,
-                    )
-                await interaction.edit_original_response(embed=embed)
-            finally:
-                guild_data["seeking"] = False
-                if "seeking_start_time" in guild_data:
-                    del guild_data["seeking_start_time"]
+            except:
+                advance_queue = True
+                embed = create_embed(
+                    "Error", "Failed to seek and could not recover playback", COLOR, self.bot.user
+                )
+            await interaction.edit_original_response(embed=embed)
+        finally:
+            # Only the newest seek owns the flag
+            if guild_data.seek_generation == generation:
+                guild_data.seeking = False
+                guild_data.seeking_start_time = None
+            # play_next is a no-op while seeking, so only move on once the flag is clear
+            if advance_queue:
+                self.playback_service.spawn_play_next(guild_id)
 
     @discord.app_commands.command(
         name="help", description="Show all available commands and how to use them"
     )
     async def help_slash(self, interaction: discord.Interaction):
-        description = """**Music Bot Commands Guide**
-
-        **Basic Commands:**
-        `/join` - Join your voice channel
-        `/play <query>` - Play a song or add it to queue (supports YouTube URLs, Spotify links, or search terms)
-        `/pause` - Pause the current song
-        `/resume` - Resume the paused song
-        `/skip` - Skip the current song
-        `/previous` - Play the previous song from history
-        `/autoplay` - Auto play related songs after queue
-        `/stop` - Stop playback and clear queue
-        `/leave` - Disconnect from voice channel
-
-        **Queue Management:**
-        `/queue [page]` - Show the current queue (paginated)
-        `/clear` - Clear the queue without stopping current song
-        `/remove <position>` - Remove a song from queue by position
-        `/move <from_pos> <to_pos>` - Move a song to different position
-        `/skipto <position>` - Skip to a specific song in queue
-
-        **Playback Controls:**
-        `/volume [level]` - Set or show volume (0-100)
-        `/loop <mode>` - Set loop mode: off, song, or queue
-        `/shuffle` - Toggle shuffle mode
-        `/seek <position>` - Seek to specific time (e.g., '1:30', '90', etc)
-        `/nowplaying` - Show currently playing song info
-
-        **Search & Discovery:**
-        `/search <query>` - Search for songs and choose which to play
-        `/history show [page]` - Show recently played songs
-        `/history play <number>` - Play a song from history by number
-        `/history add_all` - Add all songs from history to queue
-        `/history clear` - Clear all history songs
-
-        **Playlist Commands: (your playlist(s) are guild specific)**
-        `/playlist create <name>` - Create a new empty playlist
-        `/playlist add <name> <song>` - Add a song to playlist by searching
-        `/playlist add-from-queue <name> <from_queue>` - Add song from current queue to playlist
-        `/playlist add-all-queue <name>` - Add entire current queue to playlist
-        `/playlist remove <name> <position>` - Remove a song from playlist
-        `/playlist move <name> <from_pos> <to_pos>` - Move song in playlist
-        `/playlist load <name>` - Load a playlist into the queue
-        `/playlist show <name> [page]` - Show songs in a playlist
-        `/playlist list` - List all your playlists
-        `/playlist delete <name>` - Delete a playlist
-
-        **Settings:**
-        `/setmusicchannel` - Set the channel for music messages
-
-        **Tips:**
-        • Use reaction controls on the 'Now Playing' message: 
-        ⏯️ Pause/Resume, ⏭️ Skip, ⏮️ Previous, 🔀 Shuffle, 🔁 Loop, ⏹️ Stop, 🔊/🔉 Volume
-        • Supports YouTube URLs, YouTube playlists, Spotify links, and search queries
-        • Queue persists across bot restarts
-        • You must be in the same voice channel as the bot to control playback
-        • Duplicates are not allowed
-        """
-
-        embed = create_embed("Command Guide", description, COLOR, self.bot.user)
-        await interaction.response.send_message(embed=embed)
+        # Built once after login (the footer needs bot.user) and sent as-is;
+        # a send-time timestamp would mean copying the largest embed in the cog
+        if self._help_embed is None:
+            embed = create_embed("Command Guide", HELP_DESCRIPTION, COLOR, self.bot.user)
+            embed.timestamp = None
+            self._help_embed = embed
+
+        await interaction.response.send_message(embed=self._help_embed)
 
     async def cog_app_command_error(
             self,
@@ -1848,10 +1849,7 @@ class MusicCommands(commands.Cog):
             )
         else:
             embed = create_embed(
-                "❌ Error",
-                "An unexpected error occurred. Please try again.",
-                COLOR,
-                self.bot.user,
+                "❌ Error", "An unexpected error occurred. Please try again.", COLOR, self.bot.user
             )
 
         try:
@@ -1895,15 +1893,18 @@ class MusicCommands(commands.Cog):
     @commands.command(name="listbanned")
     @commands.is_owner()
     async def list_banned(self, ctx):
-        try:
-            with open("banned_users.txt", "r") as f:
-                banned_ids = [line.strip() for line in f.readlines() if line.strip()]
+        banned_ids = get_banned_ids()
 
-            if not banned_ids:
-                await ctx.send("No banned users.")
-                return
+        if not banned_ids:
+            await ctx.send("No banned users.")
+            return
 
-            msg = "Banned users:\n" + "\n".join(banned_ids)
+        msg = "Banned users:\n" + "\n".join(map(str, banned_ids))
+        if len(msg) > 1900:
+            # Too long for one message; send it as a single attachment instead
+            await ctx.send(
+                f"{len(banned_ids)} banned users:",
+                file=discord.File(io.BytesIO(msg.encode()), filename="banned.txt"),
+            )
+        else:
             await ctx.send(msg)
-        except FileNotFoundError:
-            await ctx.send("No banned users.")
@@ -1,9 +1,12 @@
 import discord
 from discord.ext import commands
-import json
+import itertools
+import orjson
 import logging
-from typing import List
-from datetime import datetime
+import re
+import sqlite3
+from typing import List, Tuple
+import time
 
 from models.song import Song
 
@@ -11,7 +14,7 @@ from services.queue_service import QueueService
 from services.playback_service import PlaybackService
 from services.music_service import MusicService
 
-from utils.helpers import get_existing_urls, interaction_check, create_embed
+from utils.helpers import is_url_in_guild, interaction_check, create_embed
 
 from config import COLOR, MAX_PLAYLIST_SIZE, SONGS_PER_PAGE
 
@@ -19,6 +22,10 @@ from views.pagination import PaginationView
 
 logger = logging.getLogger(__name__)
 
+PLAYLIST_URL_KIND_RE = re.compile(
+    r"(youtube\.com).*?playlist|spotify\.com.*?(playlist|album)", re.IGNORECASE
+)
+
 
 class PlaylistCommands(commands.Cog):
     def __init__(self, bot):
@@ -65,13 +72,134 @@ class PlaylistCommands(commands.Cog):
 
         try:
             songs_json = result[0][0]
-            return json.loads(songs_json) if songs_json else []
-        except (json.JSONDecodeError, IndexError, KeyError) as e:
+            return orjson.loads(songs_json) if songs_json else []
+        except (orjson.JSONDecodeError, IndexError, KeyError) as e:
             logger.error(f"Error parsing playlist data: {e}")
             embed = create_embed("Error", "Playlist data is corrupted", COLOR, self.bot.user)
             await send(embed=embed)
             return None
 
+    async def _get_playlist_song_rows(
+            self,
+            interaction: discord.Interaction,
+            name: str,
+    ) -> List[Tuple] | None:
+        """Walk the stored array with json_each; rows are (song_json, webpage_url) in playlist order"""
+        try:
+            rows = await self.bot.fetch_db_query(
+                """
+                SELECT je.value,
+                       CASE WHEN je.type = 'object'
+                            THEN json_extract(je.value, '$.webpage_url')
+                       END
+                FROM playlists p
+                LEFT JOIN json_each(NULLIF(p.songs, '')) je
+                WHERE p.user_id = ?
+                  AND p.guild_id = ?
+                  AND p.name = ?
+                ORDER BY je.key
+                LIMIT ?
+                """,
+                (interaction.user.id, interaction.guild.id, name, MAX_PLAYLIST_SIZE),
+            )
+        except sqlite3.OperationalError as e:
+            logger.error(f"Error parsing playlist data: {e}")
+            embed = create_embed("Error", "Playlist data is corrupted", COLOR, self.bot.user)
+            await interaction.response.send_message(embed=embed)
+            return None
+
+        if not rows:
+            embed = create_embed(
+                "Error", f"Playlist **{name}** not found", COLOR, self.bot.user
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return None
+
+        # An empty playlist still yields its LEFT JOIN row with no song attached
+        return [row for row in rows if row[0] is not None]
+
+    def _session_present_embed(self) -> discord.Embed:
+        return create_embed(
+            "Error",
+            "All songs from current session are already in the playlist", COLOR, self.bot.user
+        )
+
+    async def _append_playlist_song(
+            self, interaction: discord.Interaction, name: str, song: dict
+    ) -> str:
+        """Append one song in a single UPDATE; returns added, missing, duplicate or full"""
+        params = (interaction.user.id, interaction.guild.id, name)
+        updated = await self.bot.execute_db_query(
+            """
+            UPDATE playlists
+            SET songs = json_insert(songs, '$[#]', json(?))
+            WHERE user_id = ?
+              AND guild_id = ?
+              AND name = ?
+              AND json_array_length(songs) < ?
+              AND NOT EXISTS (
+                  SELECT 1 FROM json_each(playlists.songs)
+                  WHERE json_extract(value, '$.webpage_url') = ?
+              )
+            RETURNING id
+            """,
+            (orjson.dumps(song).decode(), *params, MAX_PLAYLIST_SIZE, song.get("webpage_url")),
+        )
+        if updated:
+            return "added"
+
+        # Only the refusal path needs a second look to explain what went wrong
+        result = await self.bot.fetch_db_query(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM json_each(playlists.songs)
+                WHERE json_extract(value, '$.webpage_url') = ?
+            )
+            FROM playlists
+            WHERE user_id = ?
+              AND guild_id = ?
+              AND name = ?
+            """,
+            (song.get("webpage_url"), *params),
+        )
+        if not result:
+            return "missing"
+        return "duplicate" if result[0][0] else "full"
+
+    @staticmethod
+    def _select_new_songs(existing_songs: List[dict], candidates: List[dict],
+                          require_title: bool = False):
+        """Pick candidates not already in the playlist, up to MAX_PLAYLIST_SIZE"""
+        existing_urls = {s.get("webpage_url") for s in existing_songs}
+        room = MAX_PLAYLIST_SIZE - len(existing_songs)
+        songs_to_add = []
+        skipped_count = 0
+
+        for song_info in candidates:
+            song_url = song_info.get("webpage_url")
+            if not song_url or (require_title and not song_info.get("title")):
+                continue
+
+            if song_url in existing_urls:
+                skipped_count += 1
+                continue
+
+            if len(songs_to_add) >= room:
+                break
+            songs_to_add.append(song_info)
+            existing_urls.add(song_url)
+
+        return songs_to_add, skipped_count
+
+    def _append_refused_embed(self, name: str, status: str) -> discord.Embed:
+        if status == "missing":
+            return create_embed("Error", f"Playlist **{name}** not found", COLOR, self.bot.user)
+        if status == "duplicate":
+            return create_embed("Error", "Song is already in the playlist", COLOR, self.bot.user)
+        return create_embed(
+            "Error", f"Playlist is full! Maximum {MAX_PLAYLIST_SIZE} songs allowed.", COLOR, self.bot.user
+        )
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         return await interaction_check(self, interaction)
 
@@ -87,31 +215,44 @@ class PlaylistCommands(commands.Cog):
             self, interaction: discord.Interaction, current: str
     ) -> List[discord.app_commands.Choice]:
         guild_data = self.bot.get_guild_data(interaction.guild.id)
-        choices = []
-
-        if guild_data.get("current"):
-            current_song = guild_data["current"]
-            choice_name = f"Now Playing: {current_song.title[:60]}"
-            if len(choice_name) > 80:
-                choice_name = choice_name[:77] + "..."
-            choices.append(
-                discord.app_commands.Choice(name=choice_name, value="current")
-            )
+        current_song = guild_data.current
 
-        for i, song in enumerate(guild_data.get("queue", [])[:20]):
-            choice_name = f"Queue #{i + 1}: {song.title[:60]}"
-            if len(choice_name) > 80:
-                choice_name = choice_name[:77] + "..."
-            choices.append(
-                discord.app_commands.Choice(name=choice_name, value=f"queue_{i}")
-            )
+        # Autocomplete fires per keystroke; rebuild the choices only when the session changes
+        key = (
+            guild_data.queue.version,
+            current_song,
+            current_song.title if current_song else None,
+        )
+        cached = guild_data.queue_choices_cache
+        if cached and cached[0] == key:
+            entries = cached[1]
+        else:
+            entries = []
+
+            if current_song:
+                choice_name = f"Now Playing: {current_song.title[:60]}"
+                if len(choice_name) > 80:
+                    choice_name = choice_name[:77] + "..."
+                entries.append(
+                    (discord.app_commands.Choice(name=choice_name, value="current"), choice_name.lower())
+                )
+
+            for i, song in enumerate(guild_data.queue[:20]):
+                choice_name = f"Queue #{i + 1}: {song.title[:60]}"
+                if len(choice_name) > 80:
+                    choice_name = choice_name[:77] + "..."
+                entries.append(
+                    (discord.app_commands.Choice(name=choice_name, value=f"queue_{i}"), choice_name.lower())
+                )
+
+            entries = tuple(entries)
+            guild_data.queue_choices_cache = (key, entries)
 
         if current:
-            choices = [
-                choice for choice in choices if current.lower() in choice.name.lower()
-            ]
+            needle = current.lower()
+            return [choice for choice, label in entries if needle in label][:25]
 
-        return choices[:25]
+        return [choice for choice, _ in entries][:25]
 
     @playlist_group.command(name="create", description="Create a new empty playlist")
     @discord.app_commands.describe(name="Name for the playlist")
@@ -124,32 +265,23 @@ class PlaylistCommands(commands.Cog):
             return
 
         try:
-            existing = await self.bot.fetch_db_query(
+            created = await self.bot.execute_db_query(
                 """
-                SELECT id
-                FROM playlists
-                WHERE user_id = ?
-                  AND guild_id = ?
-                  AND name = ?
+                INSERT INTO playlists (user_id, guild_id, name, songs)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (user_id, guild_id, name) DO NOTHING
+                RETURNING id
                 """,
-                (interaction.user.id, interaction.guild.id, name),
+                (interaction.user.id, interaction.guild.id, name, "[]"),
             )
 
-            if existing:
+            if not created:
                 embed = create_embed(
                     "Error", f"Playlist **{name}** already exists", COLOR, self.bot.user
                 )
                 await interaction.response.send_message(embed=embed, ephemeral=True)
                 return
 
-            await self.bot.execute_db_query(
-                """
-                INSERT INTO playlists (user_id, guild_id, name, songs)
-                VALUES (?, ?, ?, ?)
-                """,
-                (interaction.user.id, interaction.guild.id, name, json.dumps([])),
-            )
-
             embed = create_embed(
                 "Playlist Created", f"Created empty playlist **{name}**", COLOR, self.bot.user
             )
@@ -174,15 +306,19 @@ class PlaylistCommands(commands.Cog):
         await interaction.response.defer()
 
         try:
-            existing_songs = await self._get_playlist_songs(
-                interaction, name, use_followup=True, ephemeral_not_found=True
-            )
-            if existing_songs is None:
-                return
-
-            is_youtube_playlist = "playlist" in song.lower() and "youtube.com" in song.lower()
-            is_spotify_playlist = "playlist" in song.lower() and "spotify.com" in song.lower()
-            is_spotify_album = "album" in song.lower() and "spotify.com" in song.lower()
+            url_kind = PLAYLIST_URL_KIND_RE.search(song)
+            spotify_kind = url_kind.group(2).lower() if url_kind and url_kind.group(2) else None
+            is_youtube_playlist = bool(url_kind and url_kind.group(1))
+            is_spotify_playlist = spotify_kind == "playlist"
+            is_spotify_album = spotify_kind == "album"
+
+            if is_youtube_playlist or is_spotify_playlist or is_spotify_album:
+                # Only bulk imports need the stored songs; single adds are checked in SQL
+                existing_songs = await self._get_playlist_songs(
+                    interaction, name, use_followup=True, ephemeral_not_found=True
+                )
+                if existing_songs is None:
+                    return
 
             if is_youtube_playlist:
                 music_service = MusicService(self.bot)
@@ -195,24 +331,8 @@ class PlaylistCommands(commands.Cog):
                     await interaction.followup.send(embed=embed)
                     return
 
-                existing_urls = {s.get("webpage_url") for s in existing_songs}
-                songs_to_add = []
-                added_count = 0
-                skipped_count = 0
-
-                for song_info in youtube_songs:
-                    song_url = song_info.get("webpage_url")
-                    if not song_url:
-                        continue
-
-                    if song_url not in existing_urls:
-                        if len(existing_songs) + len(songs_to_add) >= MAX_PLAYLIST_SIZE:
-                            break
-                        songs_to_add.append(song_info)
-                        existing_urls.add(song_url)
-                        added_count += 1
-                    else:
-                        skipped_count += 1
+                songs_to_add, skipped_count = self._select_new_songs(existing_songs, youtube_songs)
+                added_count = len(songs_to_add)
 
                 if not songs_to_add:
                     embed = create_embed(
@@ -226,12 +346,12 @@ class PlaylistCommands(commands.Cog):
                     await interaction.followup.send(embed=embed)
                     return
 
-                for song_info in songs_to_add:
-                    new_song = Song(song_info)
-                    new_song.requested_by = interaction.user.mention
-                    existing_songs.append(new_song.to_dict())
+                requested_by = interaction.user.mention
+                existing_songs.extend(
+                    Song.normalize_dict(song_info, requested_by) for song_info in songs_to_add
+                )
 
-                songs_json = json.dumps(existing_songs)
+                songs_json = orjson.dumps(existing_songs).decode()
                 await self.bot.execute_db_query(
                     """
                     UPDATE playlists
@@ -264,24 +384,10 @@ class PlaylistCommands(commands.Cog):
                     await interaction.followup.send(embed=embed)
                     return
 
-                existing_urls = {s.get("webpage_url") for s in existing_songs}
-                songs_to_add = []
-                added_count = 0
-                skipped_count = 0
-
-                for song_info in spotify_songs:
-                    song_url = song_info.get("webpage_url")
-                    if not song_url or not song_info.get("title"):
-                        continue
-
-                    if song_url not in existing_urls:
-                        if len(existing_songs) + len(songs_to_add) >= MAX_PLAYLIST_SIZE:
-                            break
-                        songs_to_add.append(song_info)
-                        existing_urls.add(song_url)
-                        added_count += 1
-                    else:
-                        skipped_count += 1
+                songs_to_add, skipped_count = self._select_new_songs(
+                    existing_songs, spotify_songs, require_title=True
+                )
+                added_count = len(songs_to_add)
 
                 if not songs_to_add:
                     embed = create_embed(
@@ -295,12 +401,12 @@ class PlaylistCommands(commands.Cog):
                     await interaction.followup.send(embed=embed)
                     return
 
-                for song_info in songs_to_add:
-                    new_song = Song(song_info)
-                    new_song.requested_by = interaction.user.mention
-                    existing_songs.append(new_song.to_dict())
+                requested_by = interaction.user.mention
+                existing_songs.extend(
+                    Song.normalize_dict(song_info, requested_by) for song_info in songs_to_add
+                )
 
-                songs_json = json.dumps(existing_songs)
+                songs_json = orjson.dumps(existing_songs).decode()
                 await self.bot.execute_db_query(
                     """
                     UPDATE playlists
@@ -331,36 +437,13 @@ class PlaylistCommands(commands.Cog):
                 await interaction.followup.send(embed=embed)
                 return
 
-            song_url = song_info["webpage_url"]
-            if any(s.get("webpage_url") == song_url for s in existing_songs):
-                embed = create_embed(
-                    "Error", "Song is already in the playlist", COLOR, self.bot.user
-                )
-                await interaction.followup.send(embed=embed)
-                return
-
-            if len(existing_songs) >= MAX_PLAYLIST_SIZE:
-                embed = create_embed(
-                    "Error", f"Playlist is full! Maximum {MAX_PLAYLIST_SIZE} songs allowed.", COLOR, self.bot.user
-                )
-                await interaction.followup.send(embed=embed)
-                return
-
             new_song = Song(song_info)
             new_song.requested_by = interaction.user.mention
-            existing_songs.append(new_song.to_dict())
 
-            songs_json = json.dumps(existing_songs)
-            await self.bot.execute_db_query(
-                """
-                UPDATE playlists
-                SET songs = ?
-                WHERE user_id = ?
-                  AND guild_id = ?
-                  AND name = ?
-                """,
-                (songs_json, interaction.user.id, interaction.guild.id, name),
-            )
+            status = await self._append_playlist_song(interaction, name, new_song.to_dict())
+            if status != "added":
+                await interaction.followup.send(embed=self._append_refused_embed(name, status))
+                return
 
             embed = create_embed(
                 "Song Added",
@@ -390,22 +473,16 @@ class PlaylistCommands(commands.Cog):
         await interaction.response.defer()
 
         try:
-            existing_songs = await self._get_playlist_songs(
-                interaction, name, use_followup=True, ephemeral_not_found=True
-            )
-            if existing_songs is None:
-                return
-
             guild_data = self.bot.get_guild_data(interaction.guild.id)
             target_song = None
 
-            if from_queue == "current" and guild_data.get("current"):
-                target_song = guild_data["current"]
+            if from_queue == "current" and guild_data.current:
+                target_song = guild_data.current
             elif from_queue.startswith("queue_"):
                 try:
                     queue_index = int(from_queue.split("_")[1])
-                    if 0 <= queue_index < len(guild_data.get("queue", [])):
-                        target_song = guild_data["queue"][queue_index]
+                    if 0 <= queue_index < len(guild_data.queue):
+                        target_song = guild_data.queue[queue_index]
                 except (ValueError, IndexError):
                     pass
 
@@ -416,39 +493,13 @@ class PlaylistCommands(commands.Cog):
                 await interaction.followup.send(embed=embed)
                 return
 
-            if any(
-                    s.get("webpage_url") == target_song.webpage_url
-                    for s in existing_songs
-            ):
-                embed = create_embed(
-                    "Error", "Song is already in the playlist", COLOR, self.bot.user
-                )
-                await interaction.followup.send(embed=embed)
-                return
+            song_copy = target_song.clone(requested_by=interaction.user.mention)
 
-            if len(existing_songs) >= MAX_PLAYLIST_SIZE:
-                embed = create_embed(
-                    "Error", f"Playlist is full! Maximum {MAX_PLAYLIST_SIZE} songs allowed.", COLOR, self.bot.user
-                )
-                await interaction.followup.send(embed=embed)
+            status = await self._append_playlist_song(interaction, name, song_copy.to_dict())
+            if status != "added":
+                await interaction.followup.send(embed=self._append_refused_embed(name, status))
                 return
 
-            song_copy = Song.from_dict(target_song.to_dict())
-            song_copy.requested_by = interaction.user.mention
-            existing_songs.append(song_copy.to_dict())
-
-            songs_json = json.dumps(existing_songs)
-            await self.bot.execute_db_query(
-                """
-                UPDATE playlists
-                SET songs = ?
-                WHERE user_id = ?
-                  AND guild_id = ?
-                  AND name = ?
-                """,
-                (songs_json, interaction.user.id, interaction.guild.id, name),
-            )
-
             embed = create_embed(
                 "Song Added",
                 f"Added **{target_song.title}** to playlist **{name}**",
@@ -481,21 +532,10 @@ class PlaylistCommands(commands.Cog):
                 return
 
             guild_data = self.bot.get_guild_data(interaction.guild.id)
-            queue_items = []
-            current_dict = None
-            seen_urls = set()
-
-            if guild_data.get("current"):
-                current_song = guild_data["current"]
-                current_dict = current_song.to_dict()
-                seen_urls.add(current_song.webpage_url)
-
-            for queue_song in guild_data.get("queue", []):
-                if queue_song.webpage_url not in seen_urls:
-                    queue_items.append(queue_song.to_dict())
-                    seen_urls.add(queue_song.webpage_url)
+            current_song = guild_data.current
+            queue = guild_data.queue
 
-            if not current_dict and not queue_items:
+            if not current_song and not queue:
                 embed = create_embed(
                     "Error", "No songs in current session", COLOR, self.bot.user
                 )
@@ -503,33 +543,38 @@ class PlaylistCommands(commands.Cog):
                 return
 
             existing_urls = {s.get("webpage_url") for s in existing_songs}
-            songs_to_add = []
 
-            if current_dict:
-                current_url = current_dict.get("webpage_url")
-                if current_url not in existing_urls:
-                    songs_to_add.append(current_dict)
-                    existing_urls.add(current_url)
+            # The queue keeps its url index current, so an all-duplicate session needs no walk
+            if (
+                    (not current_song or current_song.webpage_url in existing_urls)
+                    and existing_urls.issuperset(queue.urls())
+            ):
+                await interaction.followup.send(embed=self._session_present_embed())
+                return
+
+            # Filter on the Song objects first so only songs being added are turned into dicts;
+            # one past the remaining capacity is enough to know the add will be partial
+            capacity = max(MAX_PLAYLIST_SIZE - len(existing_songs), 0)
+            session_songs = itertools.chain((current_song,) if current_song else (), queue)
+            requested_by = interaction.user.mention
+            songs_to_add = []
 
-            for song_info in queue_items:
-                song_url = song_info.get("webpage_url")
+            for session_song in session_songs:
+                song_url = session_song.webpage_url
                 if song_url and song_url not in existing_urls:
-                    songs_to_add.append(song_info)
+                    song_dict = session_song.to_dict()
+                    song_dict["requested_by"] = requested_by
+                    songs_to_add.append(song_dict)
                     existing_urls.add(song_url)
+                    if len(songs_to_add) > capacity:
+                        break
 
             if not songs_to_add:
-                embed = create_embed(
-                    "Error",
-                    "All songs from current session are already in the playlist",
-                    COLOR,
-                    self.bot.user
-                )
-                await interaction.followup.send(embed=embed)
+                await interaction.followup.send(embed=self._session_present_embed())
                 return
 
-            if len(existing_songs) + len(songs_to_add) > MAX_PLAYLIST_SIZE:
-                max_can_add = MAX_PLAYLIST_SIZE - len(existing_songs)
-                songs_to_add = songs_to_add[:max_can_add]
+            if len(songs_to_add) > capacity:
+                songs_to_add = songs_to_add[:capacity]
                 embed = create_embed(
                     "Partial Add",
                     f"Added {len(songs_to_add)} songs to playlist **{name}**\n(Playlist size limit reached)",
@@ -544,12 +589,9 @@ class PlaylistCommands(commands.Cog):
                     self.bot.user
                 )
 
-            for song_info in songs_to_add:
-                song_info["requested_by"] = interaction.user.mention
-
             existing_songs.extend(songs_to_add)
 
-            songs_json = json.dumps(existing_songs)
+            songs_json = orjson.dumps(existing_songs).decode()
             await self.bot.execute_db_query(
                 """
                 UPDATE playlists
@@ -565,7 +607,9 @@ class PlaylistCommands(commands.Cog):
 
         except Exception as e:
             logger.error(f"Playlist add session error: {e}")
-            embed = create_embed("Error", "Failed to add session to playlist.", COLOR, self.bot.user)
+            embed = create_embed(
+                "Error", "Failed to add session to playlist.", COLOR, self.bot.user
+            )
             await interaction.followup.send(embed=embed)
 
     @playlist_group.command(name="remove", description="Remove a song from a playlist")
@@ -576,44 +620,71 @@ class PlaylistCommands(commands.Cog):
             self, interaction: discord.Interaction, name: str, position: int
     ):
         try:
-            playlist_items = await self._get_playlist_songs(
-                interaction, name, use_followup=False, ephemeral_not_found=True
+            params = (interaction.user.id, interaction.guild.id, name)
+            path = f"$[{max(position, 1) - 1}]"
+
+            # Read just the length and the target entry instead of the whole playlist
+            result = await self.bot.fetch_db_query(
+                """
+                SELECT json_array_length(songs),
+                       json_extract(songs, ? || '.title'),
+                       json_extract(songs, ? || '.webpage_url')
+                FROM playlists
+                WHERE user_id = ?
+                  AND guild_id = ?
+                  AND name = ?
+                """,
+                (path, path, *params),
             )
-            if playlist_items is None:
+
+            if not result:
+                embed = create_embed(
+                    "Error", f"Playlist **{name}** not found", COLOR, self.bot.user
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
                 return
 
-            if not playlist_items:
+            song_count, removed_title, removed_url = result[0]
+
+            if not song_count:
                 embed = create_embed("Error", "Playlist is empty", COLOR, self.bot.user)
                 await interaction.response.send_message(embed=embed)
                 return
 
-            if position < 1 or position > len(playlist_items):
+            if position < 1 or position > song_count:
                 embed = create_embed(
                     "Error",
-                    f"Invalid position! Playlist has {len(playlist_items)} songs.",
+                    f"Invalid position! Playlist has {song_count} songs.",
                     COLOR,
                     self.bot.user
                 )
                 await interaction.response.send_message(embed=embed)
                 return
 
-            removed_song = playlist_items.pop(position - 1)
-
-            songs_json = json.dumps(playlist_items)
-            await self.bot.execute_db_query(
+            # The url guard keeps a concurrent edit from shifting which song gets removed
+            removed = await self.bot.execute_db_query(
                 """
                 UPDATE playlists
-                SET songs = ?
+                SET songs = json_remove(songs, ?)
                 WHERE user_id = ?
                   AND guild_id = ?
                   AND name = ?
+                  AND json_extract(songs, ? || '.webpage_url') IS ?
+                RETURNING id
                 """,
-                (songs_json, interaction.user.id, interaction.guild.id, name),
+                (path, *params, path, removed_url),
             )
 
+            if not removed:
+                embed = create_embed(
+                    "Error", "Playlist changed while removing, try again.", COLOR, self.bot.user
+                )
+                await interaction.response.send_message(embed=embed)
+                return
+
             embed = create_embed(
                 "Song Removed",
-                f"Removed **{removed_song.get('title', 'Unknown')}** from playlist **{name}**",
+                f"Removed **{removed_title or 'Unknown'}** from playlist **{name}**",
                 COLOR,
                 self.bot.user
             )
@@ -673,7 +744,7 @@ class PlaylistCommands(commands.Cog):
             song = playlist_items.pop(from_index)
             playlist_items.insert(to_index, song)
 
-            songs_json = json.dumps(playlist_items)
+            songs_json = orjson.dumps(playlist_items).decode()
             await self.bot.execute_db_query(
                 """
                 UPDATE playlists
@@ -712,13 +783,11 @@ class PlaylistCommands(commands.Cog):
             return
 
         try:
-            playlist_items = await self._get_playlist_songs(
-                interaction, name, use_followup=False, ephemeral_not_found=True
-            )
-            if playlist_items is None:
+            playlist_rows = await self._get_playlist_song_rows(interaction, name)
+            if playlist_rows is None:
                 return
 
-            if not playlist_items:
+            if not playlist_rows:
                 embed = create_embed(
                     "Error", f"Playlist **{name}** is empty", COLOR, self.bot.user
                 )
@@ -727,11 +796,10 @@ class PlaylistCommands(commands.Cog):
 
             guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-            if not guild_data.get("music_channel_id"):
-                guild_data["music_channel_id"] = interaction.channel.id
-                await self.bot.execute_db_query(
-                    "INSERT OR REPLACE INTO guild_settings (guild_id, music_channel_id) VALUES (?, ?)",
-                    (interaction.guild.id, interaction.channel.id)
+            if not guild_data.music_channel_id:
+                guild_data.music_channel_id = interaction.channel.id
+                await self.bot.save_guild_music_channel(
+                    interaction.guild.id, interaction.channel.id
                 )
 
             if not await music_cog.ensure_voice_connection(interaction):
@@ -741,27 +809,24 @@ class PlaylistCommands(commands.Cog):
                 await interaction.response.send_message(embed=embed, ephemeral=True)
                 return
 
-            loaded_count = 0
+            valid_items = []
             seen_urls = set()
 
-            for song_info in playlist_items:
-                try:
-                    if not song_info.get("webpage_url") or not song_info.get("title"):
-                        continue
+            # Duplicates and non-song entries are dropped on the extracted url before any parsing
+            for song_json, song_url in playlist_rows:
+                if not song_url or song_url in seen_urls:
+                    continue
 
-                    if song_info["webpage_url"] in seen_urls:
-                        continue
+                song_info = orjson.loads(song_json)
+                if not song_info.get("title"):
+                    continue
 
-                    song = Song.from_dict(song_info)
-                    song.requested_by = interaction.user.mention
+                valid_items.append(song_info)
+                seen_urls.add(song_url)
 
-                    self.queue_service.add_song_to_queue(interaction.guild.id, song)
-                    seen_urls.add(song_info["webpage_url"])
-                    loaded_count += 1
-
-                except Exception as e:
-                    logger.warning(f"Skipped invalid song data: {e}")
-                    continue
+            songs = list(Song.fast_many(valid_items, interaction.user.mention))
+            self.queue_service.add_songs_to_queue(interaction.guild.id, songs)
+            loaded_count = len(songs)
 
             if loaded_count == 0:
                 embed = create_embed(
@@ -781,13 +846,13 @@ class PlaylistCommands(commands.Cog):
             playback_service = PlaybackService(self.bot)
 
             if (
-                    not guild_data["voice_client"].is_playing()
-                    and not guild_data["current"]
+                    not guild_data.voice_client.is_playing()
+                    and not guild_data.current
             ):
                 await playback_service.play_next(interaction.guild.id)
 
-            guild_data["last_activity"] = datetime.now()
-            await self.bot.save_guild_queue(interaction.guild.id)
+            guild_data.last_activity = time.monotonic()
+            self.bot.schedule_save_guild_queue(interaction.guild.id)
 
         except Exception as e:
             logger.error(f"Playlist load error: {e}")
@@ -873,10 +938,10 @@ class PlaylistCommands(commands.Cog):
                 description = ""
                 for playlist_name, songs_json, created_at in results:
                     try:
-                        playlist_items = json.loads(songs_json) if songs_json else []
+                        playlist_items = orjson.loads(songs_json) if songs_json else []
                         song_count = len(playlist_items)
                         description += f"• **{playlist_name}** ({song_count} songs) - {created_at[:10]}\n"
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         description += f"• **{playlist_name}** (corrupted data) - {created_at[:10]}\n"
 
                 embed = create_embed("Your Playlists", description, COLOR, self.bot.user)
@@ -936,13 +1001,13 @@ class PlaylistCommands(commands.Cog):
     async def history_show(self, interaction: discord.Interaction, page: int = 1):
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        if not guild_data["history"]:
+        if not guild_data.history:
             embed = create_embed("History", "No songs in history yet", COLOR, self.bot.user)
             await interaction.response.send_message(embed=embed)
             return
 
         total_pages = max(
-            1, (len(guild_data["history"]) + SONGS_PER_PAGE - 1) // SONGS_PER_PAGE
+            1, (len(guild_data.history) + SONGS_PER_PAGE - 1) // SONGS_PER_PAGE
         )
 
         page = max(1, min(page, total_pages))
@@ -953,7 +1018,7 @@ class PlaylistCommands(commands.Cog):
             end_idx = start_idx + SONGS_PER_PAGE
 
             description = ""
-            for i, song in enumerate(guild_data["history"][start_idx:end_idx], start_idx + 1):
+            for i, song in enumerate(guild_data.history[start_idx:end_idx], start_idx + 1):
                 description += f"`{i}.` **{song.title}** by {song.uploader}\n"
 
             embed = create_embed(
@@ -962,7 +1027,7 @@ class PlaylistCommands(commands.Cog):
                 COLOR,
                 self.bot.user
             )
-            embed.add_field(name="Total", value=str(len(guild_data["history"])), inline=True)
+            embed.add_field(name="Total", value=str(len(guild_data.history)), inline=True)
             embed.set_footer(
                 text="Use /history play <number> to replay a song or /history add_all to add all songs"
             )
@@ -985,7 +1050,7 @@ class PlaylistCommands(commands.Cog):
     async def history_play(self, interaction: discord.Interaction, song_number: int):
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        if not guild_data["history"]:
+        if not guild_data.history:
             embed = create_embed("History", "No songs in history yet", COLOR, self.bot.user)
             await interaction.response.send_message(embed=embed)
             return
@@ -999,22 +1064,22 @@ class PlaylistCommands(commands.Cog):
         if not await music_cog.check_voice_channel(interaction, allow_auto_join=True):
             return
 
-        if song_number < 1 or song_number > len(guild_data["history"]):
+        if song_number < 1 or song_number > len(guild_data.history):
             embed = create_embed(
                 "Error",
-                f"Invalid history position! History has {len(guild_data['history'])} songs.",
+                f"Invalid history position! History has {len(guild_data.history)} songs.",
                 COLOR,
                 self.bot.user
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        selected_song = guild_data["history"][song_number - 1]
-        queue_urls = {song.webpage_url for song in guild_data.get("queue", [])}
+        selected_song = guild_data.history[song_number - 1]
+        queue_urls = {song.webpage_url for song in guild_data.queue}
 
         if (
-                guild_data.get("current")
-                and selected_song.webpage_url == guild_data["current"].webpage_url
+                guild_data.current
+                and selected_song.webpage_url == guild_data.current.webpage_url
         ):
             embed = create_embed(
                 "Error", "This song is currently playing", COLOR, self.bot.user
@@ -1022,7 +1087,7 @@ class PlaylistCommands(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         elif selected_song.webpage_url in queue_urls:
-            for i, song in enumerate(guild_data.get("queue", []), 1):
+            for i, song in enumerate(guild_data.queue, 1):
                 if song.webpage_url == selected_song.webpage_url:
                     embed = create_embed(
                         "Error",
@@ -1042,24 +1107,23 @@ class PlaylistCommands(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        song_copy = Song.from_dict(selected_song.to_dict())
-        song_copy.requested_by = interaction.user.mention
+        song_copy = selected_song.clone(requested_by=interaction.user.mention)
         self.queue_service.add_song_to_queue(interaction.guild.id, song_copy)
 
         playback_service = PlaybackService(self.bot)
-        voice_client = guild_data.get("voice_client")
+        voice_client = guild_data.voice_client
 
         if (
                 voice_client
                 and not voice_client.is_playing()
-                and not guild_data.get("current")
+                and not guild_data.current
         ):
             await playback_service.play_next(interaction.guild.id)
             embed = create_embed(
                 "Now Playing from History", str(song_copy), COLOR, self.bot.user
             )
         else:
-            position = len(guild_data.get("queue", []))
+            position = len(guild_data.queue)
             embed = create_embed(
                 "Added from History",
                 f"{song_copy}\n\nPosition in queue: {position}",
@@ -1071,8 +1135,8 @@ class PlaylistCommands(commands.Cog):
             embed.set_thumbnail(url=song_copy.thumbnail)
 
         await interaction.response.send_message(embed=embed)
-        guild_data["last_activity"] = datetime.now()
-        await self.bot.save_guild_queue(interaction.guild.id)
+        guild_data.last_activity = time.monotonic()
+        self.bot.schedule_save_guild_queue(interaction.guild.id)
 
     @history_group.command(
         name="add_all", description="Add all songs from history to the queue"
@@ -1087,7 +1151,7 @@ class PlaylistCommands(commands.Cog):
 
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        if not guild_data["history"]:
+        if not guild_data.history:
             embed = create_embed("History", "No songs in history yet", COLOR, self.bot.user)
             await interaction.response.send_message(embed=embed)
             return
@@ -1101,26 +1165,24 @@ class PlaylistCommands(commands.Cog):
 
         await interaction.response.defer()
 
-        existing_urls = get_existing_urls(guild_data)
-        added_count = 0
-        skipped_count = 0
+        added_urls = set()
+        songs = []
 
-        for history_song in guild_data["history"]:
-            if history_song.webpage_url not in existing_urls:
-                song_copy = Song.from_dict(history_song.to_dict())
-                song_copy.requested_by = interaction.user.mention
-                self.queue_service.add_song_to_queue(interaction.guild.id, song_copy)
-                existing_urls.add(history_song.webpage_url)
-                added_count += 1
-            else:
-                skipped_count += 1
+        for history_song in guild_data.history:
+            url = history_song.webpage_url
+            if url not in added_urls and not is_url_in_guild(guild_data, url):
+                song_copy = history_song.clone(requested_by=interaction.user.mention)
+                songs.append(song_copy)
+                added_urls.add(url)
+
+        self.queue_service.add_songs_to_queue(interaction.guild.id, songs)
+        added_count = len(songs)
+        skipped_count = len(guild_data.history) - added_count
 
         if added_count == 0:
             embed = create_embed(
                 "No Songs Added",
-                "All history songs are already in queue or currently playing",
-                COLOR,
-                self.bot.user
+                "All history songs are already in queue or currently playing", COLOR, self.bot.user
             )
         else:
             embed = create_embed(
@@ -1139,11 +1201,11 @@ class PlaylistCommands(commands.Cog):
 
         playback_service = PlaybackService(self.bot)
 
-        if not guild_data["voice_client"].is_playing() and not guild_data["current"]:
+        if not guild_data.voice_client.is_playing() and not guild_data.current:
             await playback_service.play_next(interaction.guild.id)
 
-        guild_data["last_activity"] = datetime.now()
-        await self.bot.save_guild_queue(interaction.guild.id)
+        guild_data.last_activity = time.monotonic()
+        self.bot.schedule_save_guild_queue(interaction.guild.id)
 
     @history_group.command(
         name="clear",
@@ -1152,24 +1214,20 @@ class PlaylistCommands(commands.Cog):
     async def history_clear(self, interaction: discord.Interaction):
         guild_data = self.bot.get_guild_data(interaction.guild.id)
 
-        if not guild_data["history"]:
+        if not guild_data.history:
             embed = create_embed(
                 "Error",
-                "History already empty!",
-                COLOR,
-                self.bot.user
+                "History already empty!", COLOR, self.bot.user
             )
             await interaction.response.send_message(embed=embed)
             return
         else:
-            guild_data["history"].clear()
-            guild_data["history_position"] = 0
+            guild_data.history.clear()
+            guild_data.history_position = 0
             embed = create_embed(
                 "History cleared",
-                "Removed all songs from history",
-                COLOR,
-                self.bot.user
+                "Removed all songs from history", COLOR, self.bot.user
             )
             await interaction.response.send_message(embed=embed)
 
-        await self.bot.save_guild_queue(interaction.guild.id)
+        self.bot.schedule_save_guild_queue(interaction.guild.id)
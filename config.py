@@ -1,12 +1,24 @@
+import os
+
 import discord
 
+DATABASE_PATH = "music_bot.db"
+
 COLOR = 0x00CCFF
 SONGS_PER_PAGE = 15
 MAX_PLAYLIST_SIZE = 250
 MAX_HISTORY_SIZE = 30
 MAX_CACHE_SIZE = 500
 CACHE_TTL = 3600
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = 600
 INACTIVE_TIMEOUT_MINUTES = 5
+NOW_PLAYING_UPDATE_INTERVAL = 5
+SEEK_STALE_SECONDS = 15
+SAVE_DEBOUNCE_SECONDS = 0.25
+
+# Number of HLS/DASH fragments yt-dlp fetches in parallel per stream
+YTDLP_CONCURRENT_FRAGS = int(os.getenv("YTDLP_CONCURRENT_FRAGS", "4"))
 
 
 def get_intents():
@@ -1,3 +1,5 @@
 from .song import Song
+from .song_list import SongList
+from .guild_state import GuildState
 
-__all__ = ['Song']
\ No newline at end of file
+__all__ = ['Song', 'SongList', 'GuildState']
\ No newline at end of file
@@ -0,0 +1,51 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+from models.song import Song
+from models.song_list import SongList
+
+
+@dataclass(slots=True)
+class GuildState:
+    guild_id: int
+    queue: SongList = field(default_factory=SongList)
+    loop_backup: SongList = field(default_factory=SongList)
+    visible_queue_cache: Optional[tuple] = None
+    queue_choices_cache: Optional[tuple] = None
+    history: List[Song] = field(default_factory=list)
+    history_position: int = 0
+    history_seq: int = 0
+    history_saved_seq: int = 0
+    current: Optional[Song] = None
+    position: int = 0
+    seek_offset: int = 0
+    loop_mode: str = "off"
+    shuffle: bool = False
+    volume: int = 100
+    voice_client: Any = None
+    intentional_disconnect: bool = False
+    last_activity: float = field(default_factory=time.monotonic)
+    now_playing_message: Any = None
+    now_playing_song_url: Optional[str] = None
+    now_playing_body: Optional[str] = None
+    music_channel_id: Optional[int] = None
+    music_channel_obj: Any = None
+    music_channel_obj_id: Optional[int] = None
+    start_time: Optional[float] = None
+    message_ready_for_timestamps: bool = False
+    message_last_validated: float = 0
+    seeking: bool = False
+    seeking_start_time: Optional[float] = None
+    seek_generation: int = 0
+    pause_position: Optional[int] = None
+    play_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    np_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    np_task: Optional[asyncio.Task] = None
+
+    def __setattr__(self, name, value):
+        # Keep the url index on queue-like lists even when they are reassigned wholesale
+        if name in ("queue", "loop_backup") and not isinstance(value, SongList):
+            value = SongList(value)
+        object.__setattr__(self, name, value)
@@ -1,8 +1,15 @@
-from typing import Dict
+from typing import Dict, Iterable, Iterator
+
+import orjson
 
 
 class Song:
+    _FIELDS = ("url", "title", "duration", "thumbnail", "uploader", "webpage_url", "requested_by")
+    __slots__ = _FIELDS + ("_cached_json", "_cached_str")
+
     def __init__(self, data: Dict):
+        self._cached_json = None
+        self._cached_str = None
         self.url = data.get("url", "")
         self.title = data.get("title", "Unknown Title")
         self.duration = data.get("duration", 0)
@@ -11,8 +18,16 @@ class Song:
         self.webpage_url = data.get("webpage_url", "")
         self.requested_by = data.get("requested_by", "Unknown")
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self._FIELDS:
+            super().__setattr__("_cached_json", None)
+            super().__setattr__("_cached_str", None)
+
     def __str__(self):
-        return f"**{self.title}** by {self.uploader}"
+        if self._cached_str is None:
+            super().__setattr__("_cached_str", f"**{self.title}** by {self.uploader}")
+        return self._cached_str
 
     def to_dict(self):
         return {
@@ -25,6 +40,49 @@ class Song:
             "requested_by": self.requested_by,
         }
 
+    def to_json(self) -> bytes:
+        if self._cached_json is None:
+            super().__setattr__("_cached_json", orjson.dumps(self.to_dict()))
+        return self._cached_json
+
+    def clone(self, **overrides):
+        new = Song.__new__(Song)
+        for name in Song.__slots__:
+            object.__setattr__(new, name, getattr(self, name))
+        for name, value in overrides.items():
+            setattr(new, name, value)
+        return new
+
+    @classmethod
+    def normalize_dict(cls, data: Dict, requested_by: str) -> Dict:
+        # Same shape as Song(data).to_dict() with requested_by set, without building a Song
+        return {
+            "url": data.get("url", ""),
+            "title": data.get("title", "Unknown Title"),
+            "duration": data.get("duration", 0),
+            "thumbnail": data.get("thumbnail", ""),
+            "uploader": data.get("uploader", "Unknown"),
+            "webpage_url": data.get("webpage_url", ""),
+            "requested_by": requested_by,
+        }
+
+    @classmethod
+    def fast_many(cls, entries: Iterable[Dict], requested_by: str) -> Iterator["Song"]:
+        # Bulk builder for playlist ingestion: skips __init__ and the per-field cache invalidation
+        set_field = object.__setattr__
+        for data in entries:
+            song = cls.__new__(cls)
+            set_field(song, "_cached_json", None)
+            set_field(song, "_cached_str", None)
+            set_field(song, "url", data.get("url", ""))
+            set_field(song, "title", data.get("title", "Unknown Title"))
+            set_field(song, "duration", data.get("duration", 0))
+            set_field(song, "thumbnail", data.get("thumbnail", ""))
+            set_field(song, "uploader", data.get("uploader", "Unknown"))
+            set_field(song, "webpage_url", data.get("webpage_url", ""))
+            set_field(song, "requested_by", requested_by)
+            yield song
+
     @classmethod
     def from_dict(cls, data: Dict):
-        return cls(data)
\ No newline at end of file
+        return cls(data)
@@ -0,0 +1,104 @@
+from itertools import count
+from typing import Iterable, Optional
+
+# Shared across instances so a version number identifies one exact list state
+_versions = count(1)
+
+
+class SongList(list):
+    def __init__(self, songs: Iterable = ()):
+        super().__init__(songs)
+        self._url_counts = {}
+        self.version = next(_versions)
+        for song in self:
+            self._track(song)
+
+    def _track(self, song):
+        self.version = next(_versions)
+        url = song.webpage_url
+        self._url_counts[url] = self._url_counts.get(url, 0) + 1
+
+    def _untrack(self, song):
+        self.version = next(_versions)
+        url = song.webpage_url
+        count = self._url_counts.get(url, 0) - 1
+        if count > 0:
+            self._url_counts[url] = count
+        else:
+            self._url_counts.pop(url, None)
+
+    def has_url(self, url: str) -> bool:
+        return url in self._url_counts
+
+    def index_of_url(self, url: str) -> Optional[int]:
+        if url not in self._url_counts:
+            return None
+        for i, song in enumerate(self):
+            if song.webpage_url == url:
+                return i
+        return None
+
+    def remove_url(self, url: str) -> int:
+        if url not in self._url_counts:
+            return 0
+
+        kept = [song for song in self if song.webpage_url != url]
+        removed = len(self) - len(kept)
+        super().__setitem__(slice(None), kept)
+        del self._url_counts[url]
+        self.version = next(_versions)
+        return removed
+
+    def urls(self):
+        return self._url_counts.keys()
+
+    def append(self, song):
+        super().append(song)
+        self._track(song)
+
+    def extend(self, songs):
+        songs = list(songs)
+        super().extend(songs)
+        for song in songs:
+            self._track(song)
+
+    def __iadd__(self, songs):
+        self.extend(songs)
+        return self
+
+    def insert(self, index, song):
+        super().insert(index, song)
+        self._track(song)
+
+    def pop(self, index=-1):
+        song = super().pop(index)
+        self._untrack(song)
+        return song
+
+    def remove(self, song):
+        super().remove(song)
+        self._untrack(song)
+
+    def clear(self):
+        super().clear()
+        self._url_counts.clear()
+        self.version = next(_versions)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            for song in self[index]:
+                self._untrack(song)
+            super().__setitem__(index, value)
+            for song in value:
+                self._track(song)
+        else:
+            self._untrack(self[index])
+            super().__setitem__(index, value)
+            self._track(value)
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for song in removed:
+            self._untrack(song)
@@ -4,10 +4,13 @@ from typing import Optional, Dict, List
 
 logger = logging.getLogger(__name__)
 
+URL_DOMAINS = ("youtube.com", "youtu.be", "soundcloud.com", "spotify.com")
+
 
 class MusicService:
     def __init__(self, bot):
         self.bot = bot
+        self._pending = {}
 
     @staticmethod
     def _normalize_youtube_entry(entry: Dict) -> Optional[Dict]:
@@ -41,60 +44,94 @@ class MusicService:
 
         return normalized
 
+    async def _extract_info(self, query: str, process: bool = True) -> Optional[Dict]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.bot.executor, self._extract_info_sync, query, process)
+
+    def _extract_info_sync(self, query: str, process: bool) -> Optional[Dict]:
+        # bot.ytdl is thread-local, so it has to be resolved on the worker thread
+        return self.bot.ytdl.extract_info(query, download=False, process=process)
+
+    @staticmethod
+    def _song_cache_key(url_or_query: str) -> str:
+        # Video ids are case-sensitive, so only free-text queries are folded to lowercase
+        stripped = url_or_query.strip()
+        lowered = stripped.lower()
+        if "://" in stripped or any(domain in lowered for domain in URL_DOMAINS):
+            return stripped
+        return lowered
+
     async def get_song_info_cached(self, url_or_query: str) -> Optional[Dict]:
-        cache_key = url_or_query.lower().strip()
+        cache_key = self._song_cache_key(url_or_query)
+
+        cached_data = self.bot.song_cache.get(cache_key)
+        if cached_data is not None:
+            logger.debug(f"Using cached data for: {url_or_query[:50]}")
+            return cached_data
+
+        # Share one extraction between concurrent callers (e.g. a prefetch and a play)
+        task = self._pending.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_cache(cache_key, url_or_query))
+            self._pending[cache_key] = task
 
-        if cache_key in self.bot.song_cache:
-            cached_data = self.bot.song_cache[cache_key]
-            current_time = asyncio.get_event_loop().time()
-            if current_time - cached_data["cached_at"] < self.bot.cache_ttl:
-                logger.debug(f"Using cached data for: {url_or_query[:50]}")
-                return cached_data["data"]
+        return await asyncio.shield(task)
 
-        data = await self.get_song_info(url_or_query)
+    async def refresh_song_info(self, url_or_query: str) -> Optional[Dict]:
+        # Drop a possibly expired stream URL but still coalesce with other refreshers
+        self.bot.song_cache.pop(self._song_cache_key(url_or_query), None)
+        return await self.get_song_info_cached(url_or_query)
 
-        if data:
-            current_time = asyncio.get_event_loop().time()
-            self.bot.song_cache[cache_key] = {"data": data, "cached_at": current_time}
-            await self._cleanup_cache_if_needed()
+    async def _fetch_and_cache(self, cache_key: str, url_or_query: str) -> Optional[Dict]:
+        try:
+            data = await self.get_song_info(url_or_query)
+            if data:
+                self.bot.song_cache[cache_key] = data
+            return data
+        finally:
+            self._pending.pop(cache_key, None)
 
-        return data
+    async def search_youtube_entries(self, query: str, limit: int = 5) -> List[Dict]:
+        cache_key = f"search{limit}:{query.lower().strip()}"
 
-    async def _cleanup_cache_if_needed(self):
-        if len(self.bot.song_cache) > self.bot.max_cache_size:
-            sorted_items = sorted(
-                self.bot.song_cache.items(), key=lambda x: x[1]["cached_at"]
-            )
+        cached_entries = self.bot.search_cache.get(cache_key)
+        if cached_entries is not None:
+            logger.debug(f"Using cached search results for: {query[:50]}")
+            return cached_entries
 
-            for key, _ in sorted_items[:100]:
-                del self.bot.song_cache[key]
+        task = self._pending.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_search_entries(cache_key, query, limit))
+            self._pending[cache_key] = task
 
-            logger.debug(f"Cleaned cache, now has {len(self.bot.song_cache)} entries")
+        return await asyncio.shield(task)
+
+    async def _fetch_search_entries(self, cache_key: str, query: str, limit: int) -> List[Dict]:
+        try:
+            data = await self._extract_info(f"ytsearch{limit}:{query}")
+
+            normalize = self._normalize_youtube_entry
+            entries = [
+                normalized
+                for raw_entry in (data or {}).get("entries") or []
+                if (normalized := normalize(raw_entry))
+            ]
+
+            if entries:
+                self.bot.search_cache[cache_key] = entries
+            return entries
+        finally:
+            self._pending.pop(cache_key, None)
 
     async def get_song_info(self, url_or_query: str) -> Optional[Dict]:
         try:
-            loop = asyncio.get_event_loop()
-
-            if any(
-                    platform in url_or_query.lower()
-                    for platform in [
-                        "youtube.com",
-                        "youtu.be",
-                        "soundcloud.com",
-                        "spotify.com",
-                    ]
-            ):
+            if any(platform in url_or_query.lower() for platform in URL_DOMAINS):
                 if "spotify.com" in url_or_query and self.bot.spotify:
                     return await self.handle_spotify_url(url_or_query)
                 else:
                     for attempt in range(2):
                         try:
-                            data = await loop.run_in_executor(
-                                self.bot.executor,
-                                lambda: self.bot.ytdl.extract_info(
-                                    url_or_query, download=False
-                                ),
-                            )
+                            data = await self._extract_info(url_or_query)
                             if data:
                                 return data
                         except Exception as e:
@@ -111,11 +148,7 @@ class MusicService:
 
     async def search_youtube(self, query: str) -> Optional[Dict]:
         try:
-            loop = asyncio.get_event_loop()
-            data = await loop.run_in_executor(
-                self.bot.executor,
-                lambda: self.bot.ytdl.extract_info(f"ytsearch:{query}", download=False),
-            )
+            data = await self._extract_info(f"ytsearch:{query}")
 
             if data and "entries" in data and data["entries"]:
                 for raw_entry in data["entries"]:
@@ -200,12 +233,7 @@ class MusicService:
 
     async def handle_youtube_playlist_optimized(self, url: str) -> List[Dict]:
         try:
-            loop = asyncio.get_event_loop()
-
-            playlist_info = await loop.run_in_executor(
-                self.bot.executor,
-                lambda: self.bot.ytdl.extract_info(url, download=False, process=False),
-            )
+            playlist_info = await self._extract_info(url, process=False)
 
             if not playlist_info or "entries" not in playlist_info:
                 logger.error("No playlist entries found")
@@ -1,139 +1,219 @@
 import discord
 import asyncio
 import logging
+import threading
+import time
 import aiohttp
-from datetime import datetime
 from models.song import Song
-from utils.helpers import format_duration, build_progress_bar, create_embed
-from config import COLOR
+from models.guild_state import GuildState
+from services.queue_service import QueueService
+from utils.helpers import format_duration, build_progress_bar, create_embed, is_voice_active
+from config import COLOR, NOW_PLAYING_UPDATE_INTERVAL, SEEK_STALE_SECONDS
 
 logger = logging.getLogger(__name__)
 
 
+def _log_play_next_result(future):
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error:
+        logger.error(f"Error in play_next callback: {error}")
+
+
+class _HandoffSource(discord.PCMVolumeTransformer):
+    """Volume transformer that tears down the source it replaced once the player has moved on"""
+
+    def __init__(self, original, volume: float, replaced, loop):
+        super().__init__(original, volume=volume)
+        self._replaced = replaced
+        self._loop = loop
+        self._replaced_lock = threading.Lock()
+
+    def _release_replaced(self):
+        with self._replaced_lock:
+            replaced, self._replaced = self._replaced, None
+        if replaced is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(PlaybackService.discard_source, replaced)
+        except RuntimeError:
+            # Event loop already closed during shutdown
+            replaced.cleanup()
+
+    def read(self):
+        # The player thread reads sources one at a time, so reaching this read means it has
+        # returned from the old source's read() and killing that ffmpeg can no longer end playback
+        self._release_replaced()
+        return super().read()
+
+    def cleanup(self):
+        self._release_replaced()
+        super().cleanup()
+
+
 class PlaybackService:
     def __init__(self, bot):
         self.bot = bot
+        self.queue_service = QueueService(bot)
+        self._prefetch_tasks = set()
 
     def handle_pause(self, guild_id: int):
         guild_data = self.bot.get_guild_data(guild_id)
-        if guild_data["voice_client"] and guild_data["voice_client"].is_playing():
+        if guild_data.voice_client and guild_data.voice_client.is_playing():
             current_pos = self.get_current_position(guild_id)
-            guild_data["pause_position"] = current_pos
-            guild_data["voice_client"].pause()
+            guild_data.pause_position = current_pos
+            guild_data.voice_client.pause()
             return True
         return False
 
     def handle_resume(self, guild_id: int):
         guild_data = self.bot.get_guild_data(guild_id)
-        if guild_data["voice_client"] and guild_data["voice_client"].is_paused():
-            if "pause_position" in guild_data:
-                guild_data["seek_offset"] = guild_data["pause_position"]
-                guild_data["start_time"] = datetime.now()
-                del guild_data["pause_position"]
-            guild_data["voice_client"].resume()
+        if guild_data.voice_client and guild_data.voice_client.is_paused():
+            if guild_data.pause_position is not None:
+                guild_data.seek_offset = guild_data.pause_position
+                guild_data.start_time = time.monotonic()
+                guild_data.pause_position = None
+            guild_data.voice_client.resume()
             return True
         return False
 
+    @staticmethod
+    def _expire_stale_seek(guild_data: GuildState):
+        started = guild_data.seeking_start_time
+        if started and time.monotonic() - started > SEEK_STALE_SECONDS:
+            guild_data.seeking = False
+            guild_data.seeking_start_time = None
+
     def get_current_position(self, guild_id: int) -> int:
         guild_data = self.bot.get_guild_data(guild_id)
 
-        if guild_data.get("seeking", False):
-            return guild_data.get("seek_offset", 0)
+        self._expire_stale_seek(guild_data)
+        if guild_data.seeking:
+            return guild_data.seek_offset
 
-        if not guild_data["start_time"]:
-            return guild_data["seek_offset"]
+        if not guild_data.start_time:
+            return guild_data.seek_offset
 
-        voice_client = guild_data["voice_client"]
+        voice_client = guild_data.voice_client
         if not voice_client:
-            return guild_data["seek_offset"]
+            return guild_data.seek_offset
 
         if voice_client.is_paused():
-            if "pause_position" in guild_data:
-                return guild_data["pause_position"]
-            elapsed = int((datetime.now() - guild_data["start_time"]).total_seconds())
-            return elapsed + guild_data["seek_offset"]
+            if guild_data.pause_position is not None:
+                return guild_data.pause_position
+            elapsed = int(time.monotonic() - guild_data.start_time)
+            return elapsed + guild_data.seek_offset
 
         if voice_client.is_playing():
-            elapsed = int((datetime.now() - guild_data["start_time"]).total_seconds())
-            return elapsed + guild_data["seek_offset"]
+            elapsed = int(time.monotonic() - guild_data.start_time)
+            return elapsed + guild_data.seek_offset
 
-        return guild_data["seek_offset"]
+        return guild_data.seek_offset
 
     def is_paused(self, guild_id: int) -> bool:
         guild_data = self.bot.get_guild_data(guild_id)
-        return guild_data["voice_client"] and guild_data["voice_client"].is_paused()
+        return guild_data.voice_client and guild_data.voice_client.is_paused()
 
-    async def update_timestamps_task(self):
-        current_time = asyncio.get_event_loop().time()
+    def start_timestamp_updates(self, guild_id: int):
+        guild_data = self.bot.get_guild_data(guild_id)
+        task = guild_data.np_task
+        if task and not task.done():
+            return
 
-        for guild_id, guild_data in list(self.bot.guilds_data.items()):
-            try:
-                if self.bot.is_closed():
-                    return
+        guild_data.np_task = asyncio.create_task(self._timestamp_loop(guild_id))
 
-                if guild_data.get("seeking_start_time"):
-                    if current_time - guild_data["seeking_start_time"] > 15:
-                        guild_data["seeking"] = False
-                        del guild_data["seeking_start_time"]
+    def stop_timestamp_updates(self, guild_id: int):
+        guild_data = self.bot.get_guild_data(guild_id)
+        task = guild_data.np_task
+        if task:
+            task.cancel()
+            guild_data.np_task = None
 
-                if not self._should_update_timestamp(guild_id, guild_data, current_time):
+    async def _timestamp_loop(self, guild_id: int):
+        guild_data = self.bot.get_guild_data(guild_id)
+        last_paused = None
+
+        try:
+            while not self.bot.is_closed():
+                await asyncio.sleep(NOW_PLAYING_UPDATE_INTERVAL)
+                current_time = asyncio.get_running_loop().time()
+                self._expire_stale_seek(guild_data)
+
+                voice_client = guild_data.voice_client
+                if (
+                        not guild_data.current
+                        or not voice_client
+                        or not voice_client.is_connected()
+                ):
+                    return
+
+                is_paused = voice_client.is_paused()
+                if not is_paused and not voice_client.is_playing():
                     continue
 
-                asyncio.create_task(self._update_single_timestamp(guild_id, current_time))
+                # A paused position never moves, so one edit showing the pause is enough
+                if is_paused and last_paused:
+                    continue
 
-            except Exception as e:
-                logger.error(f"Timer loop error for guild {guild_id}: {e}")
-                continue
+                if not self._should_update_timestamp(guild_id, guild_data, current_time):
+                    continue
 
-    def _should_update_timestamp(self, guild_id: int, guild_data: dict, current_time: float) -> bool:
-        return (
-                guild_data.get("current")
-                and guild_data.get("now_playing_message")
-                and guild_data.get("voice_client")
-                and guild_data.get("message_ready_for_timestamps", False)
-                and (
-                        guild_data["voice_client"].is_playing()
-                        or guild_data["voice_client"].is_paused()
-                )
-                and not self._is_update_locked(guild_id, current_time)
-        )
+                last_paused = is_paused
+                await self._update_single_timestamp(guild_id, current_time)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Timer loop error for guild {guild_id}: {e}")
+        finally:
+            if guild_data.np_task is asyncio.current_task():
+                guild_data.np_task = None
 
-    def _is_update_locked(self, guild_id: int, current_time: float) -> bool:
-        if guild_id not in self.bot.message_update_locks:
+    def _should_update_timestamp(self, guild_id: int, guild_data: GuildState, current_time: float) -> bool:
+        message = guild_data.now_playing_message
+        if not message or not guild_data.message_ready_for_timestamps:
             return False
 
-        lock_time = self.bot.message_update_locks[guild_id]
-        if current_time - lock_time > 2.0:
-            del self.bot.message_update_locks[guild_id]
-            return False
+        # Peek without creating a lock; a missing entry means no edit is in flight
+        lock = self.bot.message_update_locks.get((guild_id, message.id))
+        return lock is None or not lock.locked()
 
-        return True
+    def _get_update_lock(self, guild_id: int, message: discord.Message) -> asyncio.Lock:
+        key = (guild_id, message.id)
+        lock = self.bot.message_update_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self.bot.message_update_locks[key] = lock
+        return lock
 
     async def _update_single_timestamp(self, guild_id: int, current_time: float):
-        try:
-            self.bot.message_update_locks[guild_id] = current_time
+        guild_data = self.bot.get_guild_data(guild_id)
+        message = guild_data.now_playing_message
+        if not message:
+            return
 
-            guild_data = self.bot.get_guild_data(guild_id)
+        lock = self._get_update_lock(guild_id, message)
+        if lock.locked():
+            return
 
-            if not await self._validate_message_cached(guild_id, current_time):
-                return
+        async with lock:
+            try:
+                if not await self._validate_message_cached(guild_id, current_time):
+                    return
 
-            current_position = self.get_current_position(guild_id)
-            is_paused = self.is_paused(guild_id)
+                current_position = self.get_current_position(guild_id)
+                is_paused = self.is_paused(guild_id)
 
-            embed = self._build_timestamp_embed(guild_data, current_position, is_paused)
+                embed = self._build_timestamp_embed(guild_data, current_position, is_paused)
 
-            await self._safe_message_edit(guild_data["now_playing_message"], embed)
+                await self._safe_message_edit(message, embed)
 
-        except Exception as e:
-            logger.warning(f"Timestamp update failed for guild {guild_id}: {e}")
-        finally:
-            if guild_id in self.bot.message_update_locks:
-                del self.bot.message_update_locks[guild_id]
+            except Exception as e:
+                logger.warning(f"Timestamp update failed for guild {guild_id}: {e}")
 
     async def _validate_message_cached(self, guild_id: int, current_time: float) -> bool:
         guild_data = self.bot.get_guild_data(guild_id)
-        message = guild_data.get("now_playing_message")
+        message = guild_data.now_playing_message
 
         if not message:
             return False
@@ -152,8 +232,8 @@ class PlaybackService:
             }
             return True
         except discord.NotFound:
-            guild_data["now_playing_message"] = None
-            guild_data["message_ready_for_timestamps"] = False
+            guild_data.now_playing_message = None
+            guild_data.message_ready_for_timestamps = False
             self.bot.message_validation_cache[cache_key] = {
                 "valid": False,
                 "time": current_time,
@@ -162,8 +242,8 @@ class PlaybackService:
         except discord.HTTPException:
             return False
 
-    def _build_timestamp_embed(self, guild_data: dict, current_position: int, is_paused: bool) -> discord.Embed:
-        current = guild_data["current"]
+    def _build_timestamp_embed(self, guild_data: GuildState, current_position: int, is_paused: bool) -> discord.Embed:
+        current = guild_data.current
 
         progress = build_progress_bar(current_position, current.duration)
 
@@ -180,11 +260,11 @@ class PlaybackService:
                 f"**{current.title}**\n"
                 f"*by {current.uploader}*\n\n"
                 f"`{format_duration(current_position)} {progress} {format_duration(current.duration)}`\n\n"
-                f"🔊 Volume: {guild_data['volume']}%\n"
-                f"🔁 Loop: {guild_data['loop_mode'].title()}\n"
-                f"🔀 Shuffle: {'On' if guild_data['shuffle'] else 'Off'}\n"
+                f"🔊 Volume: {guild_data.volume}%\n"
+                f"🔁 Loop: {guild_data.loop_mode.title()}\n"
+                f"🔀 Shuffle: {'On' if guild_data.shuffle else 'Off'}\n"
                 f"👤 Requested by: {current.requested_by}\n"
-                f"📋 Queue length: {len(guild_data['queue'])}"
+                f"📋 Queue length: {len(guild_data.queue)}"
             ),
             color=COLOR,
         )
@@ -213,12 +293,12 @@ class PlaybackService:
     async def check_voice_connection(self, guild_id: int, voice_channel) -> bool:
         """Check and repair voice connection if needed"""
         guild_data = self.bot.get_guild_data(guild_id)
-        voice_client = guild_data["voice_client"]
+        voice_client = guild_data.voice_client
 
         if not voice_client or not voice_client.is_connected():
             logger.warning(f"Voice client disconnected for guild {guild_id}, attempting reconnect...")
             try:
-                current_song = guild_data.get("current")
+                current_song = guild_data.current
                 current_position = self.get_current_position(guild_id) if current_song else 0
                 was_paused = voice_client.is_paused() if voice_client else False
 
@@ -228,11 +308,11 @@ class PlaybackService:
                     except:
                         pass
 
-                guild_data["voice_client"] = await voice_channel.connect(timeout=10.0, reconnect=True)
+                guild_data.voice_client = await voice_channel.connect(timeout=10.0, reconnect=True)
                 logger.info(f"Successfully reconnected to voice in guild {guild_id}")
 
                 if current_song:
-                    guild_data["seek_offset"] = current_position
+                    guild_data.seek_offset = current_position
                     await self._resume_after_reconnect(guild_id, current_song, was_paused)
 
                 return True
@@ -251,84 +331,83 @@ class PlaybackService:
         try:
             guild_data = self.bot.get_guild_data(guild_id)
 
-            fresh_data = await self.bot.get_song_info(song.webpage_url)
+            fresh_data = await self.bot.refresh_song_info(song.webpage_url)
             if not fresh_data or not fresh_data.get("url"):
                 logger.error(f"Could not get stream URL after reconnect for {song.title}")
                 return
 
             song.url = fresh_data["url"]
 
-            source = discord.PCMVolumeTransformer(
-                discord.FFmpegPCMAudio(song.url, **self.bot.ffmpeg_options),
-                volume=guild_data["volume"] / 100,
-            )
+            source = await self.bot.create_audio_source(song.url, guild_data.volume / 100)
 
             def after_playing(error):
                 if error:
                     logger.error(f"Player error after reconnect: {error}")
 
-                if not guild_data.get("seeking", False):
-                    from services.queue_service import QueueService
-                    queue_service = QueueService(self.bot)
-                    if guild_data["current"] and not guild_data.get("seeking", False):
-                        queue_service.add_to_history(guild_id, guild_data["current"])
+                if not guild_data.seeking:
+                    if guild_data.current:
+                        self.queue_service.add_to_history(guild_id, guild_data.current)
 
-                    coro = self.play_next(guild_id)
-                    fut = asyncio.run_coroutine_threadsafe(coro, self.bot.loop)
-                    fut.add_done_callback(lambda f: f.exception())
+                    self.schedule_play_next(guild_id)
 
-            guild_data["start_time"] = datetime.now()
-            guild_data["voice_client"].play(source, after=after_playing)
+            guild_data.start_time = time.monotonic()
+            guild_data.voice_client.play(source, after=after_playing)
 
             if was_paused:
-                guild_data["voice_client"].pause()
+                guild_data.voice_client.pause()
 
             logger.info(f"Resumed playback after reconnect: {song.title}")
 
         except Exception as e:
             logger.error(f"Error resuming playback after reconnect: {e}")
 
-    async def play_next(self, guild_id: int):
-        from services.queue_service import QueueService
-        queue_service = QueueService(self.bot)
+    def schedule_play_next(self, guild_id: int):
+        """Run play_next on the bot loop; safe to call from a voice player's after callback"""
+        fut = asyncio.run_coroutine_threadsafe(self.play_next(guild_id), self.bot.loop)
+        fut.add_done_callback(_log_play_next_result)
+
+    def spawn_play_next(self, guild_id: int):
+        """Run play_next as a tracked background task from code already on the bot loop"""
+        task = self.bot.create_background_task(self.play_next(guild_id))
+        task.add_done_callback(_log_play_next_result)
 
+    async def play_next(self, guild_id: int, notify: bool = True):
         guild_data = self.bot.get_guild_data(guild_id)
 
-        async with guild_data["play_lock"]:
-            if guild_data.get("seeking", False):
+        async with guild_data.play_lock:
+            if guild_data.seeking:
                 return
 
-            if guild_data["current"] and guild_data["voice_client"]:
-                if (
-                        guild_data["voice_client"].is_playing()
-                        or guild_data["voice_client"].is_paused()
-                ):
+            if guild_data.current and guild_data.voice_client:
+                if is_voice_active(guild_data.voice_client):
                     return
 
             if (
-                    not guild_data["voice_client"]
-                    or not guild_data["voice_client"].is_connected()
+                    not guild_data.voice_client
+                    or not guild_data.voice_client.is_connected()
             ):
                 logger.info(
                     f"Voice client disconnected for guild {guild_id}, stopping playback"
                 )
-                guild_data["current"] = None
-                guild_data["position"] = 0
-                guild_data["start_time"] = None
-                guild_data["last_activity"] = datetime.now()
+                guild_data.current = None
+                guild_data.position = 0
+                guild_data.start_time = None
+                guild_data.last_activity = time.monotonic()
                 return
 
             max_skip_attempts = 10
             skip_count = 0
 
             while skip_count < max_skip_attempts:
-                next_song = await queue_service.get_next_song(guild_id)
+                next_song = await self.queue_service.get_next_song(guild_id)
 
                 if not next_song:
                     await self._handle_empty_queue(guild_id)
                     return
 
-                stream_success = await self._extract_and_play_song(guild_id, next_song, skip_count)
+                stream_success = await self._extract_and_play_song(
+                    guild_id, next_song, skip_count, notify=notify
+                )
 
                 if stream_success:
                     break
@@ -338,7 +417,12 @@ class PlaybackService:
             if skip_count >= max_skip_attempts:
                 await self._handle_max_retries_exceeded(guild_id)
 
-    async def _extract_and_play_song(self, guild_id: int, song: Song, skip_count: int) -> bool:
+    async def restart_song(self, guild_id: int, song: Song, notify: bool = True) -> bool:
+        """Play song again from the start; the caller must already hold play_lock"""
+        return await self._extract_and_play_song(guild_id, song, 0, notify=notify)
+
+    async def _extract_and_play_song(self, guild_id: int, song: Song, skip_count: int,
+                                     notify: bool = True) -> bool:
         guild_data = self.bot.get_guild_data(guild_id)
         max_retries = 3
 
@@ -346,7 +430,11 @@ class PlaybackService:
             try:
                 logger.info(f"Extracting fresh stream URL for: {song.title} (attempt {attempt + 1})")
 
-                fresh_data = await self.bot.get_song_info(song.webpage_url)
+                # The first attempt can reuse a prefetched result; retries always re-extract
+                if attempt == 0:
+                    fresh_data = await self.bot.get_song_info_cached(song.webpage_url)
+                else:
+                    fresh_data = await self.bot.refresh_song_info(song.webpage_url)
 
                 if not fresh_data or not fresh_data.get("url"):
                     raise Exception(f"No stream URL available for {song.title}")
@@ -369,7 +457,7 @@ class PlaybackService:
                 if fresh_data.get("uploader"):
                     song.uploader = fresh_data["uploader"]
 
-                return await self._start_playback(guild_id, song)
+                return await self._start_playback(guild_id, song, notify=notify)
 
             except Exception as e:
                 logger.error(f"Error extracting stream URL (attempt {attempt + 1}): {e}")
@@ -380,17 +468,62 @@ class PlaybackService:
         await self._handle_song_skip(guild_id, song)
         return False
 
-    async def _start_playback(self, guild_id: int, song: Song) -> bool:
-        from services.queue_service import QueueService
-        queue_service = QueueService(self.bot)
-
+    def prefetch_adjacent(self, guild_id: int):
         guild_data = self.bot.get_guild_data(guild_id)
 
+        songs = []
+        if guild_data.queue:
+            songs.append(guild_data.queue[0])
+        if 0 < guild_data.history_position <= len(guild_data.history):
+            songs.append(guild_data.history[guild_data.history_position - 1])
+
+        for song in songs:
+            if not song.webpage_url:
+                continue
+            task = asyncio.create_task(self.bot.get_song_info_cached(song.webpage_url))
+            self._prefetch_tasks.add(task)
+            task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def open_warm_source(self, url: str, volume: float, ffmpeg_options=None, timeout: float = 10):
+        """Create an audio source and wait until ffmpeg has produced its first frame"""
+        source = await self.bot.create_audio_source(url, volume, ffmpeg_options)
+        loop = asyncio.get_running_loop()
         try:
-            source = discord.PCMVolumeTransformer(
-                discord.FFmpegPCMAudio(song.url, **self.bot.ffmpeg_options),
-                volume=guild_data["volume"] / 100,
+            frame = await asyncio.wait_for(
+                loop.run_in_executor(None, source.original.read), timeout
             )
+        except BaseException:
+            self.discard_source(source)
+            raise
+
+        if not frame:
+            self.discard_source(source)
+            raise RuntimeError("ffmpeg produced no audio")
+        return source
+
+    @staticmethod
+    def discard_source(source):
+        # cleanup() kills ffmpeg and may wait for it to exit, so keep it off the event loop
+        asyncio.get_running_loop().run_in_executor(None, source.cleanup)
+
+    def swap_source(self, guild_id: int, source) -> bool:
+        """Replace the playing source in place, without firing the after callback"""
+        voice_client = self.bot.get_guild_data(guild_id).voice_client
+        if not is_voice_active(voice_client):
+            return False
+
+        # The player thread may still be blocked in the old source's read(); the old ffmpeg is
+        # only torn down from the new source's first read, or its cleanup if it never plays
+        voice_client.source = _HandoffSource(
+            source.original, source.volume, voice_client.source, asyncio.get_running_loop()
+        )
+        return True
+
+    async def _start_playback(self, guild_id: int, song: Song, notify: bool = True) -> bool:
+        guild_data = self.bot.get_guild_data(guild_id)
+
+        try:
+            source = await self.bot.create_audio_source(song.url, guild_data.volume / 100)
 
             def after_playing(error):
                 try:
@@ -400,39 +533,29 @@ class PlaybackService:
                         if "Connection" in str(error) or "1006" in str(error):
                             logger.warning(f"Connection error detected in guild {guild_id}")
                     else:
-                        if guild_data["current"] and not guild_data.get("seeking", False):
-                            queue_service.add_to_history(guild_id, guild_data["current"])
-
-                    if not guild_data.get("seeking", False):
-                        coro = self.play_next(guild_id)
-                        fut = asyncio.run_coroutine_threadsafe(coro, self.bot.loop)
-
-                        def handle_future_result(future):
-                            try:
-                                future.result()
-                            except Exception as e:
-                                logger.error(f"Error in play_next callback: {e}")
+                        if guild_data.current and not guild_data.seeking:
+                            self.queue_service.add_to_history(guild_id, guild_data.current)
 
-                        fut.add_done_callback(handle_future_result)
+                    if not guild_data.seeking:
+                        self.schedule_play_next(guild_id)
 
                 except Exception as e:
                     logger.error(f"Error in after_playing callback: {e}")
 
-            guild_data["current"] = song
-            guild_data["seek_offset"] = 0
-            guild_data["position"] = 0
-            guild_data["start_time"] = datetime.now()
-            guild_data["last_activity"] = datetime.now()
+            guild_data.current = song
+            guild_data.seek_offset = 0
+            guild_data.position = 0
+            guild_data.start_time = time.monotonic()
+            guild_data.last_activity = time.monotonic()
 
-            guild_data["voice_client"].play(source, after=after_playing)
+            guild_data.voice_client.play(source, after=after_playing)
 
-            await asyncio.sleep(0.2)
-
-            music_cog = self.bot.get_cog("MusicCommands")
+            music_cog = self.bot.get_cog("MusicCommands") if notify else None
             if music_cog:
                 await music_cog.update_now_playing(guild_id)
 
-            await self.bot.save_guild_queue(guild_id)
+            self.bot.schedule_save_guild_queue(guild_id)
+            self.prefetch_adjacent(guild_id)
 
             logger.info(f"Now playing: {song.title} in guild {guild_id}")
 
@@ -444,32 +567,31 @@ class PlaybackService:
             return False
 
     async def _handle_empty_queue(self, guild_id: int):
+        self.stop_timestamp_updates(guild_id)
+
         guild_data = self.bot.get_guild_data(guild_id)
-        guild_data["current"] = None
-        guild_data["position"] = 0
-        guild_data["start_time"] = None
-        guild_data["last_activity"] = datetime.now()
+        guild_data.current = None
+        guild_data.position = 0
+        guild_data.start_time = None
+        guild_data.last_activity = time.monotonic()
 
-        if guild_data.get("now_playing_message"):
+        if guild_data.now_playing_message:
             try:
-                await guild_data["now_playing_message"].edit(
+                await guild_data.now_playing_message.edit(
                     embed=create_embed("Queue Empty", "Add songs with `/play`", COLOR, self.bot.user)
                 )
-                await guild_data["now_playing_message"].clear_reactions()
+                await guild_data.now_playing_message.clear_reactions()
             except:
                 pass
-            guild_data["now_playing_message"] = None
+            guild_data.now_playing_message = None
 
-        await self.bot.save_guild_queue(guild_id)
+        self.bot.schedule_save_guild_queue(guild_id)
 
     async def _handle_song_skip(self, guild_id: int, song: Song):
-        from services.queue_service import QueueService
-        queue_service = QueueService(self.bot)
-
         guild_data = self.bot.get_guild_data(guild_id)
 
-        if guild_data["loop_mode"] != "song":
-            queue_service.add_to_history(guild_id, song)
+        if guild_data.loop_mode != "song":
+            self.queue_service.add_to_history(guild_id, song)
 
         try:
             music_cog = self.bot.get_cog("MusicCommands")
@@ -486,16 +608,16 @@ class PlaybackService:
         except:
             pass
 
-        if guild_data["loop_mode"] == "song":
-            guild_data["loop_mode"] = "off"
+        if guild_data.loop_mode == "song":
+            guild_data.loop_mode = "off"
             logger.info(f"Disabled song loop mode due to stream failure for {song.title}")
 
     async def _handle_max_retries_exceeded(self, guild_id: int):
         guild_data = self.bot.get_guild_data(guild_id)
         logger.error(f"Exhausted retry attempts for guild {guild_id}, stopping playback")
-        guild_data["current"] = None
-        guild_data["start_time"] = None
-        await self.bot.save_guild_queue(guild_id)
+        guild_data.current = None
+        guild_data.start_time = None
+        self.bot.schedule_save_guild_queue(guild_id)
 
         try:
             music_cog = self.bot.get_cog("MusicCommands")
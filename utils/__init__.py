@@ -1,11 +1,12 @@
 from .helpers import (format_duration, build_progress_bar,
-                      get_existing_urls, parse_time_to_seconds, interaction_check, create_embed)
+                      is_url_in_guild, is_voice_active, parse_time_to_seconds, interaction_check, create_embed)
 
 __all__ = [
     'interaction_check',
     'format_duration',
     'build_progress_bar',
-    'get_existing_urls',
+    'is_url_in_guild',
+    'is_voice_active',
     'parse_time_to_seconds',
     'create_embed'
 ]
@@ -1,36 +1,52 @@
-def is_banned(user_id):
+BANNED_USERS_FILE = 'banned_users.txt'
+
+_banned = None
+
+
+def _load_banned():
+    global _banned
+    banned = set()
     try:
-        with open('banned_users.txt', 'r') as f:
-            banned = [int(line.strip()) for line in f.readlines() if line.strip()]
-        return user_id in banned
+        with open(BANNED_USERS_FILE, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line.isdigit():
+                    banned.add(int(line))
     except FileNotFoundError:
-        return False
-    except ValueError:
-        return False
+        pass
+    _banned = banned
+    return banned
+
+
+def _get_banned():
+    return _banned if _banned is not None else _load_banned()
+
+
+def is_banned(user_id):
+    return user_id in _get_banned()
 
 
 def ban_user_id(user_id):
-    if is_banned(user_id):
+    banned = _get_banned()
+    if user_id in banned:
         return False
 
-    with open('banned_users.txt', 'a') as f:
+    with open(BANNED_USERS_FILE, 'a') as f:
         f.write(f"{user_id}\n")
+    banned.add(user_id)
     return True
 
 
 def unban_user_id(user_id):
-    try:
-        with open('banned_users.txt', 'r') as f:
-            lines = f.readlines()
-    except FileNotFoundError:
+    banned = _get_banned()
+    if user_id not in banned:
         return False
 
-    found = False
-    with open('banned_users.txt', 'w') as f:
-        for line in lines:
-            if line.strip() != str(user_id):
-                f.write(line)
-            else:
-                found = True
+    banned.discard(user_id)
+    with open(BANNED_USERS_FILE, 'w') as f:
+        f.writelines(f"{uid}\n" for uid in banned)
+    return True
+
 
-    return found
+def get_banned_ids():
+    return sorted(_get_banned())
@@ -1,6 +1,6 @@
 import discord
 
-from datetime import datetime
+from functools import lru_cache
 
 from config import COLOR
 from .ban_system import is_banned
@@ -19,6 +19,7 @@ async def interaction_check(self, interaction: discord.Interaction) -> bool:
     return True
 
 
+@lru_cache(maxsize=8192)
 def format_duration(seconds: int) -> str:
     if seconds <= 0:
         return "0:00"
@@ -31,17 +32,30 @@ def format_duration(seconds: int) -> str:
 
 def build_progress_bar(current: int, total: int, length: int = 20) -> str:
     if total <= 0:
+        return _render_progress_bar(-1, length)
+    return _render_progress_bar(min(length - 1, int((current / total) * length)), length)
+
+
+@lru_cache(maxsize=256)
+def _render_progress_bar(pos: int, length: int) -> str:
+    if pos < 0:
         return "▬" * length
-    pos = min(length - 1, int((current / total) * length))
     return "▬" * pos + "🔘" + "▬" * (length - pos - 1)
 
 
-def get_existing_urls(guild_data) -> set:
-    urls = {song.webpage_url for song in guild_data["queue"]}
-    urls.update(song.webpage_url for song in guild_data["loop_backup"])
-    if guild_data.get("current"):
-        urls.add(guild_data["current"].webpage_url)
-    return urls
+def is_voice_active(voice_client) -> bool:
+    return voice_client is not None and (
+        voice_client.is_playing() or voice_client.is_paused()
+    )
+
+
+def is_url_in_guild(guild_data, url: str) -> bool:
+    current = guild_data.current
+    return (
+        guild_data.queue.has_url(url)
+        or guild_data.loop_backup.has_url(url)
+        or (current is not None and current.webpage_url == url)
+    )
 
 
 def parse_time_to_seconds(time_str: str) -> int:
@@ -95,6 +109,6 @@ def create_embed(title: str, description: str = "", color: int = COLOR, bot_user
         text="Music Bot",
         icon_url=bot_user.avatar.url if bot_user and bot_user.avatar else None,
     )
-    embed.timestamp = datetime.now()
+    embed.timestamp = discord.utils.utcnow()
     return embed
 
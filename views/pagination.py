@@ -1,5 +1,5 @@
 import discord
-from typing import List
+from typing import Callable, Dict, List
 
 
 class PaginationView(discord.ui.View):
@@ -9,13 +9,20 @@ class PaginationView(discord.ui.View):
         self.user = user
         self.current_page = 0
 
-        if len(pages) <= 1:
+        if self.page_count <= 1:
             self.previous_button.disabled = True
             self.next_button.disabled = True
         else:
             self.previous_button.disabled = True
             self.next_button.disabled = False
 
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    def get_page(self, index: int) -> discord.Embed:
+        return self.pages[index]
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user != self.user:
             await interaction.response.send_message(
@@ -38,7 +45,7 @@ class PaginationView(discord.ui.View):
             self.next_button.disabled = False
 
             await interaction.response.edit_message(
-                embed=self.pages[self.current_page],
+                embed=self.get_page(self.current_page),
                 view=self
             )
         else:
@@ -46,15 +53,35 @@ class PaginationView(discord.ui.View):
 
     @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.primary)
     async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.current_page < len(self.pages) - 1:
+        if self.current_page < self.page_count - 1:
             self.current_page += 1
 
-            self.next_button.disabled = self.current_page == len(self.pages) - 1
+            self.next_button.disabled = self.current_page == self.page_count - 1
             self.previous_button.disabled = False
 
             await interaction.response.edit_message(
-                embed=self.pages[self.current_page],
+                embed=self.get_page(self.current_page),
                 view=self
             )
         else:
             await interaction.response.defer()
+
+
+class LazyPaginationView(PaginationView):
+    def __init__(self, build_page: Callable[[int], discord.Embed], page_count: int,
+                 user: discord.User, timeout: int = 240):
+        self._build_page = build_page
+        self._page_count = page_count
+        self._rendered: Dict[int, discord.Embed] = {}
+        super().__init__([], user, timeout=timeout)
+
+    @property
+    def page_count(self) -> int:
+        return self._page_count
+
+    def get_page(self, index: int) -> discord.Embed:
+        embed = self._rendered.get(index)
+        if embed is None:
+            embed = self._build_page(index)
+            self._rendered[index] = embed
+        return embed